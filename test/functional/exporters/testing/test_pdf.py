@@ -1,15 +1,21 @@
 import os
 
+import pytest
+
 from testplan.testing.multitest import MultiTest, testsuite, testcase
 
 from testplan.testing.multitest.entries import base
 from testplan.testing.multitest.entries.schemas.base import registry
 
 from testplan import Testplan
+from testplan.common.utils.latency import LatencyHistogram
+from testplan.common.utils.match import LogMatcher
 from testplan.common.utils.testing import (
     log_propagation_disabled, argv_overridden
 )
-from testplan.exporters.testing.pdf import PDFExporter, TagFilteredPDFExporter
+from testplan.exporters.testing.pdf import (
+    PDFExporter, TagFilteredPDFExporter, flatten_section
+)
 from testplan.logger import TESTPLAN_LOGGER
 from testplan.report.testing import TestReport, TestCaseReport, TestGroupReport
 from testplan.report.testing import styles
@@ -20,12 +26,21 @@ def test_create_pdf(tmpdir):
     """PDF exporter should generate a PDF file using the report data."""
     pdf_path = tmpdir.mkdir('reports').join('dummy_report.pdf').strpath
 
+    histogram = LatencyHistogram()
+    histogram.record(150)
+    log_path = tmpdir.join('app.log')
+    log_path.write('app ready\n')
+    log_matcher = LogMatcher(log_path.strpath)
+
     assertion_entries = [
         assertions.Equal(1, 2),
         assertions.Greater(2, 1),
         assertions.IsFalse(True, 'this should fail'),
         assertions.IsTrue(True, 'this should pass'),
         assertions.Fail('Explicit failure'),
+        assertions.LatencyPercentileLess(histogram, 99, 100),
+        assertions.LogfileMatch(log_matcher, r'.*ready', timeout=0),
+        assertions.LogfileNotMatch(log_matcher, r'.*error', timeout=0),
         base.Group(
             description='group description',
             entries=[
@@ -74,6 +89,92 @@ def test_create_pdf(tmpdir):
     assert os.stat(pdf_path).st_size > 0
 
 
+def make_sectioned_report():
+    """Report with one passing and one failing MultiTest."""
+    def make_multitest(name, assertion_entries):
+        return TestGroupReport(
+            name=name,
+            category='multitest',
+            entries=[
+                TestGroupReport(
+                    name='MySuite',
+                    entries=[
+                        TestCaseReport(
+                            name='my_test_method',
+                            entries=[
+                                registry.serialize(obj)
+                                for obj in assertion_entries
+                            ]
+                        )
+                    ]
+                )
+            ]
+        )
+
+    return TestReport(
+        name='my testplan',
+        entries=[
+            make_multitest(
+                'Passing Multitest',
+                [assertions.Equal(1, 1), assertions.Greater(2, 1)]),
+            make_multitest(
+                'Failing Multitest',
+                [assertions.Equal(1, 2), assertions.IsTrue(True)]),
+        ]
+    )
+
+
+@pytest.mark.parametrize('pdf_processes', (1, 2))
+@pytest.mark.parametrize('pdf_failures_only', (False, True))
+def test_create_pdf_sections(tmpdir, pdf_processes, pdf_failures_only):
+    """PDF sections can be rendered in worker processes."""
+    pdf_path = tmpdir.mkdir('reports').join('dummy_report.pdf').strpath
+
+    exporter = PDFExporter(
+        pdf_path=pdf_path,
+        pdf_processes=pdf_processes,
+        pdf_failures_only=pdf_failures_only,
+        pdf_style=styles.Style(
+            passing='assertion-detail',
+            failing='assertion-detail'
+        )
+    )
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        exporter.export(make_sectioned_report())
+
+    assert os.path.exists(pdf_path)
+    assert os.stat(pdf_path).st_size > 0
+
+
+def test_flatten_section():
+    """Subtrees that cannot be displayed should not be visited."""
+    passing, failing = make_sectioned_report()
+    detailed = styles.Style(
+        passing='assertion-detail', failing='assertion-detail')
+
+    assert flatten_section(passing, detailed) == passing.flatten(depths=True)
+    assert flatten_section(failing, detailed) == failing.flatten(depths=True)
+
+    # Only the testcase level is displayed for passing tests
+    summary = styles.Style(passing='case', failing='assertion-detail')
+    assert flatten_section(passing, summary) == passing.flatten(
+        depths=True)[:3]
+    assert flatten_section(failing, summary) == failing.flatten(depths=True)
+
+    # Passing MultiTest is not displayed at all
+    summary = styles.Style(passing='result', failing='assertion-detail')
+    assert flatten_section(passing, summary) == [(0, passing)]
+
+    # Assertions of passing testcases are skipped in failures only mode
+    assert flatten_section(
+        passing, detailed, failures_only=True) == passing.flatten(
+            depths=True)[:3]
+    assert flatten_section(
+        failing, detailed, failures_only=True) == failing.flatten(
+            depths=True)
+
+
 def test_tag_filtered_pdf(tmpdir):
     """
         Tag filtered PDF exporter should generate
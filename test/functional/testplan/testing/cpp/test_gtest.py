@@ -1,4 +1,6 @@
 import os
+import sys
+import stat
 import platform
 
 import pytest
@@ -6,6 +8,9 @@ import pytest
 from testplan import Testplan
 from testplan.common.utils.testing import log_propagation_disabled, check_report
 from testplan.logger import TESTPLAN_LOGGER
+from testplan.report.testing import Status
+from testplan.runners.pools import ProcessPool
+from testplan.runners.pools.tasks import Task
 from testplan.testing.cpp import GTest
 
 from test.functional.testplan.testing.fixtures.cpp import gtest
@@ -62,3 +67,170 @@ def test_gtest(binary_dir, expected_report):
         assert plan.run().run is True
 
     check_report(expected=expected_report, actual=plan.report)
+
+
+# Emulates a Google Test binary that honors the native sharding variables,
+# assigning its tests to the shards in a round robin fashion, and streams
+# its results. It hangs on the test named by `HANG_ON` and truncates its
+# XML report before the text given by `TRUNCATE`.
+FAKE_BINARY = '''#!{python}
+import os
+import sys
+import time
+import socket
+
+TESTS = [
+    ('SuiteA', 'test_one'), ('SuiteA', 'test_two'), ('SuiteA', 'test_three'),
+    ('SuiteB', 'test_one'), ('SuiteB', 'test_two'),
+]
+total = int(os.environ.get('GTEST_TOTAL_SHARDS', 1))
+index = int(os.environ.get('GTEST_SHARD_INDEX', 0))
+args = dict(arg.split('=', 1) for arg in sys.argv[1:] if '=' in arg)
+
+stream = None
+if '--gtest_stream_result_to' in args:
+    host, port = args['--gtest_stream_result_to'].rsplit(':', 1)
+    stream = socket.create_connection((host, int(port)))
+
+def send(line):
+    if stream is not None:
+        stream.sendall((line + '\\n').encode('utf-8'))
+
+send('gtest_streaming_protocol_version=1.0')
+suites = {{}}
+for idx, (suite, testcase) in enumerate(TESTS):
+    if idx % total == index:
+        suites.setdefault(suite, []).append(testcase)
+
+xml = ['<testsuites>']
+for suite in sorted(suites):
+    send('event=TestCaseStart&name={{}}'.format(suite))
+    xml.append('<testsuite name="{{}}">'.format(suite))
+    for testcase in suites[suite]:
+        send('event=TestStart&name={{}}'.format(testcase))
+        if os.environ.get('HANG_ON') == '{{}}.{{}}'.format(suite, testcase):
+            time.sleep(60)
+        send('event=TestEnd&passed=1&elapsed_time=0ms')
+        xml.append('<testcase name="{{}}" status="run"/>'.format(testcase))
+    send('event=TestCaseEnd&passed=1&elapsed_time=0ms')
+    xml.append('</testsuite>')
+xml.append('</testsuites>')
+
+xml = ''.join(xml)
+if os.environ.get('TRUNCATE'):
+    xml = xml[:xml.index(os.environ['TRUNCATE'])]
+with open(args['--gtest_output'].split(':', 1)[1], 'w') as report:
+    report.write(xml)
+'''
+
+
+@pytest.fixture
+def fake_binary(tmpdir):
+    binary_path = str(tmpdir.join('runTests'))
+    with open(binary_path, 'w') as binary:
+        binary.write(FAKE_BINARY.format(python=sys.executable))
+    os.chmod(binary_path, os.stat(binary_path).st_mode | stat.S_IEXEC)
+    return binary_path
+
+
+def check_sharded_report(report):
+    assert report.name == 'MyGTest'
+    assert report.category == 'GTest'
+    assert [suite.name for suite in report] == ['SuiteA', 'SuiteB']
+    assert sorted(testcase.name for testcase in report.entries[0]) == [
+        'test_one', 'test_three', 'test_two']
+    assert sorted(testcase.name for testcase in report.entries[1]) == [
+        'test_one', 'test_two']
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_shards(fake_binary):
+    plan = Testplan(
+        name='plan',
+        parse_cmdline=False,
+    )
+    uid = plan.add(GTest(name='MyGTest', driver=fake_binary, num_shards=3))
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    assert len(plan.report) == 1
+    check_sharded_report(plan.report.entries[0])
+    assert plan.result.test_results[uid].report is plan.report.entries[0]
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_shards_in_pool(fake_binary):
+    plan = Testplan(
+        name='plan',
+        parse_cmdline=False,
+    )
+    plan.add_resource(ProcessPool(name='MyPool', size=3))
+    uid = plan.schedule(
+        Task(target='testplan.testing.cpp.GTest', kwargs=dict(
+            name='MyGTest', driver=fake_binary, num_shards=3)),
+        resource='MyPool')
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    assert len(plan.report) == 1
+    check_sharded_report(plan.report.entries[0])
+    assert plan.result.test_results[uid].report is plan.report.entries[0]
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_stream_results_on_timeout(fake_binary):
+    plan = Testplan(
+        name='plan',
+        parse_cmdline=False,
+    )
+    plan.add(GTest(name='MyGTest', driver=fake_binary, stream_results=True,
+                   timeout=1, proc_env={'HANG_ON': 'SuiteB.test_one'}))
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        plan.run()
+
+    report = plan.report.entries[0]
+    assert report.status == Status.ERROR
+    assert [suite.name for suite in report] == ['SuiteA', 'SuiteB']
+    assert [(testcase.name, testcase.status)
+            for testcase in report.entries[0]] == [
+        ('test_one', Status.PASSED),
+        ('test_two', Status.PASSED),
+        ('test_three', Status.PASSED),
+    ]
+    assert [(testcase.name, testcase.status)
+            for testcase in report.entries[1]] == [
+        ('test_one', Status.INCOMPLETE)]
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_truncated_report(fake_binary):
+    plan = Testplan(
+        name='plan',
+        parse_cmdline=False,
+    )
+    plan.add(GTest(name='MyGTest', driver=fake_binary,
+                   proc_env={'TRUNCATE': 'SuiteB'}))
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        plan.run()
+
+    report = plan.report.entries[0]
+    assert report.status == Status.ERROR
+    assert [suite.name for suite in report] == ['SuiteA']
+    assert [testcase.name for testcase in report.entries[0]] == [
+        'test_one', 'test_two', 'test_three']
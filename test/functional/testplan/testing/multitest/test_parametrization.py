@@ -1,9 +1,12 @@
+import itertools
 import logging
 
 import pytest
 from schema import SchemaError
 
+from testplan.testing.filtering import Tags, Pattern
 from testplan.testing.multitest import MultiTest, testsuite, testcase
+from testplan.testing.multitest.suite import post_testcase
 from testplan.testing.multitest.base import Categories
 from testplan.testing.multitest.parametrization import (
     ParametrizationError, MAX_METHOD_NAME_LENGTH
@@ -557,3 +560,227 @@ def test_same_name_func():
 
     with pytest.raises(SchemaError):
         MultiTest(name='abc', suites=[MySuite()])
+
+
+def test_lazy_parametrization():
+    """Lazy parametrization should generate the same testcases."""
+
+    @testsuite
+    class MySuite(object):
+
+        @testcase(
+            parameters=(
+                (1, 2, 3),
+                -1,
+                (5, -5),
+                {'a': 3, 'expected': 4}
+            ),
+            lazy=True
+        )
+        def test_add(self, env, result, a, b=1, expected=0):
+            """Simple docstring"""
+            result.equal(a + b, expected)
+
+    assert not hasattr(MySuite, 'test_add__a_1__b_2__expected_3')
+    assert list(MySuite.get_testcase_methods()) == [
+        'test_add__a_1__b_2__expected_3',
+        'test_add__0',
+        'test_add__1',
+        'test_add__a_3__b_1__expected_4',
+    ]
+
+    parametrization_group = TestGroupReport(
+        name='test_add',
+        description="Simple docstring",
+        category=Categories.PARAMETRIZATION,
+        entries=[
+            TestCaseReport(
+                name='test_add__a_1__b_2__expected_3',
+                entries=[{'type': 'Equal', 'first': 3, 'second': 3}]
+            ),
+            TestCaseReport(
+                name='test_add__0',
+                entries=[{'type': 'Equal', 'first': 0, 'second': 0}]
+            ),
+            TestCaseReport(
+                name='test_add__1',
+                entries=[{'type': 'Equal', 'first': 0, 'second': 0}]
+            ),
+            TestCaseReport(
+                name='test_add__a_3__b_1__expected_4',
+                entries=[{'type': 'Equal', 'first': 4, 'second': 4}]
+            ),
+        ]
+    )
+
+    check_parametrization(MySuite, parametrization_group)
+
+
+def test_lazy_parametrization_large_product():
+    """Testcases of a lazy parametrization are generated on demand."""
+
+    @testsuite
+    class MySuite(object):
+
+        @testcase(
+            parameters={arg: range(100) for arg in 'abcdef'},
+            lazy=True
+        )
+        def test_sample(self, env, result, a, b, c, d, e, f):
+            pass
+
+    lazy_parametrization = MySuite.test_sample.lazy_parametrization
+    assert MySuite.__testcases__ == [lazy_parametrization]
+    assert len(lazy_parametrization) == 100 ** 6
+    assert not hasattr(MySuite, 'test_sample__a_0__b_0__c_0__d_0__e_0__f_0')
+
+    testcases = lazy_parametrization.iter_testcases()
+    assert [next(testcases).__name__ for _ in range(2)] == [
+        'test_sample__a_0__b_0__c_0__d_0__e_0__f_0',
+        'test_sample__a_0__b_0__c_0__d_0__e_0__f_1',
+    ]
+    assert list(lazy_parametrization.get_kwargs(123456789).values()) == \
+        [0, 1, 23, 45, 67, 89]
+
+
+def test_lazy_parametrization_run_filtered():
+    """Only the testcases that run should have methods created."""
+    created = []
+
+    def record(func):
+        created.append(func.__name__)
+        return func
+
+    executed = []
+
+    def post(name, self, env, result, **kwargs):
+        executed.append(name)
+
+    @post_testcase(post)
+    @testsuite(tags='foo')
+    class MySuite(object):
+
+        @testcase(
+            parameters={'a': [1, 2, 3], 'b': ['x', 'y']},
+            tag_func=lambda kwargs: {'color': 'red' if kwargs['a'] == 2
+                                     else 'blue'},
+            custom_wrappers=record,
+            lazy=True
+        )
+        def test_sample(self, env, result, a, b):
+            result.true(True, '{} - {}'.format(a, b))
+
+    multitest = MultiTest(
+        name='MyMultitest', suites=[MySuite()],
+        test_filter=Tags({'color': 'red'}) | Pattern('*:*:*a_3__b_y'))
+
+    plan = Testplan(name='plan', parse_cmdline=False)
+    plan.add(multitest)
+    plan.run()
+
+    expected = ['test_sample__a_2__b_x', 'test_sample__a_2__b_y',
+                'test_sample__a_3__b_y']
+    assert created == expected
+    assert executed == expected
+
+    param_report = plan.report[0][0][0]
+    assert param_report.name == 'test_sample'
+    assert param_report.tags_index == {
+        'simple': frozenset({'foo'}),
+        'color': frozenset({'red', 'blue'})}
+    assert [entry.name for entry in param_report] == expected
+
+
+@pytest.mark.parametrize('lazy', (False, True))
+def test_pairwise_parametrization(lazy):
+    """Pairwise parametrization should cover all pairs of values."""
+    parameters = {
+        'a': [1, 2, 3],
+        'b': ['x', 'y', 'z'],
+        'c': [True, False],
+        'd': [10, 20, 30],
+    }
+
+    def make_suite(seed):
+
+        @testsuite
+        class MySuite(object):
+
+            @testcase(
+                parameters=parameters,
+                combinatorial='pairwise',
+                combinatorial_seed=seed,
+                name_func=lambda func_name, kwargs: '{}__{}'.format(
+                    func_name, '_'.join(str(val) for val in kwargs.values())),
+                tag_func=lambda kwargs: {'size': str(kwargs['d'])},
+                lazy=lazy
+            )
+            def test_sample(self, env, result, a, b, c, d):
+                pass
+
+        return MySuite
+
+    testcases = make_suite(seed=1)().get_testcases()
+    assert len(testcases) < 3 * 3 * 2 * 3
+
+    covered = set()
+    for name, case in testcases.items():
+        values = name.split('__')[1].split('_')
+        kwargs = dict(zip('abcd', values))
+        assert case.tags['size'] == frozenset([kwargs['d']])
+        for arg_1, arg_2 in itertools.combinations('abcd', 2):
+            covered.add((arg_1, kwargs[arg_1], arg_2, kwargs[arg_2]))
+    assert covered == {
+        (arg_1, str(val_1), arg_2, str(val_2))
+        for arg_1, arg_2 in itertools.combinations('abcd', 2)
+        for val_1 in parameters[arg_1] for val_2 in parameters[arg_2]}
+
+    # Same seed generates the same testcases
+    assert list(make_suite(seed=1)().get_testcases()) == list(testcases)
+
+
+def test_nwise_parametrization():
+    """N-wise parametrization should generate the same testcases lazily."""
+    parameters = {arg: range(3) for arg in 'abcd'}
+
+    @testsuite
+    class MySuite(object):
+
+        @testcase(parameters=parameters, combinatorial=3)
+        def test_eager(self, env, result, a, b, c, d):
+            pass
+
+        @testcase(parameters=parameters, combinatorial=3, lazy=True)
+        def test_lazy(self, env, result, a, b, c, d):
+            pass
+
+        @testcase(parameters=parameters, combinatorial=4)
+        def test_full(self, env, result, a, b, c, d):
+            pass
+
+    names = list(MySuite().get_testcases())
+    eager = [name.split('__', 1)[1] for name in names
+             if name.startswith('test_eager')]
+    lazy = [name.split('__', 1)[1] for name in names
+            if name.startswith('test_lazy')]
+    assert eager == lazy
+    assert 27 <= len(eager) < 81
+    assert len([name for name in names if name.startswith('test_full')]) == 81
+
+
+@pytest.mark.parametrize(
+    'parameters, combinatorial',
+    (
+        ((1, 2, 3), 'pairwise'),
+        ({'a': [1, 2], 'b': [3, 4]}, 'allpairs'),
+        ({'a': [1, 2], 'b': [3, 4]}, 1),
+    )
+)
+def test_invalid_combinatorial(parameters, combinatorial):
+    with pytest.raises(ParametrizationError):
+        @testsuite
+        class MySuite(object):
+
+            @testcase(parameters=parameters, combinatorial=combinatorial)
+            def sample_test(self, env, result, a, b=5):
+                pass
@@ -1,9 +1,10 @@
 import os
+import stat
 import platform
 
 import pytest
 
-from testplan.testing.base import ProcessRunnerTest
+from testplan.testing.base import ProcessRunnerTest, fetch_test_contexts
 
 from testplan import Testplan
 from testplan.common.utils.testing import log_propagation_disabled, check_report
@@ -77,3 +78,80 @@ def test_process_runner(binary_path, expected_report, test_kwargs):
         assert plan.run().run is True
 
     check_report(expected=expected_report, actual=plan.report)
+
+
+class ListingTest(DummyTest):
+
+    def list_command(self):
+        return [self.cfg.driver, '--list']
+
+    def parse_test_context(self, test_list_output):
+        suite, testcases = test_list_output.decode().strip().split(':')
+        return [[suite, testcases.split(',')]]
+
+
+# Counts its invocations in the file next to it
+LISTING_SCRIPT = """#!/bin/sh
+echo x >> "$(dirname "$0")/listings"
+echo "Suite:case_a,case_b"
+"""
+
+
+@pytest.fixture
+def listing_binary(tmpdir):
+    binary_path = str(tmpdir.join('test.sh'))
+    with open(binary_path, 'w') as binary:
+        binary.write(LISTING_SCRIPT)
+    os.chmod(binary_path, os.stat(binary_path).st_mode | stat.S_IEXEC)
+    return binary_path
+
+
+def count_listings(binary_path):
+    listings = os.path.join(os.path.dirname(binary_path), 'listings')
+    if not os.path.exists(listings):
+        return 0
+    with open(listings) as listings_file:
+        return len(listings_file.readlines())
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='Bash files skipped on Windows.'
+)
+def test_listing_cache(listing_binary, tmpdir):
+    cache_dir = str(tmpdir.join('cache'))
+    expected = [['Suite', ['case_a', 'case_b']]]
+
+    def make_test(**options):
+        return ListingTest(name='MyTest', driver=listing_binary,
+                           listing_cache_dir=cache_dir, **options)
+
+    assert make_test().test_context == expected
+    assert make_test().test_context == expected
+    assert count_listings(listing_binary) == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Listing environment is part of the key
+    assert make_test(proc_env={'A': '1'}).test_context == expected
+    assert count_listings(listing_binary) == 2
+
+    # So is the driver binary size
+    with open(listing_binary, 'a') as binary:
+        binary.write('# changed\n')
+    assert make_test().test_context == expected
+    assert count_listings(listing_binary) == 3
+    assert len(os.listdir(cache_dir)) == 3
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='Bash files skipped on Windows.'
+)
+def test_fetch_test_contexts(listing_binary):
+    tests = [ListingTest(name='MyTest{}'.format(idx), driver=listing_binary)
+             for idx in range(5)]
+    fetch_test_contexts(tests, size=3)
+    assert count_listings(listing_binary) == 5
+    for test in tests:
+        assert test.test_context == [['Suite', ['case_a', 'case_b']]]
+    assert count_listings(listing_binary) == 5
@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import textwrap
+
+import pytest
+
+from testplan import Testplan
+from testplan.common.utils.testing import (
+    captured_logging, log_propagation_disabled, to_stdout)
+from testplan.logger import TESTPLAN_LOGGER
+from testplan.runners.pools.tasks import Task
+from testplan.testing import listing, filtering, ordering, tagging
+from testplan.testing import multitest
+from testplan.testing.manifest import TestManifest, ManifestSuite
+
+MODULE_SOURCE = textwrap.dedent('''
+    from testplan.testing.multitest import MultiTest, testsuite, testcase
+
+
+    @testsuite(tags={'color': 'yellow'})
+    class Alpha(object):
+
+        @testcase
+        def test_b(self, env, result):
+            pass
+
+        @testcase(tags='foo')
+        def test_a(self, env, result):
+            pass
+
+
+    @testsuite
+    class Beta(object):
+
+        def suite_name(self):
+            return 'custom'
+
+        @testcase(parameters=(1, 2), tags='bar')
+        def test_param(self, env, result, val):
+            pass
+
+
+    def make_mtest(name):
+        return MultiTest(name=name, suites=[Alpha(), Beta()])
+''')
+
+PATTERN_OUTPUT = to_stdout(
+    'MTest',
+    '  MTest:Alpha  --tags color=yellow',
+    '    MTest:Alpha:test_b',
+    '    MTest:Alpha:test_a  --tags foo',
+    '  MTest:Beta',
+    '    MTest:Beta:test_param__val_1  --tags bar',
+    '    MTest:Beta:test_param__val_2  --tags bar',
+)
+
+
+@pytest.fixture
+def task_module(tmpdir):
+    module_name = 'manifest_tasks_{}'.format(abs(hash(str(tmpdir))))
+    path = tmpdir.join('{}.py'.format(module_name))
+    path.write(MODULE_SOURCE)
+    yield str(tmpdir), module_name, path
+    sys.modules.pop(module_name, None)
+
+
+def _list(manifest_path, task, **options):
+    plan = Testplan(
+        name='plan', parse_cmdline=False, manifest_path=manifest_path,
+        **options)
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        with captured_logging(TESTPLAN_LOGGER) as log_capture:
+            plan.schedule(task)
+            return log_capture.output
+
+
+def _failing_materialize(self, target=None):
+    raise AssertionError('Task should not be materialized.')
+
+
+def test_listing_from_manifest(tmpdir, task_module, monkeypatch):
+    path, module_name, _ = task_module
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+
+    def make_task():
+        return Task('{}.make_mtest'.format(module_name),
+                    path=path, args=('MTest',))
+
+    lister = listing.ExpandedPatternLister()
+    assert _list(manifest_path, make_task(), test_lister=lister) == \
+        PATTERN_OUTPUT
+    with open(manifest_path) as fobj:
+        records = [json.loads(line) for line in fobj]
+    assert len(records) == 1
+    assert records[0]['name'] == 'MTest'
+
+    monkeypatch.setattr(Task, 'materialize', _failing_materialize)
+    assert _list(manifest_path, make_task(), test_lister=lister) == \
+        PATTERN_OUTPUT
+
+    # Filters and sorters apply to the recorded test context
+    assert _list(
+        manifest_path, make_task(),
+        test_lister=listing.ExpandedNameLister(),
+        test_filter=filtering.Tags({'simple': 'bar'}) |
+        filtering.Pattern('*:Alpha:test_a'),
+        test_sorter=ordering.AlphanumericSorter()) == to_stdout(
+            'MTest',
+            '  Alpha',
+            '    test_a',
+            '  Beta',
+            '    test_param__val_1',
+            '    test_param__val_2',
+        )
+    assert _list(
+        manifest_path, make_task(),
+        test_lister=listing.CountLister(),
+        test_filter=filtering.Pattern('*:custom')) == ''
+    assert _list(
+        manifest_path, make_task(),
+        test_lister=listing.CountLister(),
+        test_filter=filtering.Pattern('*:Beta - custom')) == to_stdout(
+            'MTest: (1 suite, 2 testcases)')
+
+
+def test_manifest_test_context(tmpdir, task_module):
+    path, module_name, _ = task_module
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+    task = Task('{}.make_mtest'.format(module_name),
+                path=path, args=('MTest',))
+    _list(manifest_path, task, test_lister=listing.CountLister())
+
+    mtest = TestManifest(manifest_path).get(task)
+    assert mtest.name == 'MTest'
+    alpha, beta = mtest.suites
+    assert isinstance(alpha, ManifestSuite)
+    assert type(alpha).__name__ == 'Alpha'
+    assert not hasattr(alpha, 'suite_name')
+    assert beta.suite_name() == 'custom'
+
+    test_b, test_a = alpha.get_testcases().values()
+    assert test_a.im_class is type(alpha)
+    assert tagging.get_testcase_tags(test_a) == {
+        'color': {'yellow'}, 'simple': {'foo'}}
+    assert tagging.get_suite_tags(beta) == {'simple': {'bar'}}
+
+    with pytest.raises(RuntimeError):
+        mtest.run()
+
+
+def test_changed_module_is_materialized(tmpdir, task_module):
+    path, module_name, module_path = task_module
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+    task = Task('{}.make_mtest'.format(module_name),
+                path=path, args=('MTest',))
+    lister = listing.CountLister()
+
+    assert _list(manifest_path, task, test_lister=lister) == \
+        to_stdout('MTest: (2 suites, 4 testcases)')
+
+    module_path.write(MODULE_SOURCE.replace(
+        'suites=[Alpha(), Beta()]', 'suites=[Alpha()]'))
+    sys.modules.pop(module_name)
+    assert _list(manifest_path, task, test_lister=lister) == \
+        to_stdout('MTest: (1 suite, 2 testcases)')
+
+    with open(manifest_path) as fobj:
+        assert len(fobj.readlines()) == 2
+
+
+def test_uncacheable_tasks(tmpdir, task_module):
+    path, module_name, _ = task_module
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+
+    # Test objects are already materialized
+    sys.path.insert(0, path)
+    try:
+        module = __import__(module_name)
+    finally:
+        sys.path.remove(path)
+    _list(manifest_path, Task(module.make_mtest('MTest')),
+          test_lister=listing.CountLister())
+    assert not os.path.exists(manifest_path)
+
+
+def test_changed_base_suite_is_materialized(tmpdir, task_module):
+    path, module_name, module_path = task_module
+    base_name = '{}_base'.format(module_name)
+    base_path = tmpdir.join('{}.py'.format(base_name))
+    base_path.write(textwrap.dedent('''
+        class Base(object):
+
+            def suite_name(self):
+                return 'one'
+    '''))
+    module_path.write(MODULE_SOURCE.replace(
+        'class Alpha(object)', 'class Alpha(Base)').replace(
+        'from testplan', 'from {} import Base\nfrom testplan'.format(
+            base_name), 1))
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+    task = Task('{}.make_mtest'.format(module_name),
+                path=path, args=('MTest',))
+
+    try:
+        assert _list(
+            manifest_path, task, test_lister=listing.CountLister(),
+            test_filter=filtering.Pattern('*:Alpha - one')) == to_stdout(
+                'MTest: (1 suite, 2 testcases)')
+
+        base_path.write(base_path.read().replace("'one'", "'three'"))
+        sys.modules.pop(base_name)
+        sys.modules.pop(module_name)
+        assert _list(
+            manifest_path, task, test_lister=listing.CountLister(),
+            test_filter=filtering.Pattern('*:Alpha - three')) == to_stdout(
+                'MTest: (1 suite, 2 testcases)')
+    finally:
+        sys.modules.pop(base_name, None)
+
+
+def test_leftover_testcase_registrations(tmpdir, task_module):
+    path, module_name, _ = task_module
+    manifest_path = str(tmpdir.join('manifest.jsonl'))
+
+    # A suite whose class body raises leaves its testcases registered
+    with pytest.raises(ZeroDivisionError):
+        @multitest.testsuite
+        class Broken(object):
+
+            @multitest.testcase
+            def test_leftover(self, env, result):
+                pass
+
+            1 / 0
+
+    task = Task('{}.make_mtest'.format(module_name),
+                path=path, args=('MTest',))
+    assert _list(manifest_path, task, test_lister=listing.CountLister()) == \
+        to_stdout('MTest: (2 suites, 4 testcases)')
@@ -183,3 +183,54 @@ def test_getattr_propagation():
     leaf_4.parent = branch_3
     # foo -> root default, bar -> branch local, baz -> leaf local
     assert (leaf_4.foo, leaf_4.bar, leaf_4.baz) == (5, 40, 'beta')
+
+
+def test_getattr_cache_invalidation():
+    """
+        Resolved values are cached, setting a parent anywhere in the
+        chain should invalidate the cached values of the descendants.
+    """
+    root = Root(foo=7)
+    branch = Branch()
+    leaf = Leaf()
+    leaf.parent = branch
+    # foo -> branch default, bar -> branch default
+    assert (leaf.foo, leaf.bar) == (50, 30)
+    assert (leaf.foo, leaf.bar) == (50, 30)
+
+    branch.parent = root
+    # foo -> root local, bar -> branch default
+    assert (leaf.foo, leaf.bar) == (7, 30)
+
+    for _ in range(2):
+        should_raise(AttributeError, getattr, args=(leaf, 'missing'))
+    assert getattr(leaf, 'missing', None) is None
+
+
+def test_copy():
+    """Copies resolve values and validate the replaced options only."""
+    branch = Branch(bar=40)
+    branch.parent = Root(foo=7)
+
+    item = branch.copy(bar=41)
+    assert isinstance(item, Branch)
+    assert item.parent is None
+    assert (item.foo, item.bar) == (7, 41)
+    assert (branch.foo, branch.bar) == (7, 40)
+
+    should_raise(SchemaError, branch.copy, kwargs=dict(bar='41'))
+    should_raise(SchemaError, branch.copy, kwargs=dict(missing=1))
+
+
+def test_shallow_copy():
+    """Shallow copies share option values, copies do not."""
+    item = Third(c=5)
+    assert item.shallow_copy().a is item.a
+    assert item.copy().a is not item.a
+    assert item.shallow_copy(c=6).c == 6
+
+
+def test_schema_cached_per_class():
+    """The schema is built once per configuration class."""
+    assert First().schema is First().schema
+    assert Second().schema is not First().schema
@@ -0,0 +1,161 @@
+"""Unit tests for FIX message framing."""
+
+import socket
+
+import pytest
+
+from testplan.common.utils.sockets.fix.client import Client
+from testplan.common.utils.sockets.fix.framer import Framer
+from testplan.common.utils.sockets.fix.server import Server
+
+
+def fix_wire(fields, body_length=None):
+    """Serialize (tag, value) pairs into a FIX message."""
+    body = b''.join(
+        '{}={}\x01'.format(tag, value).encode('utf-8')
+        for tag, value in fields)
+    if body_length is None:
+        body_length = len(body)
+    msg = b'8=FIX.4.2\x019=' + str(body_length).encode('utf-8') + b'\x01' + body
+    return msg + '10={:03d}\x01'.format(sum(bytearray(msg)) % 256).encode(
+        'utf-8')
+
+
+class SimpleFixMessage(dict):
+    """Minimal FIX message type for server / client tests."""
+
+    @classmethod
+    def from_dict(cls, source):
+        msg = cls()
+        for tag, value in source.items():
+            msg[tag] = value
+        return msg
+
+    @classmethod
+    def from_buffer(cls, data, codec):
+        msg = cls()
+        for field in data.split(b'\x01'):
+            if field:
+                tag, value = field.split(b'=', 1)
+                msg[int(tag)] = value
+        return msg
+
+    def __setitem__(self, tag, value):
+        if not isinstance(value, bytes):
+            value = str(value).encode('utf-8')
+        super(SimpleFixMessage, self).__setitem__(tag, value)
+
+    def tag_exact(self, tag, value):
+        return self.get(tag) == value
+
+    def to_wire(self, codec):
+        return fix_wire(
+            (tag, value.decode('utf-8')) for tag, value in sorted(self.items())
+            if tag not in (8, 9, 10))
+
+
+MESSAGES = [
+    fix_wire([(35, 'D'), (11, 'ORDER{}'.format(idx)), (38, idx)])
+    for idx in range(50)
+]
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 64, 4096))
+def test_framer_chunks(chunk_size):
+    """Messages split or merged arbitrarily by reads are reassembled."""
+    data = b''.join(MESSAGES)
+    framer = Framer(bufsize=16)
+    frames = []
+
+    for idx in range(0, len(data), chunk_size):
+        framer.feed(data[idx:idx + chunk_size])
+        frames.extend(framer.frames())
+
+    assert frames == MESSAGES
+    assert len(framer) == 0
+
+
+def test_framer_body_length():
+    """BodyLength takes precedence, so raw data can contain a checksum."""
+    raw = fix_wire([(35, 'D'), (96, 'abc\x0110=123\x01def')])
+    framer = Framer()
+    framer.feed(raw + MESSAGES[0])
+
+    assert list(framer.frames()) == [raw, MESSAGES[0]]
+
+
+@pytest.mark.parametrize('body_length', ('x', 3, 1000))
+def test_framer_invalid_body_length(body_length):
+    """Messages with wrong BodyLength are delimited by CheckSum."""
+    invalid = fix_wire([(35, 'D'), (11, 'ABC')], body_length=body_length)
+    framer = Framer()
+    framer.feed(invalid + MESSAGES[0])
+
+    frames = list(framer.frames())
+    if body_length == 1000:
+        # Rest of the message may not have been received yet
+        assert frames == []
+    else:
+        assert frames == [invalid, MESSAGES[0]]
+
+
+def test_framer_resync():
+    """Data before a BeginString field is discarded."""
+    framer = Framer()
+    framer.feed(b'garbage\x01' + MESSAGES[0] + b'more\x01' + MESSAGES[1])
+
+    assert list(framer.frames()) == MESSAGES[:2]
+    assert framer.drain() == b''
+
+
+def test_framer_recv_into():
+    sender, receiver = socket.socketpair()
+    try:
+        data = b''.join(MESSAGES * 20)
+        sender.sendall(data)
+        sender.close()
+
+        framer = Framer(bufsize=100)
+        frames = []
+        while framer.recv_into(receiver):
+            frames.extend(framer.frames())
+    finally:
+        receiver.close()
+
+    assert frames == MESSAGES * 20
+
+
+def test_server_client_burst():
+    """Bursts of messages are delivered one by one in both directions."""
+    server = Server(msgclass=SimpleFixMessage, codec=None)
+    server.start()
+    client = Client(
+        msgclass=SimpleFixMessage, codec=None, host=server.ip,
+        port=server.port, sender='CLIENT', target='SERVER')
+    try:
+        client.connect()
+        client.sendlogon()
+        assert client.receive(timeout=5)[35] == b'A'
+
+        num_messages = 500
+        # Written with a single call so that messages are coalesced
+        client.socket.sendall(b''.join(
+            client._populate_tags(SimpleFixMessage.from_dict(
+                {35: 'D', 11: idx})).to_wire(None)
+            for idx in range(num_messages)))
+
+        for idx in range(num_messages):
+            msg = server.receive(timeout=5)
+            assert msg[11] == str(idx).encode('utf-8')
+
+        for idx in range(num_messages):
+            server.send(SimpleFixMessage.from_dict({35: '8', 11: idx}))
+        for idx in range(num_messages):
+            msg = client.receive(timeout=5)
+            assert msg[11] == str(idx).encode('utf-8')
+
+        with pytest.raises(socket.timeout):
+            client.receive(timeout=0.1)
+    finally:
+        client.close()
+        server.stop()
@@ -0,0 +1,140 @@
+"""Unit tests for the FIX server with several sessions."""
+
+import socket
+import threading
+
+import pytest
+
+from testplan.common.utils.sockets.fix.client import Client
+from testplan.common.utils.sockets.fix.server import Server
+
+from .test_framer import SimpleFixMessage
+
+
+@pytest.fixture
+def server():
+    server = Server(msgclass=SimpleFixMessage, codec=None)
+    server.start()
+    yield server
+    server.stop()
+
+
+def logon_client(server, idx):
+    client = Client(
+        msgclass=SimpleFixMessage, codec=None, host=server.ip,
+        port=server.port, sender='CLIENT{}'.format(idx), target='SERVER')
+    client.connect()
+    client.sendlogon()
+    assert client.receive(timeout=5)[35] == b'A'
+    return client
+
+
+def test_concurrent_sessions(server):
+    """Sessions are served concurrently with their own sequence numbers."""
+    num_sessions, num_messages = 8, 200
+    clients = [logon_client(server, idx) for idx in range(num_sessions)]
+    errors = []
+
+    def session(idx, client):
+        conn_name = ('SERVER', 'CLIENT{}'.format(idx))
+        try:
+            for num in range(num_messages):
+                client.send(SimpleFixMessage.from_dict({35: 'D', 11: num}))
+                server.send(
+                    SimpleFixMessage.from_dict({35: '8', 11: num}), conn_name)
+            for num in range(num_messages):
+                assert server.receive(conn_name, timeout=5)[11] == str(
+                    num).encode('utf-8')
+                msg = client.receive(timeout=5)
+                assert msg[11] == str(num).encode('utf-8')
+                # Logon reply used sequence number 1
+                assert msg[34] == str(num + 2).encode('utf-8')
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=session, args=(idx, client))
+        for idx, client in enumerate(clients)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        for client in clients:
+            client.close()
+
+    assert errors == []
+
+
+def test_slow_session(server):
+    """A session that does not read does not block the other sessions."""
+    slow, fast = logon_client(server, 0), logon_client(server, 1)
+    try:
+        # Enough data to fill the socket buffers of the slow session
+        for num in range(2000):
+            server.send(
+                SimpleFixMessage.from_dict({35: '8', 11: num, 58: 'x' * 1000}),
+                ('SERVER', 'CLIENT0'))
+
+        server.send(
+            SimpleFixMessage.from_dict({35: '8', 11: 'fast'}),
+            ('SERVER', 'CLIENT1'))
+        assert fast.receive(timeout=5)[11] == b'fast'
+
+        for num in range(2000):
+            assert slow.receive(timeout=5)[11] == str(num).encode('utf-8')
+    finally:
+        slow.close()
+        fast.close()
+
+
+def test_send_receive_many(server):
+    client = logon_client(server, 0)
+    conn_name = ('SERVER', 'CLIENT0')
+    try:
+        tsps, sent = client.send_many(
+            SimpleFixMessage.from_dict({35: 'D', 11: num})
+            for num in range(5000))
+        assert len(tsps) == len(sent) == 5000
+        assert [msg[34] for msg in sent] == [
+            str(num + 2).encode('utf-8') for num in range(5000)]
+
+        for num in range(5000):
+            assert server.receive(conn_name, timeout=5)[11] == str(
+                num).encode('utf-8')
+            server.send(
+                SimpleFixMessage.from_dict({35: '8', 11: num}), conn_name)
+
+        received, tsps = client.receive_many(5000, timeout=5)
+        assert [msg[11] for msg in received] == [
+            str(num).encode('utf-8') for num in range(5000)]
+        assert list(tsps) == sorted(tsps)
+
+        with pytest.raises(socket.timeout):
+            client.receive_many(1, timeout=0.1)
+    finally:
+        client.close()
+
+
+def test_logout_reply_queued(server):
+    """The logout reply is written even when queued behind other data."""
+    client = logon_client(server, 0)
+    conn_name = ('SERVER', 'CLIENT0')
+    try:
+        # More data than the socket buffers of the session can hold
+        for num in range(2000):
+            server.send(SimpleFixMessage.from_dict(
+                {35: '8', 11: num, 58: 'x' * 10000}), conn_name)
+        client.sendlogoff()
+
+        for num in range(2000):
+            assert client.receive(timeout=5)[11] == str(num).encode('utf-8')
+        assert client.receive(timeout=5)[35] == b'5'
+
+        assert not server.is_connection_active(conn_name)
+        with pytest.raises(Exception):
+            server.send(SimpleFixMessage.from_dict({35: '8'}), conn_name)
+    finally:
+        client.close()
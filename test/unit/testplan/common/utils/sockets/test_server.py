@@ -1,5 +1,13 @@
 """TODO."""
 
+import os
+import time
+import socket
+import struct
+import threading
+
+import pytest
+
 from testplan.common.utils.sockets import Server, Client
 
 
@@ -83,3 +91,87 @@ def test_two_clients():
     client2.close()
     server.close()
 
+
+
+def test_large_payload():
+    server = Server()
+    server.bind()
+    server.serve()
+
+    client = Client(host=server.ip, port=server.port)
+    client.connect()
+    conn_idx = server.accept_connection()
+
+    payload = os.urandom(1024) * 32 * 1024  # 32MB
+    thread = threading.Thread(target=client._client.sendall, args=(payload,))
+    thread.start()
+    assert server.receive(len(payload), conn_idx=conn_idx) == payload
+    thread.join()
+
+    client.close()
+    server.close()
+
+
+def test_framing():
+    server = Server()
+    server.bind()
+    server.serve()
+
+    client = Client(host=server.ip, port=server.port)
+    client.connect()
+    conn_idx = server.accept_connection()
+
+    # Several messages arriving in a single read
+    client.send(b'Hello\r\nWorld\r\n' + struct.pack('!I', 5) + b'Frame' +
+                b'tail')
+    assert server.receive_until(b'\r\n', conn_idx=conn_idx) == b'Hello\r\n'
+    assert server.receive_until(b'\r\n', conn_idx=conn_idx) == b'World\r\n'
+    assert server.receive_frame(conn_idx=conn_idx) == b'Frame'
+    assert server.receive(
+        1024, conn_idx=conn_idx, wait_full_size=False) == b'tail'
+
+    # Delimiter split across reads
+    client.send(b'abc\r')
+    with pytest.raises(socket.timeout):
+        server.receive_until(b'\r\n', conn_idx=conn_idx, timeout=0.1)
+    client.send(b'\ndef')
+    assert server.receive_until(b'\r\n', conn_idx=conn_idx) == b'abc\r\n'
+    assert server.receive(3, conn_idx=conn_idx) == b'def'
+
+    server.send_frame(b'Reply', conn_idx=conn_idx)
+    assert client.receive(1024) == struct.pack('!I', 5) + b'Reply'
+
+    with pytest.raises(socket.timeout):
+        server.receive(1, conn_idx=conn_idx, timeout=0)
+
+    client.close()
+    server.close()
+
+
+def test_many_connections():
+    server = Server(listen=128)
+    server.bind()
+    server.serve()
+
+    clients = [Client(host=server.ip, port=server.port) for _ in range(100)]
+    for idx, client in enumerate(clients):
+        client.connect()
+        assert server.accept_connection(timeout=1) == idx
+
+    for idx, client in enumerate(clients):
+        client.send(struct.pack('!I', idx))
+    for idx in reversed(range(len(clients))):
+        assert struct.unpack(
+            '!I', server.receive(4, conn_idx=idx))[0] == idx
+
+    # No sleep while waiting for the next connection
+    start = time.time()
+    thread = threading.Timer(0.05, Client(server.ip, server.port).connect)
+    thread.start()
+    assert server.accept_connection(timeout=5) == len(clients)
+    assert time.time() - start < 0.5
+    thread.join()
+
+    for client in clients:
+        client.close()
+    server.close()
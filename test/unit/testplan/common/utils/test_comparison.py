@@ -1,3 +1,6 @@
+import itertools
+import random
+
 import pytest
 from testplan.common.utils import comparison as cmp
 
@@ -91,3 +94,166 @@ def test_comparator_composition(
 ):
     assert composed_callable(value) == expected
     assert str(composed_callable) == description
+
+
+def least_error(grid):
+    """Brute force least error of all permutations."""
+    return min(
+        sum(grid[row][col] for row, col in enumerate(perm))
+        for perm in itertools.permutations(range(len(grid)))
+    )
+
+
+@pytest.mark.parametrize(
+    'grid,expected',
+    (
+        ([], []),
+        ([[5]], [0]),
+        (
+            [[1000, 2000, 2000],
+             [1000, 2000, 2000],
+             [0, 2000, 2000]],
+            [1, 2, 0]
+        ),
+        ([[0, 0, 0], [0, 0, 0], [0, 0, 0]], [0, 1, 2]),
+        (
+            [[100000, 100000, 0],
+             [100000, 100000, 10000],
+             [0, 2500, 100000]],
+            [2, 1, 0]
+        ),
+    )
+)
+def test_best_permutation(grid, expected):
+    assert cmp._best_permutation(grid) == expected
+
+
+@pytest.mark.parametrize('max_error', (1, 3, 10000))
+def test_best_permutation_matches_brute_force(max_error):
+    rand = random.Random(max_error)
+    for _ in range(200):
+        size = rand.randint(1, 6)
+        grid = [
+            [rand.randint(0, max_error) for _ in range(size)]
+            for _ in range(size)
+        ]
+        perm = cmp._best_permutation(grid)
+        assert sorted(perm) == list(range(size))
+        assert sum(
+            grid[row][col] for row, col in enumerate(perm)
+        ) == least_error(grid)
+        assert cmp._best_permutation(grid) == perm
+
+
+@pytest.mark.parametrize('size', (4, 16, 50, 100, 200, 500))
+def test_best_permutation_large_grid(size):
+    """Only the hidden permutation is a perfect match."""
+    rand = random.Random(size)
+    hidden = list(range(size))
+    rand.shuffle(hidden)
+    grid = [
+        [rand.randint(1, 10000) for _ in range(size)] for _ in range(size)]
+    for row, col in enumerate(hidden):
+        grid[row][col] = 0
+
+    assert cmp._best_permutation(grid) == hidden
+
+
+@pytest.mark.parametrize('size', (4, 16, 50, 100, 200, 500))
+def test_best_permutation_tied_grid(size):
+    """Every permutation has the same error when columns are constant."""
+    grid = [[col % 3 for col in range(size)] for _ in range(size)]
+
+    assert cmp._best_permutation(grid) == list(range(size))
+
+
+def test_unordered_compare_above_previous_limit():
+    values = [{'id': idx, 'qty': idx * 10} for idx in range(40)]
+    expected = [
+        cmp.Expected({'id': idx, 'qty': idx * 10})
+        for idx in reversed(range(40))
+    ]
+
+    results = cmp.unordered_compare(
+        match_name='dictmatch', values=values, comparisons=expected)
+
+    assert len(results) == 40
+    assert all(result['passed'] for result in results)
+    assert [result['comparison_index'] for result in results] == list(
+        reversed(range(40)))
+
+
+MATCH_PLAN_EXPECTED = {
+    'foo': 1,
+    'bar': cmp.Greater(5),
+    'baz': [1, '2', {'qux': lambda value: value in ('a', 'b')}],
+    'quux': {'a': 1.5, 'b': None},
+}
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        {
+            'foo': 1, 'bar': 10,
+            'baz': [1, 2, {'qux': 'a'}], 'quux': {'a': 1.50, 'b': None},
+        },
+        {
+            'foo': '1', 'bar': 2, 'extra': 3,
+            'baz': [1], 'quux': {'a': 1.5, 'b': 2},
+        },
+        {'foo': 2, 'baz': 'abc', 'quux': [1, 2]},
+        {},
+    )
+)
+@pytest.mark.parametrize(
+    'ignore,only',
+    (
+        (None, None),
+        (['bar'], None),
+        (None, ['foo', 'baz', 'missing']),
+        (None, True),
+        (['foo'], []),
+    )
+)
+@pytest.mark.parametrize('report_all', (True, False))
+def test_match_plan(value, ignore, only, report_all):
+    """Match plans should produce the same results as `compare`."""
+    plan = cmp.MatchPlan(MATCH_PLAN_EXPECTED, ignore=ignore, only=only)
+    expected = cmp.compare(
+        value, MATCH_PLAN_EXPECTED,
+        ignore=ignore, only=only, report_all=report_all)
+
+    assert plan.compare(value, report_all=report_all) == expected
+    # Plans are reusable
+    assert plan.compare(value, report_all=report_all) == expected
+
+
+def test_match_plan_fail_fast():
+    plan = cmp.MatchPlan(MATCH_PLAN_EXPECTED, fail_fast=True)
+
+    passed, comparisons = plan.compare({
+        'foo': 1, 'bar': 10,
+        'baz': [1, 2, {'qux': 'a'}], 'quux': {'a': 1.5, 'b': None},
+    })
+    assert passed is True
+    assert comparisons == []
+
+    passed, comparisons = plan.compare({
+        'foo': 1, 'bar': 10,
+        'baz': [1, 2, {'qux': 'c'}], 'quux': {'a': 1.5, 'b': 1},
+    })
+    assert passed is False
+    # Only the path to the first failure is reported
+    assert comparisons == [
+        (
+            'baz', 'f',
+            (1, [(3, 'f', (2, [('qux', 'f', (0, 'str', 'c'))]))]),
+            (1, [(3, 'f', (2, [('qux', 'f', (0, 'func', '<lambda>'))]))]),
+        )
+    ]
+
+
+def test_match_plan_invalid():
+    with pytest.raises(ValueError):
+        cmp.MatchPlan(None)
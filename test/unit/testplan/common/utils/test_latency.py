@@ -0,0 +1,89 @@
+import math
+import random
+
+import pytest
+
+from testplan.common.utils.latency import LatencyHistogram, LatencyRecorder
+
+
+def reference_percentile(values, percentile):
+    values = sorted(values)
+    return values[max(int(math.ceil(len(values) * percentile / 100.0)), 1) - 1]
+
+
+@pytest.mark.parametrize('significant_figures', (1, 2, 3))
+def test_histogram_precision(significant_figures):
+    rand = random.Random(significant_figures)
+    values = [int(rand.lognormvariate(6, 2)) for _ in range(10000)]
+    histogram = LatencyHistogram(significant_figures=significant_figures)
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.min == min(values)
+    assert histogram.max == max(values)
+    assert histogram.mean == pytest.approx(sum(values) / float(len(values)))
+
+    for percentile in (0, 1, 25, 50, 90, 99, 99.9, 100):
+        expected = reference_percentile(values, percentile)
+        actual = histogram.percentile(percentile)
+        assert expected <= actual <= max(
+            expected, expected * (1 + 10 ** -significant_figures))
+
+
+def test_histogram_exact_small_values():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.percentiles((1, 50, 99, 100)) == [
+        (1, 1), (50, 50), (99, 99), (100, 100)]
+
+
+def test_histogram_merge_and_reset():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(10, count=3)
+    second.record(1000000)
+
+    first.merge(second)
+    assert first.count == 4
+    assert first.min == 10
+    assert first.max == 1000000
+    assert first.percentile(75) == 10
+    assert first.percentile(100) == 1000000
+
+    first.reset()
+    assert first.count == 0
+    assert first.percentile(50) is None
+    assert first.mean is None
+
+
+def test_histogram_invalid():
+    with pytest.raises(ValueError):
+        LatencyHistogram(significant_figures=0)
+    with pytest.raises(ValueError):
+        LatencyHistogram().record(-1)
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(101)
+
+
+def test_recorder():
+    recorder = LatencyRecorder(key=lambda msg: msg.get('id'))
+
+    recorder.sent({'id': 1}, tsp=1000)
+    recorder.sent({'id': 2}, tsp=1100)
+    recorder.sent({'name': 'ignored'}, tsp=1100)
+    assert recorder.pending == 2
+
+    assert recorder.received({'id': 2}, tsp=1150) == 50
+    assert recorder.received({'id': 1}, tsp=1300) == 300
+    assert recorder.received({'id': 3}, tsp=1400) is None
+    assert recorder.received({'name': 'ignored'}) is None
+
+    assert recorder.pending == 0
+    assert recorder.unmatched == 1
+    assert len(recorder) == 2
+    assert recorder.histogram.percentiles((50, 100)) == [(50, 50), (100, 300)]
+
+    recorder.reset()
+    assert len(recorder) == 0
@@ -0,0 +1,207 @@
+import re
+import os
+import threading
+
+import pytest
+
+from testplan.common.utils.match import (
+    FileRegexMatcher, LogMatcher, match_regexps_in_file)
+from testplan.common.utils.timing import TimeoutException
+
+
+def _append(path, data):
+    with open(path, 'ab') as fobj:
+        fobj.write(data)
+
+
+class TestFileRegexMatcher(object):
+
+    def test_missing_file(self, tmpdir):
+        matcher = FileRegexMatcher(
+            str(tmpdir.join('missing.log')), [re.compile(r'.*started')])
+        assert matcher.update() is False
+        assert not matcher.matched
+
+    def test_incremental(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        first = re.compile(r'.*listening on (?P<port>\d+)')
+        second = re.compile(r'.*ready')
+        matcher = FileRegexMatcher(path, [first, second])
+
+        _append(path, b'booting\nlistening on 8080\n')
+        assert matcher.update() is False
+        assert matcher.unmatched == [second]
+        assert matcher.extracts == {'port': '8080'}
+
+        _append(path, b'listening on 9090\nready\n')
+        assert matcher.update() is True
+        # Matched regexps are not tried again
+        assert matcher.extracts == {'port': '8080'}
+
+    def test_partial_line(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        regexp = re.compile(r'listening on (?P<port>\d+)\n')
+        matcher = FileRegexMatcher(path, [regexp])
+
+        _append(path, b'listening on 80')
+        assert matcher.update() is False
+
+        _append(path, b'80\n')
+        assert matcher.update() is True
+        assert matcher.extracts == {'port': '8080'}
+
+    def test_unterminated_last_line(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'first\nready')
+        matcher = FileRegexMatcher(path, [re.compile(r'ready')])
+        assert matcher.update() is True
+
+    def test_small_chunks(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b''.join(
+            'line {}\n'.format(idx).encode() for idx in range(1000)))
+        matcher = FileRegexMatcher(
+            path, [re.compile(r'line (?P<last>999)')], chunk_size=7)
+        assert matcher.update() is True
+        assert matcher.extracts == {'last': '999'}
+
+    def test_bytes_pattern(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'\xff\xfe binary ready\n')
+        matcher = FileRegexMatcher(path, [re.compile(b'.*ready')])
+        assert matcher.update() is True
+
+    def test_truncated(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'starting up, not there yet\n')
+        matcher = FileRegexMatcher(path, [re.compile(r'ready')])
+        assert matcher.update() is False
+
+        with open(path, 'wb') as fobj:
+            fobj.write(b'ready\n')
+        assert matcher.update() is True
+
+    def test_reads_appended_bytes_only(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'x' * 100 + b'\n')
+        matcher = FileRegexMatcher(path, [re.compile(r'ready')])
+        matcher.update()
+        assert matcher._position == os.path.getsize(path)
+
+        _append(path, b'ready\n')
+        assert matcher.update() is True
+        assert matcher._position == os.path.getsize(path)
+
+
+def test_match_regexps_in_file(tmpdir):
+    path = str(tmpdir.join('app.log'))
+    _append(path, b'value=1\nother\n')
+    found = re.compile(r'value=(?P<value>\d)')
+    missing = re.compile(r'missing')
+
+    assert match_regexps_in_file(path, [found]) == (True, {'value': '1'})
+    assert match_regexps_in_file(
+        path, [found, missing], return_unmatched=True) == (
+            False, {'value': '1'}, [missing])
+    assert match_regexps_in_file(
+        str(tmpdir.join('missing.log')), [found]) == (False, {})
+
+
+class TestLogMatcher(object):
+
+    def test_consecutive_matches(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'order 1 accepted\norder 2 accepted\n')
+        matcher = LogMatcher(path)
+
+        regexp = re.compile(r'order (?P<id>\d+) accepted')
+        assert matcher.match(regexp, timeout=0).group('id') == '1'
+        assert matcher.match(regexp, timeout=0).group('id') == '2'
+        assert matcher.position == os.path.getsize(path) - 1
+        assert matcher.match(regexp, timeout=0, raise_on_timeout=False) is None
+
+    def test_bytes_pattern(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'\xff payload=\x01\x02\n')
+        match = LogMatcher(path).match(b'payload=(?P<data>..)', timeout=0)
+        assert match.group('data') == b'\x01\x02'
+
+    def test_timeout(self, tmpdir):
+        matcher = LogMatcher(str(tmpdir.join('missing.log')))
+        with pytest.raises(TimeoutException):
+            matcher.match(r'.*ready', timeout=0.05)
+
+    def test_wait_for_appended_line(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'starting\nlisten')
+        matcher = LogMatcher(path)
+
+        writer = threading.Timer(0.1, _append, args=(path, b'ing on 80\n'))
+        writer.start()
+        try:
+            match = matcher.match(r'listening on (?P<port>\d+)\n', timeout=5)
+        finally:
+            writer.join()
+        assert match.group('port') == '80'
+
+    def test_not_match(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'error: boom\n')
+        matcher = LogMatcher(path)
+        with pytest.raises(Exception):
+            matcher.not_match(r'error', timeout=0)
+
+        matcher.seek_eof()
+        matcher.not_match(r'error', timeout=0.05)
+
+    def test_marks(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'before\n')
+        matcher = LogMatcher(path)
+
+        assert matcher.mark('start') == 7
+        _append(path, b'during\n')
+        matcher.mark('end')
+        _append(path, b'after\n')
+
+        assert matcher.get_between('start', 'end') == b'during\n'
+        assert matcher.get_between('end') == b'after\n'
+        assert matcher.get_between() == b'before\nduring\nafter\n'
+        assert matcher.get_between('end', 'start') == b''
+
+        matcher.seek('end')
+        assert matcher.match(r'\w+', timeout=0).group(0) == 'after'
+        matcher.seek()
+        assert matcher.match(r'\w+', timeout=0).group(0) == 'before'
+
+    def test_match_context(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'id=1 status=ok\nid=2 status=failed\n')
+        matcher = LogMatcher(path)
+
+        # Lookbehind and anchors see the text around the match
+        match = matcher.match(r'(?<=id=2 )status=(?P<status>\w+)$', timeout=0)
+        assert match.group('status') == 'failed'
+        assert match.string[:match.start()] == 'id=2 '
+
+    def test_multiline_pattern(self, tmpdir):
+        path = str(tmpdir.join('app.log'))
+        _append(path, b'Traceback:\n  File "app.py"\n')
+        matcher = LogMatcher(path)
+
+        writer = threading.Timer(0.1, _append, args=(path, b'ValueError\n'))
+        writer.start()
+        try:
+            match = matcher.match(
+                r'Traceback:\n(?:  .*\n)*(?P<error>\w+Error)', timeout=5)
+        finally:
+            writer.join()
+        assert match.group('error') == 'ValueError'
+
+    def test_no_log_path(self):
+        matcher = LogMatcher(None)
+        matcher.seek_eof()
+        assert matcher.mark('start') == 0
+        assert matcher.get_between() == b''
+        assert matcher.match(
+            r'.*', timeout=0, raise_on_timeout=False) is None
@@ -0,0 +1,107 @@
+import sys
+import time
+import platform
+import subprocess
+
+import mock
+import psutil
+import pytest
+
+from testplan.common.utils.process import (
+    kill_process, terminate_process, wait_process, reap_process,
+    NEW_SESSION_KWARGS)
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == 'Windows', reason='Uses POSIX shell and signals')
+
+# Shell that starts a grandchild ignoring SIGTERM and waits forever
+TREE_CMD = "sh -c 'trap \"\" TERM; sleep 60' & echo $! ; wait"
+
+
+def _spawn_tree(**kwargs):
+    proc = subprocess.Popen(
+        TREE_CMD, shell=True, stdout=subprocess.PIPE, **kwargs)
+    grandchild = psutil.Process(int(proc.stdout.readline()))
+    return proc, grandchild
+
+
+def _gone(process):
+    try:
+        return process.status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def test_kill_exited_process():
+    proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+    proc.wait()
+    assert kill_process(proc) == 0
+
+
+def test_kill_process_does_not_wait_for_timeout():
+    proc = subprocess.Popen(
+        [sys.executable, '-c', 'import time; time.sleep(60)'])
+    begin = time.time()
+    assert kill_process(proc, timeout=5) is not None
+    assert time.time() - begin < 2
+
+
+def test_kill_process_escalates():
+    proc = subprocess.Popen(
+        [sys.executable, '-c',
+         'import signal, time;'
+         'signal.signal(signal.SIGTERM, signal.SIG_IGN);'
+         'time.sleep(60)'])
+    time.sleep(0.2)
+    begin = time.time()
+    assert kill_process(proc, timeout=0.3) == -9
+    assert time.time() - begin < 2
+
+
+def test_kill_process_group():
+    proc, grandchild = _spawn_tree(**NEW_SESSION_KWARGS)
+    kill_process(proc, timeout=0.3)
+    assert proc.returncode is not None
+    assert _gone(grandchild)
+
+
+def test_reap_after_leader_exited():
+    """Group members left by a reaped leader are killed without killpg."""
+    proc, grandchild = _spawn_tree(**NEW_SESSION_KWARGS)
+    proc.kill()
+    proc.wait()
+
+    with mock.patch('os.killpg') as killpg:
+        reap_process(proc, (proc.pid, []))
+    assert not killpg.called
+    psutil.wait_procs([grandchild], timeout=1)
+    assert _gone(grandchild)
+
+
+def test_kill_process_descendants():
+    proc, grandchild = _spawn_tree()
+    kill_process(proc, timeout=0.3)
+    assert proc.returncode is not None
+    assert _gone(grandchild)
+
+
+def test_terminate_many_concurrently():
+    procs = [
+        subprocess.Popen(
+            [sys.executable, '-c',
+             'import signal, time;'
+             'signal.signal(signal.SIGTERM, signal.SIG_IGN);'
+             'time.sleep(60)'], **NEW_SESSION_KWARGS)
+        for _ in range(4)]
+    time.sleep(0.2)
+
+    begin = time.time()
+    deadline = begin + 0.5
+    terminated = [terminate_process(proc) for proc in procs]
+    for proc, tree in zip(procs, terminated):
+        wait_process(proc, max(deadline - time.time(), 0))
+        reap_process(proc, tree)
+
+    # One grace period for all of them, not one each
+    assert time.time() - begin < 1.5
+    assert all(proc.returncode == -9 for proc in procs)
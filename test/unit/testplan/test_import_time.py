@@ -0,0 +1,52 @@
+"""Import time benchmark of the testplan package."""
+
+import sys
+import subprocess
+
+import pytest
+
+# Heavy optional subsystems that must only be imported on first use
+LAZY_MODULES = (
+    'reportlab',
+    'zmq',
+    'psutil',
+    'webbrowser',
+    'testplan.exporters',
+)
+
+# Cumulative import time budget of `import testplan`, in seconds
+IMPORT_TIME_BUDGET = 1.5
+
+
+def import_times(statement):
+    """
+    Run an import statement in a new interpreter with ``-X importtime``
+    and return the cumulative import time in seconds of each module.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.STDOUT)
+
+    result = {}
+    for line in output.decode().splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            result[name.strip()] = int(cumulative) / 1e6
+    return result
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7),
+    reason='-X importtime requires Python 3.7+'
+)
+def test_import_time():
+    times = import_times('import testplan')
+
+    eager = sorted(
+        name for name in times
+        if any(name == module or name.startswith(module + '.')
+               for module in LAZY_MODULES))
+    assert eager == []
+    assert times['testplan'] < IMPORT_TIME_BUDGET
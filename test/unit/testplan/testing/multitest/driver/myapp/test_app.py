@@ -4,8 +4,12 @@ import os
 import re
 import sys
 import json
+import time
 import platform
 
+import psutil
+import pytest
+
 from testplan.common.utils.timing import wait
 
 from testplan.testing.multitest.driver.app import App
@@ -146,3 +150,46 @@ def test_echo_hello():
 
     with open(app.std.out_path, 'r') as fobj:
         assert fobj.read().startswith('hello')
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='Uses POSIX shell and signals')
+def test_stop_reaps_process_group():
+    apps = [
+        App(name='App{}'.format(idx), binary='sleep 60 & sleep 60; wait',
+            shell=True, stop_timeout=0.5)
+        for idx in range(3)]
+    for app in apps:
+        app.start()
+        app.wait(app.STATUS.STARTED)
+    processes = [
+        child for app in apps
+        for child in psutil.Process(app.pid).children(recursive=True)]
+    assert processes
+
+    begin = time.time()
+    for app in apps:
+        app.stop()
+    for app in apps:
+        app.wait(app.STATUS.STOPPED)
+
+    assert time.time() - begin < 2
+    assert all(app.retcode is not None for app in apps)
+    gone, alive = psutil.wait_procs(processes, timeout=1)
+    # Orphans may be left as zombies until their new parent reaps them
+    assert all(proc.status() == psutil.STATUS_ZOMBIE for proc in alive)
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='Uses POSIX shell and signals')
+def test_stop_without_wait_reaps_process():
+    app = App(name='App', binary='sleep 60', shell=True, stop_timeout=0.5)
+    app.start()
+    app.wait(app.STATUS.STARTED)
+    pid = app.pid
+
+    app.stop()
+    wait(lambda: app.proc is None, 2)
+    assert app.retcode is not None
+    assert app.std.out.closed and app.std.err.closed
+    assert not psutil.pid_exists(pid)
@@ -0,0 +1,96 @@
+"""Unit tests for the Sqlite3 driver."""
+
+import os
+import sqlite3
+
+import pytest
+
+from testplan.testing.multitest.driver.sqlite import Sqlite3
+
+
+@pytest.fixture(params=[False, True], ids=['file', 'in_memory'])
+def db(request, tmpdir):
+    driver = Sqlite3(name='db', db_name='test.db', runpath=str(tmpdir),
+                     in_memory=request.param)
+    with driver:
+        driver.execute(
+            'CREATE TABLE trades (id INTEGER, symbol TEXT, amount INTEGER)')
+        driver.commit()
+        yield driver
+
+
+def test_bulk_load(db):
+    rows = ((idx, 'SYM{}'.format(idx % 10), idx * 2) for idx in range(25000))
+    assert db.bulk_load('trades', rows, batch_size=1000) == 25000
+
+    db.execute('SELECT COUNT(*), SUM(amount) FROM trades')
+    assert db.fetchone() == (25000, 2 * sum(range(25000)))
+
+    # Pragmas are restored after the load
+    db.execute('PRAGMA synchronous')
+    assert db.fetchone()[0] == 2
+
+
+def test_bulk_load_columns(db):
+    assert db.bulk_load(
+        'trades', [('AAPL', 1)], columns=['symbol', 'id']) == 1
+    assert db.fetch_table('trades') == [
+        ['id', 'symbol', 'amount'], [1, 'AAPL', None]]
+
+
+def test_bulk_load_rollback(db):
+    def rows():
+        yield (1, 'AAPL', 10)
+        yield (2, 'GOOG')
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        db.bulk_load('trades', rows())
+    assert db.fetch_table('trades') == [['id', 'symbol', 'amount']]
+
+
+@pytest.mark.skipif(
+    not hasattr(sqlite3.Connection, 'in_transaction'),
+    reason='Connection.in_transaction requires Python 3.2+'
+)
+def test_bulk_load_in_transaction(db):
+    db.execute("INSERT INTO trades VALUES (1, 'AAPL', 10)")
+
+    with pytest.raises(RuntimeError):
+        db.bulk_load('trades', [(2, 'GOOG', 20)])
+
+    # The transaction of the caller is left untouched
+    db.db.rollback()
+    assert db.fetch_table('trades') == [['id', 'symbol', 'amount']]
+
+
+def test_stream_table(db):
+    db.bulk_load('trades', ((idx, 'AAPL', idx) for idx in range(2500)))
+
+    table = db.fetch_table('trades', columns=['id', 'amount'], stream=True)
+    assert not isinstance(table, list)
+    assert next(table) == ['id', 'amount']
+
+    # The internal cursor can be used while streaming
+    db.execute('SELECT COUNT(*) FROM trades')
+    assert db.fetchone() == (2500,)
+
+    rows = list(table)
+    assert rows == [[idx, idx] for idx in range(2500)]
+    assert list(db.iter_table('trades', batch_size=7)) == \
+        db.fetch_table('trades')
+
+
+def test_in_memory(tmpdir):
+    driver = Sqlite3(name='db', db_name='shared', runpath=str(tmpdir),
+                     in_memory=True)
+    with driver:
+        driver.execute('CREATE TABLE items (name TEXT)')
+        driver.bulk_load('items', [('a',), ('b',)])
+        assert not os.path.exists(os.path.join(str(tmpdir), 'shared'))
+
+        other = sqlite3.connect(driver.db_path, uri=True)
+        try:
+            assert other.execute('SELECT COUNT(*) FROM items').fetchone() \
+                == (2,)
+        finally:
+            other.close()
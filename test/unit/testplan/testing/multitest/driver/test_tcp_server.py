@@ -3,9 +3,12 @@
 import os
 import shutil
 
+import pytest
+
 from testplan.common.entity.base import Environment
 from testplan.common.utils.context import context
 from testplan.common.utils.exceptions import should_raise
+from testplan.common.utils.timing import TimeoutException
 from testplan.common.utils.sockets import Message, Codec
 from testplan.testing.multitest.driver.tcp import TCPServer, TCPClient
 
@@ -30,11 +33,12 @@ def test_basic_runpath():
     # Server runpath
     server = TCPServer(name='server', runpath=svr_path)
     assert_obj_runpath(server, svr_path)
-    # Client runpath
-    client = TCPClient(name='client', runpath=cli_path,
-                       host=server._host,
-                       port=server._port)
-    assert_obj_runpath(client, cli_path)
+    # Client runpath, connects on start so the server must be running
+    with server:
+        client = TCPClient(name='client', runpath=cli_path,
+                           host=server._host,
+                           port=server._port)
+        assert_obj_runpath(client, cli_path)
     shutil.rmtree(svr_path, ignore_errors=True)
     shutil.rmtree(cli_path, ignore_errors=True)
 
@@ -122,3 +126,70 @@ def test_send_receive_with_context():
     for item in reversed(list(rcxt)):
         item.stop()
         item._wait_stopped()
+
+
+def test_send_receive_many():
+    server = TCPServer(name='server',
+                       host='localhost',
+                       port=0)
+    server.start()
+    server._wait_started()
+
+    client = TCPClient(name='client',
+                       host=server._host,
+                       port=server._port)
+    client.start()
+    client._wait_started()
+    server.accept_connection()
+
+    msgs = ['{:08d}'.format(idx).encode('utf-8') for idx in range(5000)]
+    tsps = client.send_many(msgs)
+    assert len(tsps) == len(msgs)
+    assert list(tsps) == sorted(tsps)
+
+    data = b''.join(msgs)
+    assert server.receive(len(data)) == data
+
+    server.send(data)
+    received, tsps = client.receive_many(8, len(msgs))
+    assert received == msgs
+    assert len(tsps) == len(msgs)
+
+    with pytest.raises(TimeoutException):
+        client.receive_many(8, 1, timeout=0.2)
+
+    client.stop()
+    client._wait_stopped()
+    server.stop()
+    server._wait_stopped()
+
+
+def test_latency():
+    server = TCPServer(name='server',
+                       host='localhost',
+                       port=0)
+    server.start()
+    server._wait_started()
+
+    client = TCPClient(name='client',
+                       host=server._host,
+                       port=server._port,
+                       latency_key=lambda msg: msg[:4])
+    client.start()
+    client._wait_started()
+    server.accept_connection()
+
+    for idx in range(100):
+        msg = '{:04d}'.format(idx).encode('utf-8')
+        client.send(msg)
+        server.send(server.receive(4))
+        client.receive(4)
+
+    assert client.latency.pending == 0
+    assert client.latency.histogram.count == 100
+    assert 0 < client.latency.histogram.percentile(99) < 1000000
+
+    client.stop()
+    client._wait_stopped()
+    server.stop()
+    server._wait_stopped()
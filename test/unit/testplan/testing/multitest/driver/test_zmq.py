@@ -252,3 +252,57 @@ def test_flush():
         client.receive(timeout=0.2)
 
     stop_devices([server, client])
+
+
+@pytest.mark.parametrize('server_pattern,client_pattern',
+                         ((zmq.PAIR, zmq.PAIR), (zmq.PUSH, zmq.PULL)))
+def test_send_receive_many(server_pattern, client_pattern):
+    server = create_server('server', '127.0.0.1', 0, server_pattern)
+    client = create_client('client', [server.host], [server.port],
+                           client_pattern)
+
+    data = [str(idx).encode('utf-8') for idx in range(10000)]
+    sent_tsps = server.send_many(data, timeout=TIMEOUT)
+    received, recv_tsps = client.receive_many(len(data), timeout=TIMEOUT)
+
+    assert received == data
+    assert len(sent_tsps) == len(recv_tsps) == len(data)
+    assert list(sent_tsps) == sorted(sent_tsps)
+    assert list(recv_tsps) == sorted(recv_tsps)
+
+    with pytest.raises(TimeoutException):
+        client.receive_many(1, timeout=0.2)
+
+    stop_devices([server, client])
+
+
+def test_receive_all():
+    server = create_server('server', '127.0.0.1', 0, zmq.PAIR)
+    client = create_client('client', [server.host], [server.port], zmq.PAIR)
+
+    assert client.receive_all(timeout=0.2) == []
+
+    data = [str(idx).encode('utf-8') for idx in range(100)]
+    server.send_many(data, timeout=TIMEOUT)
+    received = client.receive_all(timeout=TIMEOUT)
+    # Messages may still be in flight after the first one arrived
+    while len(received) < len(data):
+        received.extend(client.receive_all(timeout=TIMEOUT))
+    assert received == data
+
+    stop_devices([server, client])
+
+
+def test_request_reply_latency():
+    """Receiving does not sleep between attempts."""
+    server = create_server('server', '127.0.0.1', 0, zmq.REP)
+    client = create_client('client', [server.host], [server.port], zmq.REQ)
+
+    start = time.time()
+    for _ in range(100):
+        send_receive_message(sender=client, receiver=server, data=b'Hello')
+        send_receive_message(sender=server, receiver=client, data=b'World')
+    # Retrying every 50ms would take 10 seconds
+    assert time.time() - start < 2
+
+    stop_devices([server, client])
@@ -7,7 +7,10 @@ import re
 import pytest
 import six
 
+from testplan.common.utils import comparison
 from testplan.common.utils.exceptions import format_trace
+from testplan.common.utils.latency import LatencyHistogram
+from testplan.common.utils.match import LogMatcher
 from testplan.testing.multitest.entries import assertions
 
 
@@ -786,6 +789,19 @@ COLUMN_CONTAIN_FAIL_PARAMS = [
         ],
         ['Bob', 'Kevin'], 'name', 0, True,
     ),
+    # Scenario 3, unhashable column values
+    (
+        [
+            ['name', 'tags'],
+            ['Bob', ['a']],
+            ['Kevin', 'b'],
+            ['Fred', ['c']],
+        ],
+        [
+            assertions.ColumnContainComparison(2, ['c'], False),
+        ],
+        [['a'], 'b'], 'tags', 0, True,
+    ),
 ]
 
 
@@ -1388,6 +1404,140 @@ class TestTableMatch(object):
         assert error_orig == error_expected
         assert row_comparison.extra == {'bar': error_func}
 
+    def test_compare_columns(self):
+        """
+            Columns with custom comparators in the expected
+            table should be left out of the columnar comparison.
+        """
+        table = [
+            {'foo': 1, 'bar': 'a', 'baz': 5},
+            {'foo': 2, 'bar': 'b', 'baz': 6},
+        ]
+        expected_table = [
+            {'foo': 1, 'bar': re.compile('a'), 'baz': 5},
+            {'foo': 3, 'bar': 'b', 'baz': lambda value: value > 5},
+        ]
+
+        assert assertions.compare_columns(
+            table=table, expected_table=expected_table,
+            comparison_columns=['foo', 'bar', 'baz']
+        ) == {'foo': [True, False]}
+
+    @pytest.mark.parametrize('fail_limit', (0, 1, 2, 10))
+    def test_compare_rows_fail_limit(self, fail_limit):
+        """
+            Columnar fast path should produce the same
+            results as the row by row comparison.
+        """
+        table = [{'foo': idx, 'bar': idx % 3} for idx in range(10)]
+        expected_table = [
+            {'foo': idx if idx % 4 else -1, 'bar': idx % 3}
+            for idx in range(10)
+        ]
+
+        passed, row_comparisons = assertions.compare_rows(
+            table=table, expected_table=expected_table,
+            comparison_columns=['foo', 'bar'],
+            display_columns=['foo', 'bar'],
+            fail_limit=fail_limit,
+        )
+
+        failed_indices = [0, 4, 8]
+        if fail_limit:
+            failed_indices = failed_indices[:fail_limit]
+            assert [comp.idx for comp in row_comparisons] == failed_indices
+        else:
+            assert len(row_comparisons) == len(table)
+
+        assert passed is False
+        for comp in row_comparisons:
+            assert comp.passed is (comp.idx not in failed_indices)
+            if not comp.passed:
+                assert comp.diff == {'foo': -1}
+
+    def test_match_rows_by_key(self):
+        table = [
+            {'id': 1, 'name': 'a'},
+            {'id': 2, 'name': 'b'},
+            {'id': 3, 'name': 'c'},
+            {'id': 2, 'name': 'd'},
+        ]
+        expected_table = [
+            {'id': 4, 'name': 'e'},
+            {'id': 2, 'name': 'f'},
+            {'id': 1, 'name': 'g'},
+            {'id': 4, 'name': 'h'},
+        ]
+
+        pairs, extra, missing = assertions.match_rows_by_key(
+            table=table, expected_table=expected_table, key_columns=['id'])
+
+        assert pairs == [(0, 2), (1, 1)]
+        assert extra == [2, 3]
+        assert missing == [0, 3]
+
+    def test_match_rows_by_key_comparator(self):
+        with pytest.raises(ValueError):
+            assertions.match_rows_by_key(
+                table=[{'id': 1}],
+                expected_table=[{'id': lambda value: True}],
+                key_columns=['id'])
+
+    def test_evaluate_by_key(self):
+        assertion = assertions.TableMatch(
+            table=[
+                ['id', 'sym', 'qty'],
+                [3, 'c', 30],
+                [1, 'a', 10],
+                [2, 'b', 21],
+                [5, 'e', 50],
+            ],
+            expected_table=[
+                ['id', 'sym', 'qty'],
+                [1, 'a', 10],
+                [2, 'b', 20],
+                [3, 'c', lambda qty: qty > 10],
+                [4, 'd', 40],
+            ],
+            key_columns=['id', 'sym'],
+        )
+
+        assert bool(assertion) is False
+        assert assertion.message is None
+        assert [(comp.idx, comp.passed) for comp in assertion.data] == [
+            (0, True), (1, True), (2, False)]
+        assert assertion.data[2].diff == {'qty': 20}
+        assert assertion.missing_rows == [
+            assertions.UnmatchedRow(3, [4, 'd', 40])]
+        assert assertion.extra_rows == [
+            assertions.UnmatchedRow(3, [5, 'e', 50])]
+
+    def test_evaluate_by_key_reordered(self):
+        table = [['id', 'value']] + [[idx, idx * 2] for idx in range(100)]
+        expected_table = [table[0]] + list(reversed(table[1:]))
+
+        assert bool(assertions.TableMatch(
+            table=table, expected_table=expected_table)) is False
+        assert bool(assertions.TableMatch(
+            table=table, expected_table=expected_table,
+            key_columns=['id'])) is True
+
+    @pytest.mark.parametrize(
+        'table,expected_table,key_columns',
+        (
+            ([{'id': 1}], [{'id': re.compile('1')}], ['id']),
+            ([{'id': 1, 'v': 2}], [{'id': 1, 'v': 2}], ['x']),
+            ([{'id': [1]}], [{'id': [1]}], ['id']),
+        )
+    )
+    def test_evaluate_by_key_error(self, table, expected_table, key_columns):
+        assertion = assertions.TableMatch(
+            table=table, expected_table=expected_table,
+            key_columns=key_columns)
+
+        assert bool(assertion) is False
+        assert assertion.message
+
     def _test_evaluate(
         self, table, expected_table, include_columns,
         exclude_columns, expected_message, expected_result
@@ -1569,3 +1719,95 @@ def test_dict_check(dictionary, has_keys, absent_keys, expected):
         dictionary=dictionary, has_keys=has_keys, absent_keys=absent_keys)
 
     assert bool(assertion) is expected
+
+
+def test_dict_match_plan():
+    expected = {'foo': 1, 'bar': comparison.Greater(5), 'baz': 'x'}
+    plan = comparison.MatchPlan(expected, ignore=['baz'])
+
+    for value in ({'foo': 1, 'bar': 10}, {'foo': 2, 'bar': 10}):
+        assertion = assertions.DictMatch(value=value, expected=plan)
+        reference = assertions.DictMatch(
+            value=value, expected=expected, exclude_keys=['baz'])
+
+        assert bool(assertion) is bool(reference)
+        assert assertion.comparison == reference.comparison
+        assert assertion.exclude_keys == ['baz']
+
+    with pytest.raises(ValueError):
+        assertions.FixMatch(value={}, expected=plan, include_tags=['foo'])
+
+
+@pytest.mark.parametrize(
+    'values,percentile,threshold,expected',
+    (
+        (range(1, 101), 99, 100, True),
+        (range(1, 101), 100, 100, False),
+        (range(1, 101), 50, 50, False),
+        (range(1, 101), 50, 51, True),
+        ([], 50, 100, False),
+    )
+)
+def test_latency_percentile_less(values, percentile, threshold, expected):
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assertion = assertions.LatencyPercentileLess(
+        histogram, percentile, threshold)
+    assert bool(assertion) is expected
+    assert assertion.count == len(values)
+    assert assertion.second == threshold
+    assert assertion.description == 'Latency percentile {}'.format(percentile)
+
+
+def test_latency_namespace():
+    from testplan.testing.multitest.result import Result
+
+    result = Result()
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert result.latency.percentile_less(histogram, 90, 100) is True
+    assert result.latency.percentile_less(
+        histogram, 100, 100, description='Max') is False
+    assert result.latency.log(histogram, percentiles=(50, 100)) is True
+
+    serialized = result.serialized_entries
+    assert serialized[0]['type'] == 'LatencyPercentileLess'
+    assert serialized[0]['first'] == 90
+    assert serialized[0]['count'] == 100
+    assert serialized[1]['description'] == 'Max'
+    assert serialized[2]['table'] == [
+        {'Percentile': '50', 'Latency': 50},
+        {'Percentile': '100', 'Latency': 100},
+        {'Percentile': 'Mean', 'Latency': 50.5},
+        {'Percentile': 'Count', 'Latency': 100},
+    ]
+
+
+def test_logfile_namespace(tmpdir):
+    from testplan.testing.multitest.result import Result
+
+    result = Result()
+    log_path = tmpdir.join('app.log')
+    log_path.write('starting\nlistening on 8080\nready\n')
+    log_matcher = LogMatcher(log_path.strpath)
+
+    assert result.logfile.match(
+        log_matcher, r'listening on (?P<port>\d+)', timeout=0) is True
+    assert result.logfile.match(
+        log_matcher, r'.*starting', timeout=0) is False
+    assert result.logfile.not_match(
+        log_matcher, r'.*error', timeout=0) is True
+    assert result.logfile.not_match(
+        log_matcher, r'.*ready', timeout=0) is False
+
+    serialized = result.serialized_entries
+    assert serialized[0]['type'] == 'LogfileMatch'
+    assert serialized[0]['string'] == 'listening on 8080'
+    assert serialized[0]['match_indexes'] == [[0, 17]]
+    assert serialized[0]['path'] == log_path.strpath
+    assert serialized[1]['string'] == ''
+    assert serialized[3]['type'] == 'LogfileNotMatch'
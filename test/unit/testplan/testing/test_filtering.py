@@ -311,3 +311,104 @@ class TestFilterCompositions(object):
     def test_not(self):
         assert ~AlphaFilter() == filtering.Not(AlphaFilter())
         assert AlphaFilter() == ~~AlphaFilter()
+
+
+def _filter_context(filter_obj, multitest):
+    """Expected test context, by filtering each testcase."""
+    ctx = []
+    for suite in multitest.suites:
+        testcases = [
+            case.__name__ for case in suite.get_testcases().values()
+            if filter_obj.filter(multitest, suite, case)]
+        if testcases:
+            ctx.append((suite, testcases))
+    return ctx
+
+
+class NameLengthFilter(filtering.Filter):
+    """Custom filter that is not indexed."""
+
+    def filter_case(self, case):
+        return len(case.__name__) == 8
+
+
+class ExcludeTwoTags(filtering.Tags):
+    """Tag filter with a custom ``filter_case``."""
+
+    def filter_case(self, case):
+        return case.__name__ != 'test_two' and \
+            super(ExcludeTwoTags, self).filter_case(case)
+
+
+class ExcludeTwoPattern(filtering.Pattern):
+    """Pattern filter with a custom ``filter_case``."""
+
+    def filter_case(self, case):
+        return case.__name__ != 'test_two' and \
+            super(ExcludeTwoPattern, self).filter_case(case)
+
+
+class TestFilterIndex(object):
+
+    @pytest.mark.parametrize(
+        'filter_obj',
+        (
+            filtering.Filter(),
+            filtering.Tags('foo'),
+            filtering.Tags({'color': ('blue', 'green'), 'speed': 'fast'}),
+            filtering.TagsAll({'simple': 'bar', 'color': 'blue'}),
+            filtering.TagsAll({'simple': ('foo', 'baz')}),
+            filtering.Pattern('FFF'),
+            filtering.Pattern('XXX'),
+            filtering.Pattern('*:Beta - Custom'),
+            filtering.Pattern('*:*:test_t*'),
+            filtering.Pattern('F?F:[AG]*:test_[!t]*'),
+            filtering.Tags('bar') | filtering.Pattern('*:Gamma:test_four'),
+            filtering.Tags({'color': 'blue'}) & ~filtering.Tags('bar'),
+            ~(filtering.Pattern('*:Alpha') | filtering.TagsAll('baz')),
+            NameLengthFilter() & filtering.Tags({'speed': 'fast'}),
+            ~NameLengthFilter(),
+            ExcludeTwoTags({'color': 'blue', 'speed': 'fast'}),
+            ~ExcludeTwoTags({'color': 'blue'}),
+            ExcludeTwoPattern('*:*:test_t*') | filtering.Tags('baz'),
+            ExcludeTwoPattern('*:*:test_t*') & ~filtering.TagsAll(
+                {'color': 'red'}),
+            ~(ExcludeTwoTags('foo') | ExcludeTwoPattern('*:Beta - Custom')),
+        )
+    )
+    def test_select(self, filter_obj):
+        multitest = MultiTest(
+            name='FFF', suites=[Alpha(), Beta(), Gamma()],
+            test_filter=filter_obj)
+        ctx = [
+            (suite, [case.__name__ for case in testcases])
+            for suite, testcases in multitest.get_test_context()]
+        assert ctx == _filter_context(filter_obj, multitest)
+
+    def test_match_case_names(self):
+        multitest = MultiTest(name='FFF', suites=[Alpha(), Gamma()])
+        index = filtering.FilterIndex(
+            test=multitest,
+            suites=[(suite, list(suite.get_testcases().values()))
+                    for suite in multitest.suites])
+
+        assert len(index.all) == 7
+        assert index.match_case_names('test_one') == {0, 3}
+        assert index.match_case_names('test_t*') == {1, 2, 4, 5}
+        assert index.match_case_names('*o') == {1, 4}
+        assert index.match_case_names('test_six') == set()
+
+    def test_match_case_tags(self):
+        multitest = MultiTest(name='FFF', suites=[Alpha(), Gamma()])
+        index = filtering.FilterIndex(
+            test=multitest,
+            suites=[(suite, list(suite.get_testcases().values()))
+                    for suite in multitest.suites])
+
+        # Only built once a tag filter needs it
+        assert index._case_tags is None
+        assert index.match_case_tags({'color': ('blue', 'green')}) == \
+            {2, 5, 6}
+        assert index.match_case_tags(
+            {'color': ('blue', 'red')}, match_all=True) == {6}
+        assert index.match_case_tags({'speed': 'slow'}) == set()
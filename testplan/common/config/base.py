@@ -4,6 +4,7 @@ Module containing configuration objects and utilities.
 
 import copy
 
+import six
 from schema import Schema, Optional, And, Or, Use
 
 from testplan.common.utils.interface import check_signature
@@ -61,33 +62,58 @@ class Config(object):
     that can define default values and support inheritance.
     Configurations can have a parent-child relationship so that
     options not defined in the child, can be retrieved from parent.
+
+    Resolved option values are cached per configuration. The caches of all
+    configurations are invalidated whenever a parent relation is set, as it
+    can change the values resolved by the whole subtree.
+
+    The schema returned by ``configuration_schema`` is built once per
+    configuration class, so it must not depend on the instance.
     """
 
+    # Replaced on every parent change, caches of an older generation are stale
+    _generation = object()
+
     def __init__(self, **options):
         self._parent = None
+        self._resolved = {}
+        self._resolved_generation = Config._generation
         self._cfg_input = options
-        sch = self.configuration_schema()
-        cschema = sch if isinstance(sch, Schema) else Schema(sch)
-        self._options = cschema.validate(options)
+        self._options = self.schema.validate(options)
 
     def __getattr__(self, name):
-        options = self.__getattribute__('_options')
-        local_val = options[name] if name in options else ABSENT
-        parent_val = getattr(self.parent, name,
-                             ABSENT) if self.parent else ABSENT
-
-        if local_val is ABSENT and parent_val is ABSENT:
+        resolved = self.__getattribute__('_resolved')
+        if self.__getattribute__('_resolved_generation') \
+                is not Config._generation:
+            resolved.clear()
+            self._resolved_generation = Config._generation
+
+        value = resolved.get(name, ABSENT)
+        if value is ABSENT and name not in resolved:
+            value = resolved[name] = self._resolve(name)
+        if value is ABSENT:
             raise AttributeError('Name: {}'.format(name))
+        return value
 
+    def _resolve(self, name):
+        """
+        Return the local value of an option unless it is a default value,
+        otherwise the value of the parent, falling back to the default.
+        Returns ``ABSENT`` if the option is not found.
+        """
+        local_val = self._options.get(name, ABSENT)
         if local_val is not ABSENT and not isinstance(local_val,
                                                       DefaultValueWrapper):
             return local_val
-        elif parent_val is not ABSENT:
-            return parent_val
-        elif isinstance(local_val, DefaultValueWrapper):
+
+        if self.parent:
+            parent_val = getattr(self.parent, name, ABSENT)
+            if parent_val is not ABSENT:
+                return parent_val
+
+        if isinstance(local_val, DefaultValueWrapper):
             return local_val.value
-        raise RuntimeError('Error fetching attribute ({}) from {}'.format(
-            name, self))
+        return ABSENT
 
     def __repr__(self):
         return '{}{}'.format(self.__class__.__name__,
@@ -95,8 +121,14 @@ class Config(object):
 
     @property
     def schema(self):
-        """Returns the raw schema."""
-        return self._schema
+        """Returns the schema, built once per configuration class."""
+        cls = self.__class__
+        schema = cls.__dict__.get('_class_schema')
+        if schema is None:
+            sch = self.configuration_schema()
+            schema = sch if isinstance(sch, Schema) else Schema(sch)
+            cls._class_schema = schema
+        return schema
 
     @property
     def parent(self):
@@ -110,24 +142,67 @@ class Config(object):
             raise AttributeError('Cannot overwrite parent: {}'.format(
                 self._parent))
         self._parent = value
+        Config._generation = object()
 
     def copy(self, **options):
         """
         Create a new configuration object and replace its options with
-        the given option values.
+        the given option values. Option values are resolved and deep
+        copied, only the replaced options are validated again.
+        """
+        return self._copy(copy.deepcopy, options)
+
+    def shallow_copy(self, **options):
         """
-        # TODO dicuss problem validating DefaultValueWrapper values
+        Same as ``copy``, but the option values are shared with this
+        configuration instead of deep copied. Configurations are never
+        modified after creation, so the copy is safe as long as option
+        values are not modified in place either.
+        """
+        return self._copy(lambda value: value, options)
+
+    # API support
+    replace = copy
+
+    def _copy(self, copy_value, options):
         new_options = {}
         for key in self._options:
-            new_options[copy.deepcopy(key)] = copy.deepcopy(getattr(self, key))
-        new_options.update(options)
-        new = self.__class__(**new_options)
-        # parent makes the object non-serializable
-        # new.parent = self.parent
+            if key not in options:
+                new_options[key] = copy_value(getattr(self, key))
+
+        if type(self).__init__ is not Config.__init__:
+            return self.__class__(**dict(new_options, **options))
+
+        new = self.__class__.__new__(self.__class__)
+        new._parent = None  # parent makes the object non-serializable
+        new._resolved = {}
+        new._resolved_generation = Config._generation
+        new._cfg_input = dict(new_options, **options)
+        new._options = new_options
+        new._options.update(self._validate_subset(options))
         return new
 
-    # API support
-    replace = copy
+    def _validate_subset(self, options):
+        """
+        Validate the given options against their schema entries only, the
+        whole schema is validated if it has non string keys.
+        """
+        schema_dict = getattr(self.schema, '_schema')
+        keys = {}
+        for key in schema_dict:
+            real_key = getattr(key, '_schema', key)
+            if not isinstance(real_key, six.string_types):
+                return self.schema.validate(
+                    dict(self._cfg_input, **options))
+            keys[real_key] = key
+        subset = {
+            keys[name]: schema_dict[keys[name]]
+            for name in options if name in keys
+        }
+        return Schema(
+            subset,
+            ignore_extra_keys=getattr(self.schema, '_ignore_extra_keys', False)
+        ).validate(options)
 
     def configuration_schema(self):
         """
@@ -160,15 +235,10 @@ class Config(object):
         else:
             parent_schema_dict = parent_schema
 
+        target_keys = set(getattr(target_key, '_schema', target_key)
+                          for target_key in target_schema_dict)
         for parent_key in parent_schema_dict:
-            real_parent_key = getattr(parent_key, '_schema', parent_key)
-            found = False
-            for target_key in list(target_schema_dict.keys()):
-                real_target_key = getattr(target_key, '_schema', target_key)
-                if real_parent_key == real_target_key:
-                    found = True
-                    break
-            if not found:
+            if getattr(parent_key, '_schema', parent_key) not in target_keys:
                 target_schema_dict[parent_key] = parent_schema_dict[parent_key]
 
         ignore_extra_keys = getattr(target, '_ignore_extra_keys', False)
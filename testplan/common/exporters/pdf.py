@@ -1,20 +1,21 @@
 """
   Utilities for generating pdf files via Reportlab.
+
+  Reportlab is imported on first use, as the formatting helpers of this
+  module are also used for stdout rendering.
 """
 
 import itertools
 import six
 
-from reportlab.platypus import Table
-from reportlab.lib import colors
-
 from testplan.common.utils.comparison import is_regex
 from testplan.common.exporters import constants
 
 
 # If you increase this too much Reportlab starts having
-# performance issues and takes exponentially longer to render the PDF
-MAX_TABLE_ROWS = 1000
+# performance issues and takes exponentially longer to render the PDF,
+# as long tables are re-measured every time they are split across pages
+MAX_TABLE_ROWS = 100
 
 
 def _partition_data(data, max_rows):
@@ -45,40 +46,43 @@ def _partition_style(style, num_rows, max_rows):
     :type num_rows: ``int``
     :param max_rows: the maximum number of rows in each partition
     :type max_rows: ``int``
-    :return: a generator yielding a list of style commands
+    :return: an iterator yielding a list of style commands
             applicable for each new partition
-    :rtype: ``generator``
+    :rtype: ``iterator``
     """
-    for offset in six.moves.range(0, num_rows, max_rows):
-        end_row = min(offset + max_rows, num_rows) - 1
-        partition = []
+    # Bucket each command into the partitions it spans, rather than checking
+    # every command against every partition.
+    partitions = [[] for _ in six.moves.range(0, num_rows, max_rows)]
+
+    for command in style:
+        start = command[1][1]
+        end = command[2][1]
 
-        for command in style:
-            start = command[1][1]
-            end = command[2][1]
+        command_start = max(num_rows + start if start < 0 else start, 0)
+        command_end = min(num_rows + end if end < 0 else end, num_rows - 1)
 
-            command_start = num_rows + start if start < 0 else start
-            command_end = num_rows + end if end < 0 else end
-            command_rows = end_row - offset
+        if command_end < 0 or command_start >= num_rows:
+            # Not applicable at all
+            continue
 
-            if command_end < offset or command_start > end_row:
-                # Not applicable at all
-                continue
+        for idx in six.moves.range(
+                command_start // max_rows, command_end // max_rows + 1):
+            offset = idx * max_rows
+            end_row = min(offset + max_rows, num_rows) - 1
 
             partition_start = (
                 0 if command_start < offset else command_start - offset)
 
-            partition_end = (
-                command_rows if command_end > end_row else command_end - offset)
+            partition_end = min(command_end, end_row) - offset
 
             # Replace the old row indices with new ones,
             # but keep the rest of the tuple the same
-            partition.append(
+            partitions[idx].append(
                 (command[0], (command[1][0], partition_start),
                  (command[2][0], partition_end)) + command[3:]
             )
 
-        yield partition
+    return iter(partitions)
 
 
 def create_base_tables(data, style, col_widths, max_rows=MAX_TABLE_ROWS):
@@ -97,6 +101,7 @@ def create_base_tables(data, style, col_widths, max_rows=MAX_TABLE_ROWS):
     :return: a list of new tables
     :rtype: ``list`` of ``Table``
     """
+    from reportlab.platypus import Table
     zipped = six.moves.zip(
         _partition_data(data, max_rows=max_rows),
         _partition_style(style, len(data), max_rows=max_rows))
@@ -185,6 +190,7 @@ def _create_cell_styles(colour_matrix, display_index):
     :return: List of RowStyle objects indicating the colour of each cell.
     :rtype: ``list`` of ``testplan.common.exporters.pdf.RowStyle``
     """
+    from reportlab.lib import colors
     cell_styles = []
     for row_idx in range(len(colour_matrix)):
         for col_idx in range(len(colour_matrix[row_idx])):
@@ -241,6 +247,7 @@ def _create_sub_table(columns, rows, column_start, column_end, style,
                                                indices=row_indices)
 
     # Create the table and set it's style.
+    from reportlab.platypus import Table
     table = Table([sub_columns] + sub_rows)
 
     if colour_matrix:
@@ -172,6 +172,14 @@ class SliceComparisonField(fields.Field):
         )
 
 
+class UnmatchedRowField(fields.Field):
+    """Serialization logic for UnmatchedRow"""
+
+    def _serialize(self, value, attr, obj):
+        idx, row = value
+        return idx, native_or_pformat_list(row)
+
+
 class ColumnContainComparisonField(fields.Field):
     """Serialization logic for ColumnContainComparison"""
 
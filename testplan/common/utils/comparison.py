@@ -299,8 +299,9 @@ class Custom(Callable):
 
 
 # Do not change unless you know what you are doing
-# Making this larger will considerably slow down the comparison
-MAX_UNORDERED_COMPARE = 16
+# Every value is compared against every expected value, so making
+# this larger will considerably slow down the comparison
+MAX_UNORDERED_COMPARE = 500
 
 
 def compare_with_callable(callable_obj, value):
@@ -461,32 +462,33 @@ def _partition(results):
     return lhs_vals, rhs_vals
 
 
-def _cmp_dicts(lhs, rhs, ignore, only, coerce_values_to_string, report_all):
+def _should_ignore_key(key, lhs, ignore, only):
     """
-    Compares dictionaries
+        Decide if a key should be ignored.
+
+        Decision is based on ``ignore`` and ``only``.
+        If ``only`` is ``True`` then keys that are
+         not in ``lhs`` will be ignored.
     """
-    def should_ignore_key(key):
-        """
-            Decide if a key should be ignored.
+    if key in ignore:
+        should_ignore = True
+    elif only == []:  # Ignore everything
+        should_ignore = True
+    elif only is True:
+        should_ignore = key not in lhs
+    else:
+        should_ignore = bool(only and (key not in only))
+    return should_ignore
 
-            Decision is based on ``ignore`` and ``only``.
-            If ``only`` is ``True`` then keys that are
-             not in ``lhs`` will be ignored.
-        """
-        if key in ignore:
-            should_ignore = True
-        elif only == []:  # Ignore everything
-            should_ignore = True
-        elif only is True:
-            should_ignore = key not in lhs
-        else:
-            should_ignore = bool(only and (key not in only))
-        return should_ignore
 
+def _cmp_dicts(lhs, rhs, ignore, only, coerce_values_to_string, report_all):
+    """
+    Compares dictionaries
+    """
     results = []
     match = Match.IGNORED
     for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs):
-        if should_ignore_key(iter_key):
+        if _should_ignore_key(iter_key, lhs, ignore, only):
             if report_all:
                 results.append(_build_res(
                     key=iter_key,
@@ -503,6 +505,25 @@ def _cmp_dicts(lhs, rhs, ignore, only, coerce_values_to_string, report_all):
     return match, results
 
 
+def _cmp_values(lhs, rhs, coerce_values_to_string):
+    """
+    Compares plain values, optionally after converting them to strings
+    """
+    # pylint: disable=unidiomatic-typecheck
+    lhs_cmp = str(lhs) if coerce_values_to_string else lhs
+    rhs_cmp = str(rhs) if coerce_values_to_string else rhs
+    response = (type(lhs_cmp) == type(rhs_cmp)) and (lhs_cmp == rhs_cmp)
+    if coerce_values_to_string and not response:
+        if any(isinstance(val, float)
+               or isinstance(val, decimal.Decimal) for val in (lhs, rhs)):
+            lhs_cmp = lhs_cmp.rstrip('0').rstrip('.')\
+                if "." in lhs_cmp else lhs_cmp
+            rhs_cmp = rhs_cmp.rstrip('0').rstrip('.')\
+                if "." in rhs_cmp else rhs_cmp
+            response = lhs_cmp == rhs_cmp
+    return response
+
+
 def _rec_compare(
     lhs, rhs, ignore, only, key,
     coerce_values_to_string, report_all=True,
@@ -578,20 +599,8 @@ def _rec_compare(
 
     ## VALUES
     if lhs_cat == rhs_cat == Category.VALUE:
-        lhs_cmp = str(lhs) if coerce_values_to_string else lhs
-        rhs_cmp = str(rhs) if coerce_values_to_string else rhs
-        response = (type(lhs_cmp) == type(rhs_cmp)) and (lhs_cmp == rhs_cmp)
-        if coerce_values_to_string:
-            if any(isinstance(val, float)
-                   or isinstance(val, decimal.Decimal) for val in (lhs, rhs)):
-                if not response:
-                    lhs_cmp = lhs_cmp.rstrip('0').rstrip('.')\
-                        if "." in lhs_cmp else lhs_cmp
-                    rhs_cmp = rhs_cmp.rstrip('0').rstrip('.')\
-                        if "." in rhs_cmp else rhs_cmp
-                    response = lhs_cmp == rhs_cmp
-
-        match = Match.from_bool(response)
+        match = Match.from_bool(
+            _cmp_values(lhs, rhs, coerce_values_to_string))
         return _build_res(
             key=key,
             match=match,
@@ -709,22 +718,371 @@ def compare(lhs, rhs, ignore=None, only=None, report_all=True):
     return Match.to_bool(match), comparisons
 
 
+class _PlanNode(object):
+    """
+    .. warning::
+
+      Internal API.
+
+    Precomputed comparison state of a single expected value: its category,
+    report representation and the nodes of its items for containers.
+
+    Combinations that are not handled here are delegated to
+    ``_rec_compare``, so results are always the same as ``compare``.
+    """
+
+    def __init__(self, value, ignore, only):
+        self.value = value
+        self.category = _categorise(value)
+        self.formatted = None
+        self.str_value = None
+        self.children = None
+        self.items = None
+        self.ignored = None
+
+        if self.category == Category.VALUE:
+            self.formatted = fmt(value)
+            self.str_value = str(value)
+        elif self.category == Category.CALLABLE:
+            self.formatted = (0, 'func', callable_name(value))
+        elif self.category == Category.REGEX:
+            self.formatted = RegexAdapter.serialize(value)
+        elif self.category == Category.ITERABLE:
+            self.children = [_PlanNode(item, ignore, only) for item in value]
+        elif self.category == Category.DICT:
+            self.items = [
+                (key, _PlanNode(val, ignore, only))
+                for key, val in value.items()
+            ]
+            self.children = dict(self.items)
+            # Decisions for expected keys do not depend on the actual
+            # value unless ``only`` is ``True``.
+            if only is not True:
+                self.ignored = {
+                    key: _should_ignore_key(key, value, ignore, only)
+                    for key, _ in self.items
+                }
+
+    def compare(self, lhs, key, ignore, only,
+                coerce_values_to_string, report_all, fail_fast):
+        """
+        Compare ``lhs`` against the expected value, returns a result
+        tuple like ``_rec_compare``. If ``fail_fast`` is set, passing
+        results are not formatted and their values will be ``None``.
+        """
+        lhs_cat = _categorise(lhs)
+        rhs_cat = self.category
+
+        if lhs_cat == rhs_cat == Category.VALUE:
+            # Most values are equal as strings, try that first
+            passed = coerce_values_to_string and (
+                str(lhs) == self.str_value)
+            match = Match.from_bool(passed or _cmp_values(
+                lhs, self.value, coerce_values_to_string))
+            if fail_fast and match != Match.FAIL:
+                return _build_res(key, match, None, None)
+            return _build_res(
+                key=key, match=match, lhs=fmt(lhs), rhs=self.formatted)
+
+        if rhs_cat == Category.CALLABLE and lhs_cat != Category.CALLABLE:
+            result, error = compare_with_callable(
+                callable_obj=self.value, value=lhs)
+            match = Match.from_bool(result)
+            if fail_fast and match != Match.FAIL:
+                return _build_res(key, match, None, None)
+            return _build_res(
+                key=key,
+                match=match,
+                lhs='Value: {}, Error: {}'.format(
+                    lhs, error) if error else fmt(lhs),
+                rhs=self.formatted)
+
+        if rhs_cat == Category.REGEX and lhs_cat in (
+                Category.VALUE, Category.ITERABLE, Category.DICT):
+            match = RegexAdapter.match(regex=self.value, value=lhs)
+            if fail_fast and match != Match.FAIL:
+                return _build_res(key, match, None, None)
+            return _build_res(
+                key=key, match=match, lhs=fmt(lhs), rhs=self.formatted)
+
+        if lhs_cat == rhs_cat == Category.ITERABLE:
+            match, results = self._compare_iterable(
+                lhs, ignore, only, coerce_values_to_string,
+                report_all, fail_fast)
+            lhs_vals, rhs_vals = _partition(results)
+            return _build_res(
+                key=key, match=match, lhs=(1, lhs_vals), rhs=(1, rhs_vals))
+
+        if lhs_cat == rhs_cat == Category.DICT:
+            match, results = self.compare_dict(
+                lhs, ignore, only, coerce_values_to_string,
+                report_all, fail_fast)
+            lhs_vals, rhs_vals = _partition(results)
+            return _build_res(
+                key=key, match=match, lhs=(2, lhs_vals), rhs=(2, rhs_vals))
+
+        return _rec_compare(
+            lhs, self.value, ignore, only, key,
+            coerce_values_to_string, report_all=report_all)
+
+    def _compare_iterable(self, lhs, ignore, only,
+                          coerce_values_to_string, report_all, fail_fast):
+        """Compare items of an iterable against the item nodes."""
+        results = []
+        match = Match.IGNORED
+        for lhs_item, node in six.moves.zip_longest(lhs, self.children):
+            if node is None:
+                result = _rec_compare(
+                    lhs_item, None, ignore, only, key=None,
+                    coerce_values_to_string=coerce_values_to_string,
+                    report_all=report_all)
+            else:
+                result = node.compare(
+                    lhs_item, None, ignore, only,
+                    coerce_values_to_string, report_all, fail_fast)
+
+            match = Match.combine(match, result[1])
+            if fail_fast:
+                if result[1] == Match.FAIL:
+                    results.append(result)
+                    break
+            else:
+                results.append(result)
+        return match, results
+
+    def compare_dict(self, lhs, ignore, only,
+                     coerce_values_to_string, report_all, fail_fast):
+        """Compare a dictionary against the expected dictionary node."""
+        results = []
+        match = Match.IGNORED
+        children = self.children
+        ignored = self.ignored
+
+        def iter_nodes():
+            """Same order as ``_idictzip_all``, with expected nodes."""
+            for iter_key, lhs_val in lhs.items():
+                yield iter_key, lhs_val, children.get(iter_key)
+            for iter_key, node in self.items:
+                if iter_key not in lhs:
+                    yield iter_key, Absent, node
+
+        for iter_key, lhs_val, node in iter_nodes():
+            if node is not None and ignored is not None:
+                should_ignore = ignored[iter_key]
+            else:
+                should_ignore = _should_ignore_key(iter_key, lhs, ignore, only)
+
+            if should_ignore:
+                if report_all and not fail_fast:
+                    results.append(_build_res(
+                        key=iter_key,
+                        match=Match.IGNORED,
+                        lhs=fmt(lhs_val),
+                        rhs=fmt(Absent if node is None else node.value)))
+                continue
+
+            if node is None:
+                result = _rec_compare(
+                    lhs_val, Absent, ignore, only, iter_key,
+                    coerce_values_to_string, report_all=report_all)
+            else:
+                result = node.compare(
+                    lhs_val, iter_key, ignore, only,
+                    coerce_values_to_string, report_all, fail_fast)
+
+            match = Match.combine(match, result[1])
+            if fail_fast:
+                if result[1] == Match.FAIL:
+                    results.append(result)
+                    break
+            else:
+                results.append(result)
+        return match, results
+
+
+class MatchPlan(object):
+    """
+    An expected dictionary (or FIX message) compiled along with its
+    comparison flags, to be matched against many actual values.
+
+    Categories, report representations and ignore decisions of the
+    expected values are computed once, rather than on every call
+    like ``compare`` does. Plans can be passed as the ``expected``
+    argument of ``result.dict.match`` and ``result.fix.match``.
+
+    .. code-block:: python
+
+        plan = comparison.MatchPlan(
+            {'foo': 1, 'bar': comparison.Greater(5)}, ignore=['baz'])
+
+        for message in messages:
+            result.dict.match(message, plan)
+
+    :param value: object compared against each actual value
+    :type value: ``dict``-like interface (__contains__ and .items())
+    :param ignore: list of keys to ignore in the comparison
+    :type ignore: ``list``
+    :param only: list of keys to exclusively consider in the comparison
+    :type only: ``list``
+    :param fail_fast: stop at the first failing key and report
+                      failures only, passing keys are never formatted
+    :type fail_fast: ``bool``
+    """
+
+    def __init__(self, value, ignore=None, only=None, fail_fast=False):
+        if value is None or value is Absent:
+            raise ValueError('Cannot create a match plan for {}'.format(value))
+        self.value = value
+        self.ignore = ignore or []
+        self.only = only
+        self.fail_fast = fail_fast
+        self.typed_values = getattr(value, 'typed_values', False)
+        self._root = _PlanNode(value, self.ignore, only)
+
+    def compare(self, lhs, report_all=True):
+        """
+        Compare ``lhs`` against the expected value, see ``compare``.
+
+        :param lhs: object compared against the expected value
+        :type lhs: ``dict`` interface (``__contains__`` and ``.items()``)
+        :param report_all: include even ignored keys in report,
+                           has no effect in ``fail_fast`` mode
+        :type report_all: ``bool``
+
+        :return: Tuple of comparison bool ``(passed: True, failed: False)``
+                 and a description object for the testdb report
+        :rtype: ``tuple`` of (``bool``, ``list`` of ``tuple``)
+        """
+        if (lhs is None) or (lhs is Absent):
+            return (False, [_build_res(key=entry[0],
+                                       match=Match.FAIL,
+                                       lhs=fmt(lhs),
+                                       rhs=entry[1])
+                            for entry in fmt(self.value)[1]])
+
+        lhs_typed_values = getattr(lhs, 'typed_values', False)
+        coerce_values_to_string = not (
+            lhs_typed_values and self.typed_values)
+
+        match, comparisons = self._root.compare_dict(
+            lhs, self.ignore, self.only, coerce_values_to_string,
+            report_all, self.fail_fast)
+
+        # For the keys in only not matching anything,
+        # we report them as absent in expected and value.
+        if isinstance(self.only, list) and self.only \
+                and not self.fail_fast:
+            keys_found = set()
+            for elem in comparisons:
+                keys_found.add(elem[0])
+            for key in self.only:
+                if key not in keys_found:
+                    comparisons.append(
+                        (key, Match.IGNORED, Absent.descr, Absent.descr))
+
+        return Match.to_bool(match), comparisons
+
+
+def _solve_assignment(grid):
+    """
+    Hungarian algorithm (Kuhn-Munkres with potentials) for
+    a square matrix of integer costs, runs in O(n^3).
+
+    :param grid: Square matrix of costs.
+    :type grid: ``list`` of ``list`` of ``int``
+    :return: List mapping each row to its assigned column.
+    :rtype: ``list`` of ``int``
+    """
+    size = len(grid)
+    infinity = float('inf')
+
+    # 1-based indices, column 0 is a sentinel for the row being added
+    row_pots = [0] * (size + 1)
+    col_pots = [0] * (size + 1)
+    col_rows = [0] * (size + 1)
+    way = [0] * (size + 1)
+
+    # Start from column then row minimums and a greedy matching on
+    # the cells they make tight, so only the rows left unmatched need an
+    # augmenting path. Each row takes the lowest tight column left.
+    if size:
+        col_pots[1:] = [min(costs) for costs in zip(*grid)]
+    unmatched = []
+    for row_idx in range(1, size + 1):
+        reduced = [
+            cost - col_pot
+            for cost, col_pot in zip(grid[row_idx - 1], col_pots[1:])
+        ]
+        row_pots[row_idx] = min(reduced)
+        for col in range(1, size + 1):
+            if not col_rows[col] and reduced[col - 1] == row_pots[row_idx]:
+                col_rows[col] = row_idx
+                break
+        else:
+            unmatched.append(row_idx)
+
+    for row_idx in unmatched:
+        col_rows[0] = row_idx
+        col0 = 0
+        min_slack = [infinity] * (size + 1)
+        used = [False] * (size + 1)
+
+        while True:
+            used[col0] = True
+            row0 = col_rows[col0]
+            costs = grid[row0 - 1]
+            row_pot = row_pots[row0]
+            delta = infinity
+            col1 = 0
+
+            for col in range(1, size + 1):
+                if not used[col]:
+                    slack = costs[col - 1] - row_pot - col_pots[col]
+                    if slack < min_slack[col]:
+                        min_slack[col] = slack
+                        way[col] = col0
+                    if min_slack[col] < delta:
+                        delta = min_slack[col]
+                        col1 = col
+
+            for col in range(size + 1):
+                if used[col]:
+                    row_pots[col_rows[col]] += delta
+                    col_pots[col] -= delta
+                else:
+                    min_slack[col] -= delta
+
+            col0 = col1
+            if col_rows[col0] == 0:
+                break
+
+        # Flip the augmenting path
+        while col0:
+            col1 = way[col0]
+            col_rows[col0] = col_rows[col1]
+            col0 = col1
+
+    assignment = [0] * size
+    for col in range(1, size + 1):
+        assignment[col_rows[col] - 1] = col - 1
+
+    return assignment
+
+
 def _best_permutation(grid):
     """
     Given a square matrix of errors comparing actual
     value vs. expected value, finds the permutation which
     associates actual vs expected with the least error.
 
-    Be careful running this on of large grids, as the
-    runtime is expotential O(a^n). Sample run times on desktop hardware::
+    An optimal assignment is found via the Hungarian algorithm in O(n^3).
+    When several permutations have the same least error, the one found
+    first is kept: rows are matched in turn to the lowest column that can
+    still be part of an optimal assignment, so results stay stable for
+    a given grid. Sample run times on desktop hardware::
 
-      size:  0, ms:    0.002  size:  1, ms:    0.010  size:  2, ms:    0.022
-      size:  3, ms:    0.046  size:  4, ms:    0.105  size:  5, ms:    0.207
-      size:  6, ms:    0.434  size:  7, ms:    0.540  size:  8, ms:    1.351
-      size:  9, ms:    2.338  size: 10, ms:    5.470  size: 11, ms:    9.398
-      size: 12, ms:   21.651  size: 13, ms:   36.114  size: 14, ms:   79.871
-      size: 15, ms:  166.488  size: 16, ms:  363.120  size: 17, ms:  943.494
-      size: 18, ms: 1818.761  size: 19, ms: 2370.988  size: 20, ms: 9989.508
+      size:   4, ms:    0.044  size:  16, ms:    0.242  size:  50, ms:    2.043
+      size: 100, ms:   16.057  size: 200, ms:   76.308  size: 500, ms:  699.296
 
     e.g. for the grid::
 
@@ -740,43 +1098,7 @@ def _best_permutation(grid):
       - row 2 to col 0
 
     """
-
-    def bp_loop(outstanding, level, grid, grid_len, cache):
-        """
-            Recursively finds a solution by
-            progressively excluding poor permutations "paths"
-        """
-        if not outstanding:
-            return 0, []
-
-        # [(cost:int, indx:int)]
-        level_permutations = [(grid[level][indx], indx)
-                              for indx in outstanding]
-        level_permutations.sort()
-        min_cost = None
-        min_path = None
-        for cost, indx in level_permutations:
-            remaining = outstanding - frozenset([indx])
-            # memoise calls, for large grids
-            # this cuts down the amount of calls significantly
-            pair = cache.get(remaining, None)
-            if pair is None:
-                pair = bp_loop(remaining, level + 1, grid, grid_len, cache)
-                cache[remaining] = pair
-            sub_cost, sub_path = pair
-            this_cost = cost + sub_cost
-            this_path = [indx] + sub_path
-            if (min_cost is None) or (this_cost < min_cost):
-                min_cost = this_cost
-                min_path = this_path
-        return min_cost, min_path
-
-    grid_len = len(grid)
-
-    cache = {}
-
-    # list of int indices
-    return bp_loop(frozenset(range(grid_len)), 0, grid, grid_len, cache)[1]
+    return _solve_assignment(grid)
 
 
 # helper func, used to generate errors matrix
@@ -873,7 +1195,7 @@ def unordered_compare(
     .. note::
 
       It is possible to specify up to a maximum of
-      16 values or expected comparisons.
+      ``MAX_UNORDERED_COMPARE`` (500) values or expected comparisons.
 
     .. note::
 
@@ -908,12 +1230,13 @@ def unordered_compare(
     list_cmps = list(comparisons)
 
     # if either the values or expected comparisons
-    # exceed 16, then raise an exception:
+    # exceed MAX_UNORDERED_COMPARE, then raise an exception:
     # it would take too long to process
-    #  (expotential complexity algorithm involved)
+    #  (quadratic number of comparisons involved)
     if max(len(list_msgs), len(list_cmps)) > MAX_UNORDERED_COMPARE:
         raise Exception("Too many values being compared. "+
-                        "Unordered matching supports up to 16 comparisons")
+                        "Unordered matching supports up to {} "
+                        "comparisons".format(MAX_UNORDERED_COMPARE))
 
     # Generate fake comparisons or values in case that the number of values
     # is different from what was expected.
@@ -0,0 +1,238 @@
+"""
+Latency measurement utilities.
+
+Latencies are stored in a :py:class:`LatencyHistogram`, which keeps counts in
+log-linear buckets (in the spirit of HDR histograms), so that millions of
+samples take a few kilobytes and any percentile is reported within a bounded
+relative error.
+"""
+
+import math
+import time
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of non-negative integer values (microseconds by convention).
+
+    Values are counted exactly up to ``2 * 10 ** significant_figures``,
+    larger values are grouped in buckets with a relative width of at most
+    ``10 ** -significant_figures``.
+
+    :param significant_figures: Number of significant decimal digits
+      preserved for recorded values.
+    :type significant_figures: ``int``
+    """
+
+    def __init__(self, significant_figures=2):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(
+                '`significant_figures` must be between 1 and 5, got: {}'.format(
+                    significant_figures))
+        self.significant_figures = significant_figures
+        self._sub_bits = int(
+            math.ceil(math.log(2 * 10 ** significant_figures, 2)))
+        self._sub_count = 1 << self._sub_bits
+        self._half_count = self._sub_count >> 1
+        self._counts = [0] * self._sub_count
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.count
+
+    def _index(self, value):
+        """Return the index of the bucket that counts the given value."""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return (self._sub_count + (shift - 1) * self._half_count +
+                (value >> shift) - self._half_count)
+
+    def _highest_value(self, index):
+        """Return the highest value counted by the bucket at given index."""
+        if index < self._sub_count:
+            return index
+        index -= self._sub_count
+        shift = index // self._half_count + 1
+        sub_bucket = index % self._half_count + self._half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value, count=1):
+        """
+        Record a value.
+
+        :param value: Value to record, rounded to the nearest integer.
+        :type value: ``int`` or ``float``
+        :param count: Number of times the value is recorded.
+        :type count: ``int``
+        """
+        value = int(round(value))
+        if value < 0:
+            raise ValueError('Cannot record negative value: {}'.format(value))
+
+        index = self._index(value)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += count
+
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """
+        Add the values recorded by another histogram to this one.
+
+        :param other: Histogram with the same number of significant figures.
+        :type other: :py:class:`LatencyHistogram`
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError('Cannot merge histograms of different precision.')
+        if len(other._counts) > len(self._counts):
+            self._counts.extend(
+                [0] * (len(other._counts) - len(self._counts)))
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def reset(self):
+        """Discard all recorded values."""
+        self._counts = [0] * self._sub_count
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @property
+    def mean(self):
+        """Mean of the recorded values, ``None`` if there are none."""
+        return float(self.total) / self.count if self.count else None
+
+    def percentile(self, percentile):
+        """
+        Return the value at the given percentile, that is the smallest
+        recorded value that is greater than or equal to ``percentile`` percent
+        of the recorded values (within the precision of the histogram).
+
+        :param percentile: Percentile between 0 and 100.
+        :type percentile: ``int`` or ``float``
+        :return: Value at the percentile, ``None`` if there are no values.
+        :rtype: ``int``
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(
+                'Percentile must be between 0 and 100, got: {}'.format(
+                    percentile))
+        if not self.count:
+            return None
+
+        target = max(int(math.ceil(self.count * percentile / 100.0)), 1)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value(index), self.max)
+        return self.max
+
+    def percentiles(self, percentiles=(50, 90, 99, 99.9, 100)):
+        """
+        Return the values at the given percentiles.
+
+        :param percentiles: Percentiles between 0 and 100.
+        :type percentiles: ``iterable`` of ``int`` or ``float``
+        :return: Percentile, value pairs.
+        :rtype: ``list`` of ``tuple``
+        """
+        return [(pct, self.percentile(pct)) for pct in percentiles]
+
+
+class LatencyRecorder(object):
+    """
+    Pairs outbound and inbound messages by a correlation key and records
+    the time between them in a :py:class:`LatencyHistogram`.
+
+    :param key: Function that returns the correlation key of a message, or
+      ``None`` if the message should not be recorded. By default messages are
+      their own keys.
+    :type key: ``callable``
+    :param significant_figures: Precision of the histogram.
+    :type significant_figures: ``int``
+    """
+
+    def __init__(self, key=None, significant_figures=2):
+        self.key = key
+        self.histogram = LatencyHistogram(
+            significant_figures=significant_figures)
+        self.unmatched = 0
+        self._pending = {}
+
+    def __len__(self):
+        return len(self.histogram)
+
+    @property
+    def pending(self):
+        """Number of sent messages that have not been replied to yet."""
+        return len(self._pending)
+
+    def _key(self, msg):
+        return self.key(msg) if self.key else msg
+
+    def sent(self, msg, tsp=None):
+        """
+        Record an outbound message.
+
+        :param msg: Message sent.
+        :type msg: ``object``
+        :param tsp: Timestamp when msg sent (in microseconds from epoch),
+          defaults to now.
+        :type tsp: ``float``
+        """
+        key = self._key(msg)
+        if key is not None:
+            self._pending[key] = time.time() * 1000000 if tsp is None else tsp
+
+    def received(self, msg, tsp=None):
+        """
+        Record an inbound message, and the latency since the message
+        with the same key was sent.
+
+        :param msg: Message received.
+        :type msg: ``object``
+        :param tsp: Timestamp when msg received (in microseconds from epoch),
+          defaults to now.
+        :type tsp: ``float``
+        :return: Latency in microseconds, ``None`` if no message with the
+          same key is pending.
+        :rtype: ``float``
+        """
+        key = self._key(msg)
+        if key is None:
+            return None
+        sent_tsp = self._pending.pop(key, None)
+        if sent_tsp is None:
+            self.unmatched += 1
+            return None
+
+        latency = max((time.time() * 1000000 if tsp is None else tsp) -
+                      sent_tsp, 0)
+        self.histogram.record(latency)
+        return latency
+
+    def reset(self):
+        """Discard all recorded latencies and pending messages."""
+        self.histogram.reset()
+        self.unmatched = 0
+        self._pending = {}
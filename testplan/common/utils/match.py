@@ -2,6 +2,345 @@
 Module of utility types and functions that perform matching.
 """
 import os
+import re
+import time
+import mmap
+
+import six
+
+from testplan.common.utils.timing import TimeoutException
+
+
+class FileRegexMatcher(object):
+    """
+    Matches regular expressions against the lines of a file that is being
+    written to, e.g. the log of a starting process.
+
+    The file is read incrementally from the position of the previous
+    :py:meth:`update` call, and a regular expression is no longer tested
+    once it has matched a line. Repeated updates therefore only cost
+    the bytes appended to the file since the last one.
+
+    :param path: Path of the file.
+    :type path: ``str``
+    :param regexps: Regular expressions to match, any named groups they match
+      are made available through ``extracts``.
+    :type regexps: ``list`` of ``_sre.SRE_Pattern``
+    :param chunk_size: Number of bytes to read from the file at once.
+    :type chunk_size: ``int``
+    """
+
+    def __init__(self, path, regexps, chunk_size=1024 * 1024):
+        self.path = path
+        self.regexps = list(regexps)
+        self.unmatched = list(regexps)
+        self.extracts = {}
+        self.chunk_size = chunk_size
+        self._position = 0
+        self._partial = b''
+        self._size = None
+
+    @property
+    def matched(self):
+        """``True`` if all regular expressions have matched."""
+        return not self.unmatched
+
+    def reset(self):
+        """Forget all matches and read the file again from the start."""
+        self.unmatched = list(self.regexps)
+        self.extracts = {}
+        self._position = 0
+        self._partial = b''
+        self._size = None
+
+    def _match_line(self, line):
+        """
+        Test the regular expressions that have not matched yet against
+        the given line and return the ones that match it.
+        """
+        text = None
+        matched = []
+        for regexp in self.unmatched:
+            if isinstance(regexp.pattern, bytes):
+                match = regexp.match(line)
+            else:
+                if text is None:
+                    text = line.decode('utf-8', 'replace').replace(
+                        '\r\n', '\n')
+                match = regexp.match(text)
+            if match:
+                self.extracts.update(match.groupdict())
+                matched.append(regexp)
+        return matched
+
+    def update(self):
+        """
+        Match the lines appended to the file since the last update.
+
+        :return: ``True`` if all regular expressions have matched.
+        :rtype: ``bool``
+        """
+        if not self.unmatched:
+            return True
+
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return False
+
+        if size < self._position:
+            # Truncated or replaced by a new file
+            self.reset()
+        elif size == self._size:
+            return False
+        self._size = size
+
+        with open(self.path, 'rb') as source:
+            source.seek(self._position)
+            while self.unmatched:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                self._position += len(chunk)
+                lines = (self._partial + chunk).split(b'\n')
+                self._partial = lines.pop()
+                for line in lines:
+                    for regexp in self._match_line(line + b'\n'):
+                        self.unmatched.remove(regexp)
+                    if not self.unmatched:
+                        break
+
+        if self.unmatched and self._partial:
+            # The last line may never be terminated but may also still be
+            # being written, so its matches only count if they complete
+            # the set and are otherwise tried again on the next update.
+            if len(self._match_line(self._partial)) == len(self.unmatched):
+                self.unmatched = []
+
+        return not self.unmatched
+
+
+class LogMatcher(object):
+    """
+    Waits for patterns to be written to a log file.
+
+    The matcher keeps a position in the file, each successful :py:meth:`match`
+    moves it past the matched text so consecutive waits continue where the
+    previous one stopped. The file is memory mapped and searched in place,
+    while waiting only the bytes appended since the previous search are
+    scanned again, along with the last ``overlap`` bytes of complete lines
+    so that patterns spanning several lines match once their last line is
+    written.
+
+    .. code-block:: python
+
+        env.app.log_matcher.seek_eof()
+        env.client.send(b'order')
+        match = env.app.log_matcher.match(r'.*Order (?P<id>\\d+) accepted')
+
+    :param log_path: Path of the log file.
+    :type log_path: ``str``
+    :param interval: Seconds to sleep between checks for new data.
+    :type interval: ``float``
+    :param overlap: Bytes of complete lines searched again on every check.
+    :type overlap: ``int``
+    """
+
+    def __init__(self, log_path, interval=0.01, overlap=64 * 1024):
+        self.log_path = log_path
+        self.interval = interval
+        self.overlap = overlap
+        self.position = 0
+        self.marks = {}
+        self._patterns = {}
+
+    def _size(self):
+        if self.log_path is None:
+            return 0
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def _offset(self, mark, default):
+        """Return the offset of a mark name or offset."""
+        if mark is None:
+            return default
+        if isinstance(mark, six.string_types):
+            return self.marks[mark]
+        return mark
+
+    def seek(self, mark=0):
+        """
+        Move the position to the given offset or mark.
+
+        :param mark: Offset in bytes or name of a mark.
+        :type mark: ``int`` or ``str``
+        """
+        self.position = self._offset(mark, 0)
+
+    def seek_eof(self):
+        """Move the position to the current end of the file."""
+        self.position = self._size()
+
+    def mark(self, name):
+        """
+        Record the current end of the file under a name, for later use by
+        :py:meth:`seek` and :py:meth:`get_between`.
+
+        :param name: Mark name.
+        :type name: ``str``
+        :return: Offset of the mark.
+        :rtype: ``int``
+        """
+        self.marks[name] = self._size()
+        return self.marks[name]
+
+    def _compile(self, regex):
+        """
+        Return the compiled regex and its equivalent bytes pattern that is
+        used for searching the mapped file.
+        """
+        if isinstance(regex, (six.string_types, bytes)):
+            regex = re.compile(regex)
+        if isinstance(regex.pattern, bytes):
+            return regex, regex
+        key = (regex.pattern, regex.flags)
+        if key not in self._patterns:
+            self._patterns[key] = re.compile(
+                regex.pattern.encode('utf-8'), regex.flags & ~re.UNICODE)
+        return regex, self._patterns[key]
+
+    def _search(self, regex, pattern, start):
+        """
+        Search the file for pattern from start offset.
+
+        :return: Match of the regex (``None`` if not found), end offset of
+          the match in the file, or else the offset from which the search
+          should resume.
+        :rtype: ``tuple``
+        """
+        if self.log_path is None:
+            return None, start
+        try:
+            fobj = open(self.log_path, 'rb')
+        except IOError:
+            return None, start
+        with fobj:
+            size = os.fstat(fobj.fileno()).st_size
+            if size <= start:
+                return None, start
+            mapped = mmap.mmap(fobj.fileno(), size, access=mmap.ACCESS_READ)
+            try:
+                match = pattern.search(mapped, start, size)
+                if match:
+                    span = match.span()
+                    del match
+                    return self._match_lines(regex, mapped, span), span[1]
+                # Matches that are not yet complete can only begin after
+                # the last complete line, or within the overlap before it
+                # for patterns that span several lines.
+                boundary = mapped.rfind(b'\n', start, size) + 1 or start
+                if boundary - start <= self.overlap:
+                    return None, start
+                return None, mapped.rfind(
+                    b'\n', start, boundary - self.overlap) + 1 or start
+            finally:
+                mapped.close()
+
+    @staticmethod
+    def _match_lines(regex, mapped, span):
+        """
+        Search the regex again over a copy of the lines of the match found
+        in the mapped file, starting from the offset of the match in the
+        copy, so that the returned match sees the same surrounding text.
+        """
+        first = mapped.rfind(b'\n', 0, span[0]) + 1
+        last = mapped.find(b'\n', span[1])
+        if last < 0:
+            last = len(mapped)
+        text = mapped[first:last]
+        pos = span[0] - first
+        if not isinstance(regex.pattern, bytes):
+            pos = len(text[:pos].decode('utf-8', 'replace'))
+            text = text.decode('utf-8', 'replace')
+        return regex.search(text, pos)
+
+    def match(self, regex, timeout=5, raise_on_timeout=True):
+        """
+        Wait until the regex matches text written to the file after the
+        current position, and move the position to the end of the match.
+
+        :param regex: Regular expression.
+        :type regex: ``str``, ``bytes`` or ``_sre.SRE_Pattern``
+        :param timeout: Seconds to wait for a match.
+        :type timeout: ``int`` or ``float``
+        :param raise_on_timeout: Raise ``TimeoutException`` if no match
+          is found in time, otherwise return ``None``.
+        :type raise_on_timeout: ``bool``
+        :return: Match of the regex, against the lines of the file that
+          contain the matched text.
+        :rtype: ``_sre.SRE_Match``
+        """
+        regex, pattern = self._compile(regex)
+        deadline = time.time() + timeout
+        start = self.position
+        while True:
+            match, offset = self._search(regex, pattern, start)
+            if match is not None:
+                break
+            start = offset
+            if time.time() >= deadline:
+                if raise_on_timeout:
+                    raise TimeoutException(
+                        'No match for {!r} in {} after {} seconds.'.format(
+                            regex.pattern, self.log_path, timeout))
+                return None
+            time.sleep(self.interval)
+
+        self.position = offset
+        return match
+
+    def not_match(self, regex, timeout=5):
+        """
+        Wait for the timeout and raise if the regex matches text written to
+        the file after the current position.
+
+        :param regex: Regular expression.
+        :type regex: ``str``, ``bytes`` or ``_sre.SRE_Pattern``
+        :param timeout: Seconds to wait for a match.
+        :type timeout: ``int`` or ``float``
+        """
+        match = self.match(regex, timeout=timeout, raise_on_timeout=False)
+        if match is not None:
+            raise Exception('Unexpected match for {!r} in {}: {!r}'.format(
+                match.re.pattern, self.log_path, match.group(0)))
+
+    def _read(self, start, end):
+        with open(self.log_path, 'rb') as fobj:
+            fobj.seek(start)
+            return fobj.read(end - start)
+
+    def get_between(self, mark_a=None, mark_b=None):
+        """
+        Return the content of the file between two offsets or marks.
+
+        :param mark_a: Start offset or mark name, defaults to the start of
+          the file.
+        :type mark_a: ``int`` or ``str``
+        :param mark_b: End offset or mark name, defaults to the end of
+          the file.
+        :type mark_b: ``int`` or ``str``
+        :return: File content.
+        :rtype: ``bytes``
+        """
+        start = self._offset(mark_a, 0)
+        end = self._offset(mark_b, None)
+        if end is None:
+            end = self._size()
+        if end <= start:
+            return b''
+        return self._read(start, end)
 
 
 def match_regexps_in_file(logpath, log_extracts, return_unmatched=False):
@@ -16,20 +355,9 @@ def match_regexps_in_file(logpath, log_extracts, return_unmatched=False):
             return False, extracted_values, log_extracts
         return False, extracted_values
 
-    extracts_status = [False for _ in log_extracts]
-
-    with open(logpath, 'r') as log:
-        for line in log:
-            for pos, regexp in enumerate(log_extracts):
-                match = regexp.match(line)
-                if match:
-                    extracted_values.update(match.groupdict())
-                    extracts_status[pos] = True
+    matcher = FileRegexMatcher(logpath, log_extracts)
+    matcher.update()
 
     if return_unmatched:
-        unmatched = [
-            exc for idx, exc in enumerate(log_extracts)
-            if not extracts_status[idx]
-        ]
-        return all(extracts_status), extracted_values, unmatched
-    return all(extracts_status), extracted_values
+        return matcher.matched, matcher.extracts, matcher.unmatched
+    return matcher.matched, matcher.extracts
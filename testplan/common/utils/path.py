@@ -105,6 +105,28 @@ class StdFiles(object):
         self.out.close()
 
 
+def replace_file(src, dst):
+    """
+    Rename a file, replacing the destination if it exists, which
+    ``os.rename`` does not do on Windows.
+
+    :param src: Path of the file to rename.
+    :type src: ``str``
+    :param dst: Destination path.
+    :type dst: ``str``
+    """
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)  # pylint: disable=no-member
+        return
+    try:
+        os.rename(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+        os.remove(dst)
+        os.rename(src, dst)
+
+
 def instantiate(template, values, destination):
     """
     Instantiate a templated file with a set of values and
@@ -1,10 +1,12 @@
 """System process utilities module."""
 
+import os
 import time
 import signal
-import psutil
 import warnings
 
+import six
+
 import subprocess
 import platform
 import threading
@@ -23,33 +25,61 @@ def _log_proc(msg, warn=False, output=None):
         warnings.warn(msg)
 
 
-def kill_process(proc, timeout=5, signal_=None, output=None):
+def _process_group(proc):
     """
-    If alive, kills the process.
-    First call ``terminate()`` or pass ``signal_`` if specified
-    to terminate for up to time specified in timeout parameter.
+    Return the process group id of a process that leads its own group,
+    ``None`` otherwise or on platforms without process groups.
+    """
+    if not hasattr(os, 'killpg'):
+        return None
+    try:
+        pgid = os.getpgid(proc.pid)
+    except OSError:
+        return None
+    return pgid if pgid == proc.pid else None
 
-    If process hangs then call ``kill()``.
 
-    :param proc: process to kill
+def terminate_process(proc, signal_=None, output=None):
+    """
+    Send ``signal_`` (``SIGTERM`` by default) to a process and its
+    descendants without waiting for them to exit.
+
+    If the process leads its own process group (e.g. it was started with
+    :py:data:`NEW_SESSION_KWARGS`), the whole group is signalled, which also
+    reaches grandchildren. Otherwise descendants are signalled one by one.
+
+    :param proc: process to terminate
     :type proc: ``subprocess.Popen``
-    :param timeout: timeout in seconds, defaults to 5 seconds
-    :type timeout: ``int``
+    :param signal_: signal to send, defaults to ``SIGTERM``
+    :type signal_: ``int``
     :param output: Optional file like object for writing logs.
     :type output: ``file``
+    :return: Process group id and descendants, to be passed to
+      :py:func:`reap_process`.
+    :rtype: ``tuple``
     """
     _log = functools.partial(_log_proc, output=output)
 
-    retcode = proc.poll()
-    if retcode is not None:
-        return retcode
+    import psutil
+    pgid = _process_group(proc)
+    try:
+        children = psutil.Process(proc.pid).children(recursive=True)
+    except psutil.Error:
+        children = []
 
-    parent = psutil.Process(proc.pid)
-    for child in parent.children():
+    if pgid is not None:
+        try:
+            os.killpg(pgid, signal_ or signal.SIGTERM)
+            return pgid, children
+        except OSError as exc:
+            _log(msg='While terminating process group - {}'.format(exc),
+                 warn=True)
+
+    for child in children:
         try:
             child.send_signal(signal.SIGTERM)
         except Exception as exc:
-            _log (
+            _log(
                 msg='While terminating child proc - {}'.format(exc),
                 warn=True
             )
@@ -58,32 +88,140 @@ def kill_process(proc, timeout=5, signal_=None, output=None):
         proc.send_signal(signal_)
     else:
         proc.terminate()
+    return pgid, children
+
 
+def wait_process(proc, timeout):
+    """
+    Wait for a process to exit.
+
+    :param proc: process to wait for
+    :type proc: ``subprocess.Popen``
+    :param timeout: timeout in seconds
+    :type timeout: ``int`` or ``float``
+    :return: Return code, ``None`` if the process is still alive.
+    :rtype: ``int`` or ``NoneType``
+    """
     begin = time.time()
-    intervals = exponential_interval(initial=0.05, multiplier=1.1, maximum=1)
+    intervals = exponential_interval(
+        initial=0.001, multiplier=2, maximum=0.05)
 
-    while time.time() - begin >= timeout and retcode is None:
+    retcode = proc.poll()
+    while retcode is None and time.time() - begin < timeout:
+        time.sleep(next(intervals))
         retcode = proc.poll()
+    return retcode
+
 
-        if retcode is None:
-            time.sleep(next(intervals))
+def reap_process(proc, terminated, output=None):
+    """
+    Kill a process, the rest of its process group and the descendants
+    returned by :py:func:`terminate_process` that are still alive, then
+    wait for the process.
 
-    if retcode is None:
+    :param proc: process to reap
+    :type proc: ``subprocess.Popen``
+    :param terminated: return value of :py:func:`terminate_process`
+    :type terminated: ``tuple``
+    :param output: Optional file like object for writing logs.
+    :type output: ``file``
+    :return: Return code of the process.
+    :rtype: ``int``
+    """
+    import psutil
+    _log = functools.partial(_log_proc, output=output)
+    pgid, children = terminated
+    children = list(children)
+
+    if pgid is not None:
+        if proc.returncode is None:
+            # The group id cannot be reused while its unreaped leader
+            # holds it, even as a zombie.
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except OSError:
+                pass  # No process left in the group
+        else:
+            # Once the leader is reaped, the group id can be reused after
+            # its last member exits, so members are killed one by one.
+            children.extend(_group_members(pgid))
+
+    if proc.poll() is None:
         try:
             _log(msg='Binary still alive, killing it')
             proc.kill()
-            proc.wait()
         except OSError as error:
             _log(
                 msg='Could not kill process - {}'.format(error),
                 warn=True
             )
 
+    for child in children:
+        try:
+            child.kill()
+        except psutil.Error:
+            pass
+
+    proc.wait()
     return proc.returncode
 
 
+def _group_members(pgid):
+    """
+    Return the processes in the process group with the given id.
+
+    :param pgid: process group id
+    :type pgid: ``int``
+    :return: processes of the group
+    :rtype: ``list`` of ``psutil.Process``
+    """
+    import psutil
+    members = []
+    for process in psutil.process_iter():
+        try:
+            if os.getpgid(process.pid) == pgid:
+                members.append(process)
+        except (OSError, psutil.Error):
+            pass  # Exited meanwhile
+    return members
+
+
+def kill_process(proc, timeout=5, signal_=None, output=None):
+    """
+    If alive, kills the process.
+    First call ``terminate()`` or pass ``signal_`` if specified
+    to terminate for up to time specified in timeout parameter.
+
+    If process hangs then call ``kill()``. Descendants of the process are
+    signalled as well, see :py:func:`terminate_process`.
+
+    :param proc: process to kill
+    :type proc: ``subprocess.Popen``
+    :param timeout: timeout in seconds, defaults to 5 seconds
+    :type timeout: ``int``
+    :param output: Optional file like object for writing logs.
+    :type output: ``file``
+    """
+    retcode = proc.poll()
+    if retcode is not None:
+        return retcode
+
+    terminated = terminate_process(proc, signal_=signal_, output=output)
+    wait_process(proc, timeout)
+    return reap_process(proc, terminated, output=output)
+
+
 DEFAULT_CLOSE_FDS = platform.system() != 'Windows'
 
+# Popen arguments that start the process in a new session, so that
+# it leads a process group which can be signalled as a whole.
+if platform.system() == 'Windows':
+    NEW_SESSION_KWARGS = {}
+elif six.PY2:
+    NEW_SESSION_KWARGS = {'preexec_fn': os.setsid}
+else:
+    NEW_SESSION_KWARGS = {'start_new_session': True}
+
 
 def subprocess_popen(
         args, bufsize=0, executable=None, stdin=None,
@@ -1,8 +1,12 @@
 """TCP Client module."""
 
 import time
+import array
 import socket
 
+# Maximum number of buffers passed to a single ``sendmsg`` call (IOV_MAX)
+SENDMSG_MAX_BUFFERS = 1024
+
 
 class Client(object):
     """
@@ -66,6 +70,57 @@ class Client(object):
         size = self._client.send(msg)
         return tsp, size
 
+    def send_many(self, msgs):
+        """
+        Send the given messages back to back. Messages are written with
+        scatter-gather ``sendmsg`` calls where available, so that they are
+        not copied into a single buffer first.
+
+        :param msgs: Messages to be sent.
+        :type msgs: ``list`` of ``bytes``
+
+        :return: Timestamps when each msg was sent (in microseconds from
+                 epoch) and total number of bytes sent. Messages written by
+                 the same call share the timestamp taken before the call.
+        :rtype: ``tuple`` of ``array.array`` of ``float`` and ``int``
+        """
+        msgs = list(msgs)
+        tsps = array.array('d')
+        size = 0
+        for idx in range(0, len(msgs), SENDMSG_MAX_BUFFERS):
+            batch = msgs[idx:idx + SENDMSG_MAX_BUFFERS]
+            tsp = time.time() * 1000000
+            if hasattr(self._client, 'sendmsg'):
+                size += self._sendmsg_all(batch)
+            else:
+                data = b''.join(batch)
+                self._client.sendall(data)
+                size += len(data)
+            tsps.extend([tsp] * len(batch))
+        return tsps, size
+
+    def _sendmsg_all(self, buffers):
+        """
+        Write all buffers with ``sendmsg``, which may write them partially.
+
+        :param buffers: Data to be sent.
+        :type buffers: ``list`` of ``bytes``
+
+        :return: Number of bytes sent
+        :rtype: ``int``
+        """
+        buffers = [memoryview(buf) for buf in buffers]
+        total = sum(len(buf) for buf in buffers)
+        idx = 0
+        while idx < len(buffers):
+            sent = self._client.sendmsg(buffers[idx:])
+            while idx < len(buffers) and sent >= len(buffers[idx]):
+                sent -= len(buffers[idx])
+                idx += 1
+            if sent:
+                buffers[idx] = buffers[idx][sent:]
+        return total
+
     def receive(self, size, timeout=30):
         """
         Receive a message.
@@ -89,6 +144,53 @@ class Client(object):
             raise
         return msg
 
+    def receive_many(self, size, count, timeout=30):
+        """
+        Receive a number of fixed size messages.
+
+        Data is read directly into a preallocated buffer, as much as is
+        available on every read, so that messages are not received one by one.
+
+        :param size: Size of each message in bytes.
+        :type size: ``int``
+        :param count: Number of messages to receive.
+        :type count: ``int``
+        :param timeout: Timeout in seconds for receiving all messages.
+        :type timeout: ``int``
+
+        :return: messages received, fewer than ``count`` if the connection was
+                 closed, and timestamps when each was received (in
+                 microseconds from epoch). Messages completed by the same
+                 read share the timestamp taken after the read.
+        :rtype: ``tuple`` of ``list`` of ``bytes`` and
+                ``array.array`` of ``float``
+        """
+        buf = bytearray(size * count)
+        view = memoryview(buf)
+        tsps = array.array('d')
+        deadline = None if timeout is None else time.time() + timeout
+        received = 0
+        while received < len(buf):
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise socket.timeout('timed out')
+                self._client.settimeout(remaining)
+            else:
+                self._client.settimeout(None)
+            nbytes = self._client.recv_into(view[received:])
+            if not nbytes:
+                break  # Connection closed
+            received += nbytes
+            completed = received // size
+            if completed > len(tsps):
+                tsps.extend(
+                    [time.time() * 1000000] * (completed - len(tsps)))
+
+        msgs = [bytes(buf[idx * size:(idx + 1) * size])
+                for idx in range(len(tsps))]
+        return msgs, tsps
+
     def recv(self, bufsize, flags=0):
         """
         Proxy for Python's ``socket.recv()``.
@@ -1,12 +1,17 @@
 """Fix TCP client module."""
 
 import time
+import array
 import socket
 
+from testplan.common.utils.sockets.fix.framer import Framer
 from testplan.common.utils.sockets.fix.utils import utc_timestamp
 
 from .parser import tagsoverride
 
+# Messages sent in a batch are coalesced into writes of about this size
+COALESCE_SIZE = 65536
+
 
 class Client(object):
     """
@@ -69,6 +74,7 @@ class Client(object):
         self.codec = codec
         self.connection_name = "{}:{}:{}_{}{}".format(
             self.sender, self.target, self.sendersub, self.host, self.port)
+        self._framer = Framer()
 
     @property
     def address(self):
@@ -132,17 +138,88 @@ class Client(object):
         msgstr = msg.to_wire(self.codec)
 
         tsp = time.time() * 1000000
-        self.socket.send(msgstr)
+        self.socket.sendall(msgstr)
         return tsp, msg
 
+    def send_many(self, msgs):
+        """
+        Send a batch of messages, stamping session tags on each.
+
+        Messages are coalesced into large writes instead of
+        being written one by one.
+
+        :return: Timestamps when each msg was sent (in microseconds from
+          epoch) and the messages sent. Messages coalesced in the same
+          write share the timestamp taken before the write.
+        :rtype: ``tuple`` of ``array.array`` of ``float`` and ``list``
+        """
+        msgs = [self._populate_tags(msg) for msg in msgs]
+        self.log_callback('Sending {} msgs.'.format(len(msgs)))
+
+        tsps = array.array('d')
+        data = bytearray()
+        pending = 0
+        for msg in msgs:
+            data.extend(msg.to_wire(self.codec))
+            pending += 1
+            if len(data) >= COALESCE_SIZE:
+                tsps.extend([time.time() * 1000000] * pending)
+                self.socket.sendall(data)
+                data = bytearray()
+                pending = 0
+        if pending:
+            tsps.extend([time.time() * 1000000] * pending)
+            self.socket.sendall(data)
+        return tsps, msgs
+
     def receive(self, timeout=30):
         """
         Receive a FIX message.
-        """
-        self.socket.settimeout(float(timeout))
-        data = self.socket.recv(4096)
+
+        Messages that arrived along with the returned one are buffered
+        and returned by subsequent calls without reading the socket.
+
+        Raises ``socket.timeout`` if no complete message is
+        received within ``timeout`` seconds.
+        """
+        data = self._framer.next_frame()
+        timeout = float(timeout)
+        deadline = time.time() + timeout
+        while data is None:
+            if timeout:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise socket.timeout('timed out')
+                self.socket.settimeout(remaining)
+            else:
+                self.socket.settimeout(0.0)  # Non-blocking
+            if not self._framer.recv_into(self.socket):
+                # Connection closed, return what was received
+                data = self._framer.drain()
+            else:
+                data = self._framer.next_frame()
         return self.msgclass.from_buffer(data, self.codec)
 
+    def receive_many(self, count, timeout=30):
+        """
+        Receive a batch of FIX messages.
+
+        Raises ``socket.timeout`` if ``count`` messages are not
+        received within ``timeout`` seconds.
+
+        :return: Messages received and timestamps when each was received
+          (in microseconds from epoch).
+        :rtype: ``tuple`` of ``list`` and ``array.array`` of ``float``
+        """
+        deadline = time.time() + float(timeout)
+        msgs = []
+        tsps = array.array('d')
+        while len(msgs) < count:
+            msgs.append(self.receive(
+                timeout=max(deadline - time.time(), 0.000001)))
+            tsps.append(time.time() * 1000000)
+        return msgs, tsps
+
     def sendlogoff(self, custom_tags=None):
         """
         Send logoff message.
@@ -0,0 +1,191 @@
+"""Incremental framing of FIX messages read from a stream socket."""
+
+SEPARATOR = b'\x01'
+BEGIN_STRING = b'8='
+BODY_LENGTH = b'9='
+CHECKSUM = b'10='
+
+
+class Framer(object):
+    """
+    Cuts complete FIX messages out of a byte stream.
+
+    A single read from a socket may contain several messages or only part of
+    one, so received data is accumulated in a reusable receive buffer and
+    messages are delimited using the BeginString (8), BodyLength (9) and
+    CheckSum (10) fields. If BodyLength does not point to a CheckSum field,
+    the message is delimited by the next CheckSum field instead.
+
+    Bytes that precede a BeginString field are discarded.
+    """
+
+    def __init__(self, bufsize=65536, separator=SEPARATOR):
+        """
+        Create a new framer.
+
+        :param bufsize: Initial size of the receive buffer, it will grow if
+          a message does not fit into it.
+        :type bufsize: ``int``
+        :param separator: FIX field separator.
+        :type separator: ``bytes``
+        """
+        self.separator = separator
+        self._buffer = bytearray(bufsize)
+        self._start = 0  # Start of data not yet framed
+        self._end = 0  # End of received data
+        self._begin = separator + BEGIN_STRING
+        self._checksum = separator + CHECKSUM
+
+    def __len__(self):
+        """Number of bytes received but not framed yet."""
+        return self._end - self._start
+
+    def _reserve(self, size):
+        """
+        Make sure there is room for ``size`` more bytes at the end of
+        the buffer, by moving pending data to the front or growing it.
+        """
+        if len(self._buffer) - self._end >= size:
+            return
+
+        pending = self._end - self._start
+        if self._start:
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start, self._end = 0, pending
+
+        if len(self._buffer) - self._end < size:
+            self._buffer.extend(
+                bytearray(max(size, len(self._buffer))))
+
+    def recv_into(self, sock, size=4096):
+        """
+        Receive available data from the socket directly
+        into the receive buffer.
+
+        :param sock: Socket to receive from.
+        :type sock: ``socket.socket``
+        :param size: Minimum free space to read into.
+        :type size: ``int``
+
+        :return: Number of bytes received, ``0`` if the peer closed
+          the connection.
+        :rtype: ``int``
+        """
+        self._reserve(size)
+        # The view is released right after the call,
+        # the buffer cannot be resized while it is being viewed.
+        nbytes = sock.recv_into(memoryview(self._buffer)[self._end:])
+        self._end += nbytes
+        return nbytes
+
+    def feed(self, data):
+        """
+        Append data received by other means to the receive buffer.
+
+        :param data: Received data.
+        :type data: ``bytes``
+        """
+        self._reserve(len(data))
+        self._buffer[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def _sync(self):
+        """
+        Discard data up to the first BeginString field.
+
+        :return: ``True`` if pending data starts with a BeginString field.
+        :rtype: ``bool``
+        """
+        buf, start, end = self._buffer, self._start, self._end
+        if buf[start:start + 2] == BEGIN_STRING:
+            return True
+
+        idx = buf.find(self._begin, start, end)
+        if idx == -1:
+            # Keep the last byte, it may be the separator of the next message
+            self._start = max(start, end - 1)
+            return False
+
+        self._start = idx + 1
+        return True
+
+    def _message_end(self):
+        """
+        Return end index of the first pending message,
+        or ``-1`` if it has not been fully received yet.
+        """
+        buf, start, end = self._buffer, self._start, self._end
+        sep = self.separator
+
+        begin_end = buf.find(sep, start, end)
+        if begin_end == -1:
+            return -1
+
+        if buf[begin_end + 1:begin_end + 3] == BODY_LENGTH:
+            length_end = buf.find(sep, begin_end + 3, end)
+            if length_end == -1:
+                return -1
+            try:
+                body_length = int(bytes(buf[begin_end + 3:length_end]))
+            except ValueError:
+                body_length = None
+
+            if body_length is not None:
+                checksum_start = length_end + 1 + body_length
+                if checksum_start + len(CHECKSUM) > end:
+                    return -1
+                if buf[checksum_start:checksum_start + 3] == CHECKSUM:
+                    checksum_end = buf.find(sep, checksum_start, end)
+                    return -1 if checksum_end == -1 else checksum_end + 1
+
+        # Invalid or missing BodyLength, use the next CheckSum field
+        checksum_start = buf.find(self._checksum, begin_end, end)
+        if checksum_start == -1:
+            return -1
+        checksum_end = buf.find(sep, checksum_start + 1, end)
+        return -1 if checksum_end == -1 else checksum_end + 1
+
+    def next_frame(self):
+        """
+        Cut the next complete message from the receive buffer.
+
+        :return: Raw message, or ``None`` if no complete
+          message has been received yet.
+        :rtype: ``bytes`` or ``NoneType``
+        """
+        if not self._sync():
+            return None
+
+        msg_end = self._message_end()
+        if msg_end == -1:
+            return None
+
+        frame = memoryview(self._buffer)[self._start:msg_end].tobytes()
+        self._start = msg_end
+        if self._start == self._end:
+            self._start = self._end = 0
+        return frame
+
+    def frames(self):
+        """
+        Iterate over complete messages in the receive buffer.
+
+        :return: Raw messages.
+        :rtype: ``generator`` of ``bytes``
+        """
+        while True:
+            frame = self.next_frame()
+            if frame is None:
+                return
+            yield frame
+
+    def drain(self):
+        """
+        Return and discard all data that has not been framed.
+
+        :return: Pending data.
+        :rtype: ``bytes``
+        """
+        data = memoryview(self._buffer)[self._start:self._end].tobytes()
+        self._start = self._end = 0
+        return data
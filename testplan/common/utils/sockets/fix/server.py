@@ -9,6 +9,7 @@ from six.moves import queue as Queue
 from testplan.common.utils.timing import (TimeoutException,
                                           TimeoutExceptionInfo,
                                           wait)
+from testplan.common.utils.sockets.fix.framer import Framer
 from testplan.common.utils.sockets.fix.utils import utc_timestamp
 
 
@@ -39,6 +40,13 @@ class ConnectionDetails(object):
         self.queue = queue
         self.in_seqno = in_seqno
         self.out_seqno = out_seqno
+        self.framer = Framer()
+        # Data waiting for the socket to become writable
+        self.outbound = bytearray()
+        # Serializes sequence number stamping and writes for this session
+        self.lock = threading.Lock()
+        # Set once logged out or closed, no more messages are sent
+        self.closing = False
 
 
 def _has_logon_tag(msg):
@@ -94,11 +102,30 @@ def _has_heartbeat_tag(msg):
     return msg.tag_exact(35, b'0')
 
 
+def _poller():
+    """
+    Create the poll object of the server reactor, ``epoll`` where available.
+
+    :return: Poll object and its (readable, writable, closed) event masks.
+    :rtype: ``tuple``
+    """
+    if hasattr(select, 'epoll'):
+        return (select.epoll(), select.EPOLLIN, select.EPOLLOUT,
+                select.EPOLLHUP | select.EPOLLERR)
+    return (select.poll(), select.POLLIN, select.POLLOUT,
+            select.POLLHUP | select.POLLERR | select.POLLNVAL)
+
+
 class Server(object):
     """
     A server that can send and receive FIX messages over the session protocol.
     Supports multiple connections.
 
+    All connections are served by a single reactor thread that polls the
+    sockets (using ``epoll`` where available). Each connection has its own
+    receive buffer, outbound queue and lock, so a slow connection does not
+    stall the others.
+
     The server stamps every outgoing message with the senderCompID and
     targetCompID for the corresponding connection.
     """
@@ -144,8 +171,7 @@ class Server(object):
 
         self._socket = None
         self._recv_thread = None
-        self._lock = threading.Lock()
-        self._pobj = select.poll()
+        self._pobj = None
 
     @property
     def host(self):
@@ -171,6 +197,8 @@ class Server(object):
 
         self._socket.bind((self._input_host, self._input_port))
         self._ip, self._port = self._socket.getsockname()
+        (self._pobj, self._pollin,
+         self._pollout, self._pollclose) = _poller()
 
         self.log_callback('Started server on {}:{}'.format(
             self.host, self.port))
@@ -194,11 +222,11 @@ class Server(object):
         Listen for new inbound connections and messages from existing
         connections.
         """
-        self._socket.listen(1)
+        self._socket.listen(socket.SOMAXCONN)
         self._listening = True
 
         self._pobj.register(self._socket.fileno(),
-                            select.POLLIN | select.POLLNVAL | select.POLLHUP)
+                            self._pollin | self._pollclose)
 
         closed = False
         while (not closed) and self._listening:
@@ -206,34 +234,37 @@ class Server(object):
             for fdesc, event in events:
                 if fdesc == self._socket.fileno():
                     # Socket event received
-                    if event in [select.POLLNVAL, select.POLLHUP]:
+                    if event & self._pollclose:
                         self.log_callback('"Close socket" event received.')
                         closed = True
                         break  # out of 'for'
-                    elif event == select.POLLIN:
+                    elif event & self._pollin:
                         self.log_callback('"New connection" event received.')
                         self._add_connection()
                     else:
                         raise Exception(
                             'Unexpected event {0} on fdesc {1}.'.format(
                                 event, fdesc))
-                else:
+                elif fdesc in self._conndetails_by_fd:
                     # Connection event received
                     self._process_connection_event(fdesc, event)
 
         self._remove_all_connections()
         self._socket.shutdown(socket.SHUT_RDWR)
         self._socket.close()
+        if hasattr(self._pobj, 'close'):
+            self._pobj.close()
 
     def _add_connection(self):
         """
         Accept new inbound connection from socket.
         """
         connection, _ = self._socket.accept()
+        connection.setblocking(False)
         conn_details = ConnectionDetails(connection)
         self._conndetails_by_fd[connection.fileno()] = conn_details
         self._pobj.register(connection.fileno(),
-                            select.POLLIN | select.POLLNVAL | select.POLLHUP)
+                            self._pollin | self._pollclose)
 
     def _remove_connection(self, fdesc):
         """
@@ -242,31 +273,27 @@ class Server(object):
         :param fdesc: File descriptor of connection to be removed.
         :type fdesc: ``int``
         """
-        self._pobj.unregister(fdesc)
-        try:
-            self._conndetails_by_fd[fdesc].connection.shutdown(socket.SHUT_RDWR)
-        except socket.error as serr:
-            if serr.errno != errno.ENOTCONN:
-                raise
-                # Else, client already closed the connection.
-        self._conndetails_by_fd[fdesc].connection.close()
+        conndetails = self._conndetails_by_fd.pop(fdesc)
+        if conndetails.name in self._conndetails_by_name:
+            del self._conndetails_by_name[conndetails.name]
 
-        name = self._conndetails_by_fd[fdesc].name
-        del self._conndetails_by_fd[fdesc]
-        if name in self._conndetails_by_name:
-            del self._conndetails_by_name[name]
+        with conndetails.lock:
+            conndetails.closing = True
+            self._pobj.unregister(fdesc)
+            try:
+                conndetails.connection.shutdown(socket.SHUT_RDWR)
+            except socket.error as serr:
+                if serr.errno != errno.ENOTCONN:
+                    raise
+                    # Else, client already closed the connection.
+            conndetails.connection.close()
 
     def _remove_all_connections(self):
         """
         Unregister, close and remove all existing inbound connections.
         """
-        for fdesc in self._conndetails_by_fd:
-            self._pobj.unregister(fdesc)
-            self._conndetails_by_fd[fdesc].connection.shutdown(socket.SHUT_RDWR)
-            self._conndetails_by_fd[fdesc].connection.close()
-
-            del self._conndetails_by_name[self._conndetails_by_fd[fdesc].name]
-        self._conndetails_by_fd = {}
+        for fdesc in list(self._conndetails_by_fd):
+            self._remove_connection(fdesc)
 
     def _process_connection_event(self, fdesc, event):
         """
@@ -278,23 +305,42 @@ class Server(object):
         :param event: Event received from connection.
         :type event: ``.int``
         """
-        connection = self._conndetails_by_fd[fdesc].connection
-        if event == select.POLLIN:
-            with self._lock:
-                data = connection.recv(4096)
-                if not data:
-                    self.log_callback(
-                        'Closing connection {} since no data available'.format(
-                        self._conndetails_by_fd[fdesc].name))
-                    self._remove_connection(fdesc)
-                else:
-                    msg = self.msgclass.from_buffer(data, self.codec)
-                    self._process_message(fdesc, msg)
-        elif event in [select.POLLNVAL, select.POLLHUP]:
+        conndetails = self._conndetails_by_fd[fdesc]
+        connection = conndetails.connection
+        if event & self._pollout:
+            with conndetails.lock:
+                self._flush_outbound(fdesc, conndetails)
+                drained = conndetails.closing and not conndetails.outbound
+            if drained:
+                # Logout reply written
+                self._remove_connection(fdesc)
+                return
+
+        if event & self._pollin:
+            try:
+                nbytes = conndetails.framer.recv_into(connection)
+            except socket.error as serr:
+                if serr.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+                return
+            if not nbytes:
+                self.log_callback(
+                    'Closing connection {} since no data available'.format(
+                    conndetails.name))
+                self._remove_connection(fdesc)
+                return
+
+            # A read may contain several messages or only part of one
+            for data in conndetails.framer.frames():
+                if conndetails.closing:
+                    break  # Logged out
+                msg = self.msgclass.from_buffer(data, self.codec)
+                self._process_message(fdesc, msg)
+        elif event & self._pollclose:
             self.log_callback(
-                'Closing connection {} event received'.format(connection.name))
+                'Closing connection {} event received'.format(conndetails.name))
             self._remove_connection(fdesc)
-        else:
+        elif not event & self._pollout:
             raise Exception(
                 'unexpected event {0} on fdesc {1}'.format(event, fdesc))
 
@@ -310,20 +356,20 @@ class Server(object):
         conn_name = (msg[56], msg[49])
 
         if _has_logout_tag(msg):
-            self._no_lock_send(msg, conn_name, fdesc)
-            self._remove_connection(fdesc)
+            self._send(msg, conn_name, fdesc)
+            self._logout_connection(fdesc)
         elif self._conn_loggedon(conn_name):
             if _is_session_control_msg(msg):
                 self.log_callback(
                     'Session control msg from {}'.format(conn_name))
-                self._no_lock_send(msg, conn_name)
+                self._send(msg, conn_name)
             else:
                 self.log_callback('Incoming data msg from {}'.format(conn_name))
                 self._conndetails_by_name[conn_name].in_seqno += 1
                 self._conndetails_by_name[conn_name].queue.put(msg, True, 1)
         elif _has_logon_tag(msg):
             self._logon_connection(fdesc, conn_name)
-            self._no_lock_send(msg, conn_name)
+            self._send(msg, conn_name)
         else:
             raise Exception(
                 'Connection {} sent msg before logon'.format(conn_name))
@@ -359,6 +405,24 @@ class Server(object):
             (self._first_sender, self._first_target) = conn_name
         self.log_callback('Logged on connection {}.'.format(conn_name))
 
+    def _logout_connection(self, fdesc):
+        """
+        Logout connection with given fd. It is closed once the data queued
+        for it, including the logout reply, is written.
+
+        :param fdesc: File descriptor of connection.
+        :type fdesc: ``int``
+        """
+        conndetails = self._conndetails_by_fd[fdesc]
+        if conndetails.name in self._conndetails_by_name:
+            del self._conndetails_by_name[conndetails.name]
+
+        with conndetails.lock:
+            conndetails.closing = True
+            drained = not conndetails.outbound
+        if drained:
+            self._remove_connection(fdesc)
+
     def active_connections(self):
         """
         Returns a list of currently active connections
@@ -422,27 +486,23 @@ class Server(object):
 
         return sender, target
 
-    def _add_msg_tags(self, msg, conn_name, fdesc=None):
+    def _add_msg_tags(self, msg, conn_name, conndetails):
         """
         Add session tags and senderCompID and targetCompID tags to the given
-        FIX message.
+        FIX message. Expects the lock of the connection to be acquired.
 
         :param msg: Message to be sent.
         :type msg: ``FixMessage``
-        :param sender: Sender id.
-        :type sender: ``str``
-        :param target: Target id.
-        :type target: ``str``
+        :param conn_name: Connection name (tuple of sender and target).
+        :type conn_name: ``tuple`` of ``str`` and ``str``
+        :param conndetails: Connection the message is sent through.
+        :type conndetails: ``ConnectionDetails``
 
         :return: The FIX msg with the tags set.
         :rtype: ``FixMessage``
         """
         sender, target = conn_name
         msg[8] = self.version
-        if fdesc:
-            conndetails = self._conndetails_by_fd[fdesc]
-        else:
-            conndetails = self._conndetails_by_name[(sender, target)]
         msg[34] = conndetails.out_seqno
         conndetails.out_seqno += 1
         msg[49] = sender
@@ -450,30 +510,94 @@ class Server(object):
         msg[52] = getattr(self.codec, 'utc_timestamp', utc_timestamp)()
         return msg
 
-    def _no_lock_send(self, msg, conn_name, fdesc=None):
+    def _send(self, msg, conn_name, fdesc=None):
         """
-        Send the given Fix message through the given connection, expecting
-        the lock is already acquired.
+        Send the given Fix message through the given connection.
 
         The message will be enriched with session tags and sequence numbers.
+        Only the lock of the connection is held while stamping and writing it,
+        so sending never blocks on other connections.
 
         :param msg: message to be sent
         :type msg: ``FixMessage``
-        :param sender: Sender id.
-        :type sender: ``str``
-        :param target: Target id.
-        :type target: ``str``
+        :param conn_name: Connection name (tuple of sender and target).
+        :type conn_name: ``tuple`` of ``str`` and ``str``
+        :param fdesc: File descriptor of the connection, looked up by name
+          if not provided.
+        :type fdesc: ``int``
+
+        :return: Fix message sent
+        :rtype: ``FixMessage``
         """
-        sender, target = conn_name
-        msg = self._add_msg_tags(msg, (sender, target), fdesc)
-        self.log_callback('Sending on connection {} message {}'.format(
-            (sender, target), msg))
-        if fdesc:
-            self._conndetails_by_fd[fdesc].connection.send(
-                msg.to_wire(self.codec))
+        if fdesc is not None:
+            conndetails = self._conndetails_by_fd[fdesc]
         else:
-            self._conndetails_by_name[(sender, target)].connection.send(
-                msg.to_wire(self.codec))
+            conndetails = self._conndetails_by_name.get(conn_name)
+            if conndetails is None:
+                raise Exception('Connection {} not active'.format(conn_name))
+
+        with conndetails.lock:
+            # The reactor may have closed the connection meanwhile
+            if conndetails.closing:
+                raise Exception('Connection {} not active'.format(conn_name))
+            msg = self._add_msg_tags(msg, conn_name, conndetails)
+            self.log_callback('Sending on connection {} message {}'.format(
+                conn_name, msg))
+            self._write(conndetails, msg.to_wire(self.codec))
+        return msg
+
+    def _write(self, conndetails, data):
+        """
+        Write data to a connection without blocking. Data that the socket
+        does not accept right away is queued and written by the reactor
+        once the socket becomes writable. Expects the lock of the connection
+        to be acquired.
+
+        :param conndetails: Connection to write to.
+        :type conndetails: ``ConnectionDetails``
+        :param data: Data to be written.
+        :type data: ``bytes``
+        """
+        if conndetails.outbound:
+            # Keep the order of previously queued data
+            conndetails.outbound.extend(data)
+            return
+
+        try:
+            sent = conndetails.connection.send(data)
+        except socket.error as serr:
+            if serr.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+            sent = 0
+
+        if sent < len(data):
+            conndetails.outbound.extend(data[sent:])
+            self._pobj.modify(
+                conndetails.connection.fileno(),
+                self._pollin | self._pollout | self._pollclose)
+
+    def _flush_outbound(self, fdesc, conndetails):
+        """
+        Write queued data of a writable connection. Expects the lock of the
+        connection to be acquired.
+
+        :param fdesc: File descriptor of the connection.
+        :type fdesc: ``int``
+        :param conndetails: Connection to flush.
+        :type conndetails: ``ConnectionDetails``
+        """
+        outbound = conndetails.outbound
+        if outbound:
+            try:
+                sent = conndetails.connection.send(outbound)
+            except socket.error as serr:
+                if serr.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+                sent = 0
+            del outbound[:sent]
+
+        if not outbound:
+            self._pobj.modify(fdesc, self._pollin | self._pollclose)
 
     def send(self, msg, conn_name=(None, None)):
         """
@@ -496,15 +620,7 @@ class Server(object):
         """
         conn_name = self._validate_connection_name(
             self._encode_conn_name(conn_name))
-        with self._lock:
-            conn_name = self._validate_connection_name(conn_name)
-            msg = self._add_msg_tags(msg, conn_name)
-            self.log_callback('Sending on connection {} message {}'.format(
-                conn_name, msg))
-            conn_name = self._validate_connection_name(conn_name)
-            self._conndetails_by_name[conn_name].connection.send(
-                msg.to_wire(self.codec))
-        return msg
+        return self._send(msg, conn_name)
 
     def receive(self, conn_name=(None, None), timeout=30):
         """
@@ -1,13 +1,175 @@
 """TCP Server module."""
 
 import time
+import errno
 import socket
 import select
+import struct
 import threading
 
 from testplan.common.utils.timing import wait
 
 
+def _wait_for(sock, event, timeout):
+    """
+    Wait until the socket is ready for the given event.
+
+    :param sock: Socket to wait on.
+    :type sock: ``socket.socket``
+    :param event: ``'r'`` to wait until readable, ``'w'`` until writable.
+    :type event: ``str``
+    :param timeout: Timeout in seconds, ``None`` to wait forever.
+    :type timeout: ``float`` or ``NoneType``
+
+    :return: ``True`` if the socket is ready.
+    :rtype: ``bool``
+    """
+    if hasattr(select, 'poll'):
+        mask = select.POLLIN if event == 'r' else select.POLLOUT
+        poller = select.poll()
+        poller.register(sock.fileno(), mask | select.POLLHUP | select.POLLERR)
+        return bool(poller.poll(
+            None if timeout is None else max(timeout, 0) * 1000))
+    if event == 'r':
+        readable, _, _ = select.select([sock], [], [], timeout)
+        return bool(readable)
+    _, writable, _ = select.select([], [sock], [], timeout)
+    return bool(writable)
+
+
+class Connection(object):
+    """
+    An accepted connection and its receive buffer.
+
+    Data is received into a reusable buffer with ``recv_into`` and consumed
+    from its front. The socket is waited on for readiness instead of having
+    its timeout changed on every call, and each connection has its own lock
+    so that connections are served independently.
+
+    :param sock: Accepted socket.
+    :type sock: ``socket.socket``
+    :param bufsize: Initial size of the receive buffer.
+    :type bufsize: ``int``
+    """
+
+    def __init__(self, sock, bufsize=65536):
+        self.socket = sock
+        self.lock = threading.Lock()
+        self._timeout = sock.gettimeout()
+        self._buffer = bytearray(bufsize)
+        self._start = 0  # Start of data not yet consumed
+        self._end = 0  # End of received data
+
+    def __len__(self):
+        """Number of bytes received but not consumed yet."""
+        return self._end - self._start
+
+    def settimeout(self, timeout):
+        """Set the socket timeout, only if it has changed."""
+        if timeout != self._timeout:
+            self.socket.settimeout(timeout)
+            self._timeout = timeout
+
+    def _consume(self, size):
+        """Remove and return ``size`` bytes from the front of the buffer."""
+        data = bytes(self._buffer[self._start:self._start + size])
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+        return data
+
+    def _reserve(self, size):
+        """
+        Make sure there is room for ``size`` more bytes at the end of
+        the buffer, by moving pending data to the front or growing it.
+        """
+        if len(self._buffer) - self._end >= size:
+            return
+        pending = self._end - self._start
+        if self._start:
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start, self._end = 0, pending
+        if len(self._buffer) - self._end < size:
+            self._buffer.extend(bytearray(max(size, len(self._buffer))))
+
+    def _recv_into(self, view, deadline):
+        """
+        Receive available data into the given buffer, waiting for it
+        until the deadline.
+
+        :return: Number of bytes received, ``0`` if the connection is closed.
+        :rtype: ``int``
+        :raises socket.timeout: if no data is received before the deadline.
+        """
+        timeout = None if deadline is None else deadline - time.time()
+        if not _wait_for(self.socket, 'r', timeout):
+            raise socket.timeout('timed out')
+        try:
+            return self.socket.recv_into(view)
+        except socket.error as serr:
+            if serr.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+            # Spurious wakeup
+            return self._recv_into(view, deadline)
+
+    def _fill(self, deadline, size=4096):
+        """Receive more data at the end of the receive buffer."""
+        self._reserve(size)
+        nbytes = self._recv_into(memoryview(self._buffer)[self._end:], deadline)
+        if not nbytes:
+            raise Exception('Socket connection broken')
+        self._end += nbytes
+
+    def read(self, size, deadline):
+        """
+        Read up to ``size`` bytes, waiting until some are available.
+        Returns empty bytes if the connection is closed.
+        """
+        if not len(self):
+            self._reserve(size)
+            self._end += self._recv_into(
+                memoryview(self._buffer)[self._end:self._end + size], deadline)
+        return self._consume(min(size, len(self)))
+
+    def read_exact(self, size, deadline):
+        """
+        Read exactly ``size`` bytes. Data is received straight into
+        a buffer of the message size, so large messages are not
+        assembled from growing copies.
+        """
+        if len(self) >= size:
+            return self._consume(size)
+
+        msg = bytearray(size)
+        received = len(self)
+        msg[:received] = self._consume(received)
+        view = memoryview(msg)
+        while received < size:
+            nbytes = self._recv_into(view[received:], deadline)
+            if not nbytes:
+                raise Exception('Socket connection broken')
+            received += nbytes
+        return bytes(msg)
+
+    def read_until(self, delimiter, deadline, max_size=None):
+        """
+        Read up to and including the next ``delimiter``.
+        """
+        searched = self._start
+        while True:
+            idx = self._buffer.find(delimiter, searched, self._end)
+            if idx != -1:
+                return self._consume(idx + len(delimiter) - self._start)
+            if max_size is not None and len(self) >= max_size:
+                raise ValueError(
+                    'Delimiter not found in {} bytes'.format(len(self)))
+            # The delimiter may start in the data that has been searched
+            searched = max(self._start, self._end - len(delimiter) + 1)
+            offset = searched - self._start
+            self._fill(deadline)
+            searched = self._start + offset
+
+
 class Server(object):
     """
     A server that can send and receive messages over the session protocol.
@@ -32,7 +194,8 @@ class Server(object):
         self._server = None
         self._server_thread = None
 
-        self._lock = threading.Lock()
+        # Notified when a new connection is added
+        self._connection_added = threading.Condition()
 
         self._connection_by_fd = {}
         self._fds = {}
@@ -72,7 +235,15 @@ class Server(object):
         self._ip, self._port = self._server.getsockname()
 
     def serve(self, loop_sleep=0.005, listening_timeout=5):
-        """Start serving connections."""
+        """
+        Start serving connections.
+
+        :param loop_sleep: Maximum time the serving thread waits for a new
+          connection before checking if the server is closed.
+        :type loop_sleep: ``float``
+        :param listening_timeout: Timeout for the server to start listening.
+        :type listening_timeout: ``int``
+        """
         self._server_thread = threading.Thread(
             target=self._serving, kwargs=dict(loop_sleep=loop_sleep))
         self._server_thread.daemon = True
@@ -81,31 +252,25 @@ class Server(object):
         wait(lambda: self._listening, listening_timeout, raise_on_timeout=True)
 
     def _serving(self, loop_sleep=0.005):
-        """Listen for new inbound connections."""
+        """
+        Listen for new inbound connections. Data of accepted connections is
+        read directly by the threads receiving it.
+        """
         self._server.listen(self._listen)
         self._listening = True
 
-        inputs = [self._server]
-        outputs = []
-
         while self._listening:
-            readable, writable, exceptional = select.select(
-                inputs, outputs, inputs)
-
-            for sock in readable:
-                if sock is self._server:
-                    # New connection
-                    conn, client_addr = sock.accept()
-                    inputs.append(conn)
-                    self._connection_by_fd[conn.fileno()] = conn
-                    self._fds[self.active_connections] = conn.fileno()
-                    self.active_connections += 1
-
-            for sock in exceptional:
-                inputs.remove(sock)
-                sock.close()
-
-            time.sleep(loop_sleep)
+            if not _wait_for(self._server, 'r', max(loop_sleep, 0.1)):
+                continue
+            try:
+                conn, _ = self._server.accept()
+            except socket.error:
+                continue
+            with self._connection_added:
+                self._connection_by_fd[conn.fileno()] = Connection(conn)
+                self._fds[self.active_connections] = conn.fileno()
+                self.active_connections += 1
+                self._connection_added.notify_all()
 
         self._remove_all_connections()
         try:
@@ -124,20 +289,33 @@ class Server(object):
 
         :param timeout: Timeout to wait for receiving connection.
         :type timeout: ``int``
-        :param accept_connection_sleep: Sleep time to retry accept connection.
+        :param accept_connection_sleep: Maximum time to wait for the serving
+          thread to signal a new connection before checking again.
         :type accept_connection_sleep: ``float``
 
         :return: Index of connection
         :rtype: ``int``
         """
-        started = time.time()
-        while True:
-            if self.accepted_connections in self._fds:
-                self.accepted_connections += 1
-                return self.accepted_connections - 1
-            if time.time() > started + timeout:
-                return -1
-            time.sleep(accept_connection_sleep)
+        deadline = time.time() + timeout
+        with self._connection_added:
+            while self.accepted_connections not in self._fds:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return -1
+                self._connection_added.wait(
+                    min(remaining, accept_connection_sleep))
+            self.accepted_connections += 1
+            return self.accepted_connections - 1
+
+    def _connection(self, conn_idx):
+        """Return the connection for the given index."""
+        conn_idx = self._validate_connection_idx(conn_idx)
+        return self._connection_by_fd[self._fds[conn_idx]]
+
+    @staticmethod
+    def _deadline(timeout):
+        """Convert a timeout in seconds to an absolute deadline."""
+        return None if timeout is None else time.time() + timeout
 
     def receive(self, size=1024, conn_idx=None, timeout=30,
                 wait_full_size=True):
@@ -157,31 +335,56 @@ class Server(object):
         :return: message received
         :rtype: ``bytes``
         """
-        conn_idx = self._validate_connection_idx(conn_idx)
+        connection = self._connection(conn_idx)
+        with connection.lock:
+            if wait_full_size is False:
+                return connection.read(size, self._deadline(timeout))
+            return connection.read_exact(size, self._deadline(timeout))
+
+    def receive_until(self, delimiter, conn_idx=None, timeout=30,
+                      max_size=None):
+        """
+        Receive a message terminated by the given delimiter from
+        the given connection.
 
-        # Get file descriptor and details of connection
-        fdesc = self._fds[conn_idx]
-        connection = self._connection_by_fd[fdesc]
-        connection.settimeout(timeout)
+        :param delimiter: Delimiter that ends the message.
+        :type delimiter: ``bytes``
+        :param conn_idx: Index of connection to receive from
+        :type conn_idx: ``int``
+        :param timeout: timeout in seconds
+        :type timeout: ``int``
+        :param max_size: Maximum number of bytes to search for the delimiter.
+        :type max_size: ``int``
 
-        if wait_full_size is False:
-            connection.settimeout(timeout)
-            msg = connection.recv(size)
-            connection.settimeout(0)
-        else:
-            with self._lock:
-                msg = b''
-                try:
-                    while len(msg) < size:
-                        new_msg = connection.recv(size - len(msg))
-                        if not new_msg:
-                            raise Exception('Socket connection broken')
-                        msg += new_msg
-                except socket.error:
-                    if timeout == 0:
-                        raise socket.timeout()
-                    raise
-        return msg
+        :return: message received, including the delimiter
+        :rtype: ``bytes``
+        """
+        connection = self._connection(conn_idx)
+        with connection.lock:
+            return connection.read_until(
+                delimiter, self._deadline(timeout), max_size=max_size)
+
+    def receive_frame(self, conn_idx=None, timeout=30, header='!I'):
+        """
+        Receive a length-prefixed message from the given connection.
+
+        :param conn_idx: Index of connection to receive from
+        :type conn_idx: ``int``
+        :param timeout: timeout in seconds
+        :type timeout: ``int``
+        :param header: ``struct`` format of the length prefix.
+        :type header: ``str``
+
+        :return: message received, without the length prefix
+        :rtype: ``bytes``
+        """
+        connection = self._connection(conn_idx)
+        deadline = self._deadline(timeout)
+        with connection.lock:
+            size, = struct.unpack(
+                header,
+                connection.read_exact(struct.calcsize(header), deadline))
+            return connection.read_exact(size, deadline)
 
     def send(self, msg, conn_idx=None, timeout=30):
         """
@@ -197,19 +400,35 @@ class Server(object):
         :return: Number of bytes sent
         :rtype: ``int``
         """
-        conn_idx = self._validate_connection_idx(conn_idx)
-
-        connection = self._connection_by_fd[self._fds[conn_idx]]
-        connection.settimeout(timeout)
-        with self._lock:
-            connection.sendall(msg)
+        connection = self._connection(conn_idx)
+        with connection.lock:
+            connection.settimeout(timeout)
+            connection.socket.sendall(msg)
         return len(msg)
 
+    def send_frame(self, msg, conn_idx=None, timeout=30, header='!I'):
+        """
+        Send the given message prefixed with its length.
+
+        :param msg: message to be sent
+        :type msg: ``bytes``
+        :param conn_idx: Index of connection to send to
+        :type conn_idx: ``int``
+        :param timeout: Timeout in seconds for sending all bytes
+        :type timeout: ``int``
+        :param header: ``struct`` format of the length prefix.
+        :type header: ``str``
+
+        :return: Number of bytes sent
+        :rtype: ``int``
+        """
+        return self.send(
+            struct.pack(header, len(msg)) + msg, conn_idx, timeout)
+
     def close(self):
         """Closes the server and listen thread."""
         self._listening = False
-        # self._serving may be stuck in select.select
-        self._server_thread.join(timeout=0.1)
+        self._server_thread.join(timeout=1)
 
     def _validate_connection_idx(self, conn_idx):
         """
@@ -247,7 +466,7 @@ class Server(object):
         :rtype: ``NoneType``
         """
         for fdesc in self._connection_by_fd:
-            self._connection_by_fd[fdesc].close()
+            self._connection_by_fd[fdesc].socket.close()
 
         self._connection_by_fd = {}
         self._fds = {}
@@ -15,17 +15,17 @@ class TableEntry(object):
 
     def _check_table(self, table):
         """Make the original table argument is a valid."""
-        error_msg = '`table` must a list of' \
-                    ' lists or list of dicts: {}'.format(table)
+        # Formatting large tables is expensive, only do it on failure
+        error_msg = '`table` must a list of lists or list of dicts: {}'
 
         if not isinstance(table, (list, tuple)):
-            raise ValueError(error_msg)
+            raise ValueError(error_msg.format(table))
 
         is_list_of_list = all(isinstance(obj, (list, tuple)) for obj in table)
         is_list_of_dict = all(isinstance(obj, dict) for obj in table)
 
         if not (is_list_of_dict or is_list_of_list) and table:
-            raise ValueError(error_msg)
+            raise ValueError(error_msg.format(table))
 
         if is_list_of_list and table and not all(
                 isinstance(col, str) for col in table[0]):
@@ -117,15 +117,9 @@ class TableEntry(object):
         # with dict elements indexed by column_names
         if isinstance(table[0], list):
             column_names = table[0]
-            for row in table[1:]:
-                tups = [
-                    (column, row[col_idx])
-                    for col_idx, column in enumerate(column_names)
-                ]
-                if keep_column_order:
-                    formatted_table.append(collections.OrderedDict(tups))
-                else:
-                    formatted_table.append(dict(tups))
+            row_type = collections.OrderedDict if keep_column_order else dict
+            formatted_table = [
+                row_type(zip(column_names, row)) for row in table[1:]]
         else:
             # else it must be ``list`` of ``dict``
             assert isinstance(table[0], dict)
@@ -2,6 +2,7 @@
   PDF Export logic for test reports via ReportLab.
 """
 
+import multiprocessing
 import os
 import uuid
 import warnings
@@ -28,11 +29,12 @@ from testplan import defaults
 from testplan.logger import TESTPLAN_LOGGER
 
 from testplan.common.utils.strings import slugify
-from testplan.common.report import Report
+from testplan.common.report import Report, ReportGroup
 
 from testplan.common.config import ConfigOption
 from testplan.common.exporters import ExporterConfig
 
+from testplan.report.testing import TestCaseReport
 from testplan.report.testing.styles import Style
 from testplan.testing import tagging
 
@@ -95,16 +97,60 @@ def generate_path_for_tags(config, tag_dict, filter_type):
     return add_count_suffix(config.report_dir, path)
 
 
-def create_pdf(source, config):
-    """Entry point for PDF generation."""
-    # Depth values will be used for indentation on PDF, however
-    # we want first level children to have depth = 0 (otherwise we'll have to
-    # do `depth + 1` everywhere in the renderers.
-    # The renderer for root will discard the negative depth.
-    data = [(depth - 1, rep) for depth, rep in source.flatten(depths=True)]
-
-    reportlab_data = []
-    reportlab_styles = []
+def flatten_section(source, style, failures_only=False, depth=0):
+    """
+      Depth-first traverse a report subtree, return a list of
+      `(depth, obj)` tuples in the same order as `Report.flatten`.
+
+      Children of passing reports that cannot be displayed with the given
+      style are not visited at all, as styling levels are incremental and
+      none of the descendants would be rendered either. If `failures_only`
+      is set, assertion entries of passing testcases are skipped as well.
+
+      :param source: Root of the report subtree.
+      :type source: ``report.base.Report``
+      :param style: Styling for passing / failing tests.
+      :type style: ``report.testing.styles.Style``
+      :param failures_only: Skip assertion rows of passing testcases.
+      :type failures_only: ``bool``
+      :param depth: Depth of the subtree root.
+      :type depth: ``int``
+      :return: List of `(depth, obj)` tuples.
+      :rtype: ``list`` of ``tuple``
+    """
+    result = [(depth, source)]
+
+    if source.passed and not source.status_override:
+        if isinstance(source, TestCaseReport) and (
+                failures_only or not style.passing.display_assertion):
+            return result
+        renderer = report_registry[source](style=style)
+        if not renderer.should_display(source=source):
+            return result
+
+    if isinstance(source, ReportGroup):
+        for entry in source:
+            result.extend(
+                flatten_section(entry, style, failures_only, depth + 1))
+    else:
+        result.extend(source.flattened_entries(depth + 1))
+    return result
+
+
+def render_rows(data, style):
+    """
+      Render flattened report data into table rows, row indexes
+      start from 0 for each call.
+
+      :param data: List of `(depth, obj)` tuples.
+      :type data: ``list`` of ``tuple``
+      :param style: Styling for passing / failing tests.
+      :type style: ``report.testing.styles.Style``
+      :return: Table content and Reportlab style commands.
+      :rtype: ``tuple`` of ``list``
+    """
+    content = []
+    styles = []
     row_idx = 0
 
     for depth, obj in data:
@@ -112,7 +158,7 @@ def create_pdf(source, config):
         registry = report_registry if isinstance(
             obj, Report) else serialized_entry_registry
 
-        renderer = registry[obj](style=config.pdf_style)
+        renderer = registry[obj](style=style)
         if renderer.should_display(source=obj):
             row_data = renderer.get_row_data(
                 source=obj,
@@ -121,9 +167,56 @@ def create_pdf(source, config):
 
             row_idx = row_data.end
 
-            reportlab_data.extend(row_data.content)
-            reportlab_styles.extend(row_data.style)
+            content.extend(row_data.content)
+            styles.extend(row_data.style)
+
+    return content, styles
+
+
+def render_tables(data, style, col_widths):
+    """
+      Render flattened report data into Reportlab tables.
+
+      :param data: List of `(depth, obj)` tuples.
+      :type data: ``list`` of ``tuple``
+      :param style: Styling for passing / failing tests.
+      :type style: ``report.testing.styles.Style``
+      :param col_widths: Column widths of the tables.
+      :type col_widths: ``list`` of ``float``
+      :return: List of tables.
+      :rtype: ``list`` of ``Table``
+    """
+    reportlab_data, reportlab_styles = render_rows(data, style)
+    return create_base_tables(
+        data=reportlab_data,
+        style=const.TABLE_STYLE + reportlab_styles,
+        col_widths=col_widths)
 
+
+def render_section(args):
+    """
+      Render the tables of a top level report (e.g. a MultiTest) and all its
+      descendants. Takes a single tuple argument so it can be used with
+      ``multiprocessing.Pool.map``.
+
+      :param args: `(source, style, failures_only, col_widths)` tuple.
+      :type args: ``tuple``
+      :return: List of tables.
+      :rtype: ``list`` of ``Table``
+    """
+    source, style, failures_only, col_widths = args
+    return render_tables(
+        flatten_section(source, style, failures_only), style, col_widths)
+
+
+def create_pdf(source, config):
+    """
+      Entry point for PDF generation.
+
+      Each top level child of the report (e.g. a MultiTest) is rendered as a
+      separate section, in parallel worker processes if `pdf_processes` is
+      greater than 1. Sections are then stitched together into one document.
+    """
     template = SimpleDocTemplate(
         filename=config.pdf_path,
         pageSize=const.PAGE_SIZE,
@@ -133,10 +226,32 @@ def create_pdf(source, config):
         rightMargin=const.PAGE_MARGIN,
         title='Testplan report - {}'.format(source.name))
 
-    tables = create_base_tables(
-        data=reportlab_data,
-        style=const.TABLE_STYLE + reportlab_styles,
-        col_widths=[width * template.width for width in const.COL_WIDTHS])
+    style = config.pdf_style
+    col_widths = [width * template.width for width in const.COL_WIDTHS]
+
+    # Depth values will be used for indentation on PDF, however
+    # we want first level children to have depth = 0 (otherwise we'll have to
+    # do `depth + 1` everywhere in the renderers.
+    # The renderer for root will discard the negative depth.
+    tables = render_tables([(-1, source)], style, col_widths)
+    section_args = [
+        (entry, style, config.pdf_failures_only, col_widths)
+        for entry in source
+    ]
+
+    processes = min(config.pdf_processes, len(section_args))
+    if processes > 1:
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            sections = pool.map(render_section, section_args)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        sections = [render_section(args) for args in section_args]
+
+    for section in sections:
+        tables.extend(section)
 
     template.build(tables)
 
@@ -145,6 +260,8 @@ def get_pdf_opts(config_opts):
     common_options = {
         ConfigOption('timestamp', default=None): Or(str, None),
         ConfigOption('pdf_style', default=defaults.PDF_STYLE): Style,
+        ConfigOption('pdf_failures_only', default=False): bool,
+        ConfigOption('pdf_processes', default=1): int,
     }
     config_opts.update(common_options)
     return config_opts
@@ -83,7 +83,8 @@ class AssertionRenderer(SerializedEntryRenderer):
     assertions.Greater,
     assertions.GreaterEqual,
     assertions.Less,
-    assertions.LessEqual
+    assertions.LessEqual,
+    assertions.LatencyPercentileLess,
 )
 class FunctionAssertionRenderer(AssertionRenderer):
     """
@@ -94,6 +95,7 @@ class FunctionAssertionRenderer(AssertionRenderer):
       * GreaterEqual
       * Less
       * LessEqual
+      * LatencyPercentileLess
     """
 
     def get_detail(self, source, depth, row_idx):
@@ -113,6 +115,7 @@ class FunctionAssertionRenderer(AssertionRenderer):
 @registry.bind(
     assertions.RegexMatch,
     assertions.RegexSearch,
+    assertions.LogfileMatch,
 )
 class RegexMatchRenderer(AssertionRenderer):
     """RegexMatch renderer for serialized assertion entries."""
@@ -184,7 +187,8 @@ class RegexMatchRenderer(AssertionRenderer):
 
 @registry.bind(
     assertions.RegexMatchNotExists,
-    assertions.RegexSearchNotExists
+    assertions.RegexSearchNotExists,
+    assertions.LogfileNotMatch,
 )
 class RegexNotMatchRenderer(RegexMatchRenderer):
     """RegexNotMatch renderer for serialized assertion entries."""
@@ -739,7 +743,8 @@ class TableMatchRenderer(AssertionRenderer):
             colour_matrix.append(colour_row)
 
         max_width = const.PAGE_WIDTH - (depth * const.INDENT)
-        display_index = source['fail_limit'] > 0
+        display_index = source['fail_limit'] > 0 or bool(
+            source.get('key_columns'))
         table = create_table(
             table=raw_table,
             columns=source['columns'],
@@ -758,13 +763,51 @@ class TableMatchRenderer(AssertionRenderer):
                 style=error_style
             )
             # The error style isn't applied to the error string, possible bug.
-            return error + RowData(
+            result = error + RowData(
                 content=table,
                 start=error.end,
                 style=row_style
             )
         else:
-            return RowData(content=table, start=row_idx, style=row_style)
+            result = RowData(content=table, start=row_idx, style=row_style)
+
+        # Rows that could not be paired when matching by key columns
+        for label, key in (
+            ('Missing rows', 'missing_rows'),
+            ('Extra rows', 'extra_rows'),
+        ):
+            unmatched_rows = source.get(key)
+            if not unmatched_rows:
+                continue
+
+            # Style objects are bound to rows, so cannot be reused
+            indent = const.INDENT * (depth + 1)
+            label_row = RowData(
+                content=label,
+                start=result.end,
+                style=[
+                    RowStyle(left_padding=indent),
+                    RowStyle(textcolor=colors.red)
+                ]
+            )
+            unmatched_table = create_table(
+                table=[
+                    dict(zip(source['columns'], row))
+                    for _, row in unmatched_rows
+                ],
+                columns=source['columns'],
+                row_indices=[idx for idx, _ in unmatched_rows],
+                display_index=True,
+                max_width=max_width,
+                style=table_style
+            )
+            result += label_row + RowData(
+                content=unmatched_table,
+                start=label_row.end,
+                style=[RowStyle(left_padding=indent)]
+            )
+
+        return result
 
 
 @registry.bind(assertions.ColumnContain)
@@ -75,6 +75,11 @@ class TestplanParser(object):
             '--runpath', type=str, metavar='PATH',
             help='Path under which all temp files and logs will be created')
 
+        general_group.add_argument(
+            '--manifest', dest='manifest_path', type=str, metavar='PATH',
+            help='Manifest file caching the test context of tasks, so '
+                 'filtering and listing do not materialize unchanged tasks.')
+
         filter_group = parser.add_argument_group('Filtering')
 
         filter_group.add_argument(
@@ -163,6 +168,16 @@ class TestplanParser(object):
             **styles.StyleArg.get_parser_context(
                 default='extended-summary'))
 
+        report_group.add_argument(
+            '--pdf-failures-only', action='store_true',
+            dest='pdf_failures_only',
+            help='Skip assertion details of passing testcases on PDF report.')
+
+        report_group.add_argument(
+            '--pdf-processes', type=int, default=1, metavar='NUMBER',
+            dest='pdf_processes',
+            help='Number of processes used to render PDF report sections.')
+
         report_group.add_argument(
             '-v', '--verbose', action='store_true', dest='verbose',
             help='Enable verbose mode that will also set the stdout-style '
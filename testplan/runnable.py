@@ -4,7 +4,6 @@ import os
 import random
 import time
 import uuid
-import webbrowser
 
 from collections import OrderedDict
 
@@ -16,7 +15,6 @@ from testplan.common.entity import Entity, RunnableConfig, RunnableStatus, \
     RunnableResult, Runnable
 from testplan.common.exporters import BaseExporter, ExporterResult
 from testplan.common.utils.path import default_runpath
-from testplan.exporters import testing as test_exporters
 from testplan.logger import log_test_status, TEST_INFO, TESTPLAN_LOGGER
 
 from testplan.testing.base import TestResult
@@ -35,6 +33,9 @@ def get_default_exporters(config):
     Instantiate certain exporters if related cmdline argument (e.g. --pdf)
     is passed but there aren't any exporter declarations.
     """
+    # Exporters pull in heavy dependencies (e.g. reportlab), import them
+    # only when a plan exports its report.
+    from testplan.exporters import testing as test_exporters
     result = []
     if config.pdf_path:
         result.append(test_exporters.PDFExporter())
@@ -116,6 +117,8 @@ class TestRunnerConfig(RunnableConfig):
             ConfigOption(
                 'pdf_style',
                 default=defaults.PDF_STYLE): Style,
+            ConfigOption('pdf_failures_only', default=False): bool,
+            ConfigOption('pdf_processes', default=1): int,
             ConfigOption('report_tags', default=[]):
                 [Use(tagging.validate_tag_value)],
             ConfigOption('report_tags_all', default=[]):
@@ -130,7 +133,8 @@ class TestRunnerConfig(RunnableConfig):
             # Test lister is None by default, otherwise Testplan would
             # list tests, not run them
             ConfigOption('test_lister', default=None):
-                Or(None, listing.BaseLister)
+                Or(None, listing.BaseLister),
+            ConfigOption('manifest_path', default=None): Or(None, str),
         }, ignore_extra_keys=True)
         return self.inherit_schema(overrides, super(TestRunnerConfig, self))
 
@@ -204,6 +208,10 @@ class TestRunner(Runnable):
     :type json_path: ``str``
     :param pdf_style: PDF creation styling options.
     :type pdf_style: :py:class:`Style <testplan.report.testing.styles.Style>`
+    :param pdf_failures_only: Skip assertion rows of passing testcases.
+    :type pdf_failures_only: ``bool``
+    :param pdf_processes: Number of processes rendering PDF sections.
+    :type pdf_processes: ``int``
     :param report_tags: Matches tests marked with any of the given tags.
     :type report_tags: ``list``
     :param report_tags_all: Match tests marked with all of the given tags.
@@ -217,6 +225,11 @@ class TestRunner(Runnable):
     :param test_lister: Tests listing class.
     :type test_lister: Subclass of
       :py:class:`BaseLister <testplan.testing.listing.BaseLister>`
+    :param manifest_path: Path of a
+      :py:class:`manifest <testplan.testing.manifest.TestManifest>` of task
+      test contexts, which is used instead of materializing tasks to apply
+      filters and listing, and updated with tasks that are materialized.
+    :type manifest_path: ``str``
 
     Also inherits all
     :py:class:`~testplan.common.entity.base.Runnable` options.
@@ -229,7 +242,17 @@ class TestRunner(Runnable):
     def __init__(self, **options):
         super(TestRunner, self).__init__(**options)
         self._tests = OrderedDict()  # uid to resource
+        self._shards = {}  # shard uid to uid of the sharded test
         self._result.test_report = TestReport(name=self.cfg.name)
+        self._manifest = None
+
+    @property
+    def manifest(self):
+        """Test context manifest of tasks, if a path is configured."""
+        if self._manifest is None and self.cfg.manifest_path:
+            from testplan.testing.manifest import TestManifest
+            self._manifest = TestManifest(self.cfg.manifest_path)
+        return self._manifest
 
     @property
     def report(self):
@@ -280,6 +303,10 @@ class TestRunner(Runnable):
         :py:class:`runnable <testplan.common.entity.base.Runnable>` tests entity
         to an :py:class:`~testplan.runners.base.Executor` resource.
 
+        Runnables that split into several shards via ``get_shards`` are
+        added as one runnable per shard, and their results are merged into
+        a single result under the returned uid.
+
         :param runnable: Test runner entity.
         :type runnable: :py:class:`~testplan.common.entity.base.Runnable`
         :param resource: Test executor resource.
@@ -315,14 +342,39 @@ class TestRunner(Runnable):
             resource = self.resources.first()
         if resource not in self.resources:
             raise RuntimeError('Resource "{}" does not exist.'.format(resource))
-        self.resources[resource].add(runnable, uid)
-        self._tests[uid] = resource
+        for shard_uid, shard in self._get_shards(runnable, uid):
+            self.resources[resource].add(shard, shard_uid)
+            self._tests[shard_uid] = resource
         return uid
 
+    def _get_shards(self, runnable, uid):
+        """
+        Return (uid, runnable) pairs of the shards of a runnable, recording
+        the uid each shard result is merged into.
+        """
+        get_shards = getattr(runnable, 'get_shards', None)
+        shards = get_shards() if get_shards else [runnable]
+        if len(shards) == 1:
+            return [(uid, runnable)]
+
+        result = []
+        for shard in shards:
+            if isinstance(shard, Entity):
+                shard.cfg.parent = self.cfg
+                shard.parent = self
+            shard_uid = shard.uid()
+            self._shards[shard_uid] = uid
+            result.append((shard_uid, shard))
+        return result
+
     def should_be_added(self, runnable):
         """Determines if a test runnable should be added for execution."""
         if isinstance(runnable, Task):
-            target = runnable.materialize()
+            target = self.manifest and self.manifest.get(runnable)
+            if target is None:
+                target = runnable.materialize()
+                if self.manifest:
+                    self.manifest.record(runnable, target)
             target.cfg.parent = self.cfg
             target.parent = self
 
@@ -400,10 +452,39 @@ class TestRunner(Runnable):
                     test_results[uid] = resource_result.result
             else:
                 test_results[uid] = resource_result
-            self._result.test_report.append(test_results[uid].report)
             step_result = step_result and test_results[uid].run
+            if uid in self._shards:
+                self._merge_shard_result(self._shards[uid],
+                                         test_results.pop(uid))
+            else:
+                self._result.test_report.append(test_results[uid].report)
         return step_result
 
+    def _merge_shard_result(self, uid, shard_result):
+        """
+        Merge the result of a shard into the result of the sharded test,
+        which is created from the first shard result that is merged.
+        """
+        test_results = self._result.test_results
+        shard_report = shard_result.report
+        if uid not in test_results:
+            result = TestResult()
+            result.run = True
+            result.report = TestGroupReport(
+                name=shard_report.name,
+                category=shard_report.category,
+                description=shard_report.description,
+            )
+            test_results[uid] = result
+            self._result.test_report.append(result.report)
+
+        result = test_results[uid]
+        result.run = result.run and shard_result.run
+        # Shard reports have distinct uids, the children are
+        # appended or merged by uid with a non-strict merge.
+        shard_report.uid = result.report.uid
+        result.report.merge(shard_report, strict=False)
+
     def uid(self):
         """Entity uid."""
         return self.cfg.name
@@ -421,7 +502,10 @@ class TestRunner(Runnable):
             exporters = get_default_exporters(self.cfg)
         else:
             exporters = self.cfg.exporters
+        if not exporters:
+            return
 
+        from testplan.exporters import testing as test_exporters
         for exporter in exporters:
 
             if hasattr(exporter, 'cfg'):
@@ -444,6 +528,7 @@ class TestRunner(Runnable):
 
     def _post_exporters(self):
         if self.cfg.browse:
+            import webbrowser
             # Open exporter url to browse.
             for result in self._result.exporter_results:
                 if result.exporter.url is not None:
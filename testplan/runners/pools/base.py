@@ -449,7 +449,7 @@ class Pool(Executor):
         if not self.active or self.status.tag == self.STATUS.STOPPING:
             worker.respond(response.make(Message.Stop))
         elif request.cmd == Message.ConfigRequest:
-            options = self.cfg.copy()
+            options = self.cfg.shallow_copy()
             worker.respond(response.make(Message.ConfigSending,
                                          data=options))
         elif request.cmd == Message.TaskPullRequest:
@@ -6,8 +6,6 @@ import pickle
 import signal
 import subprocess
 
-import zmq
-
 from schema import Or, And, Use
 
 from .base import Pool, PoolConfig, Worker, WorkerConfig, ConnectionManager
@@ -154,6 +152,8 @@ class TCPConnectionManager(ConnectionManager):
 
     def __init__(self, cfg):
         """TODO."""
+        import zmq
+        self._zmq = zmq
         self._context = zmq.Context()
         self._sock = self._context.socket(zmq.REP)
         if cfg.port == 0:
@@ -178,8 +178,8 @@ class TCPConnectionManager(ConnectionManager):
             :py:class:`~testplan.runners.pools.communication.Message`
         """
         try:
-            return pickle.loads(self._sock.recv(flags=zmq.NOBLOCK))
-        except zmq.Again:
+            return pickle.loads(self._sock.recv(flags=self._zmq.NOBLOCK))
+        except self._zmq.Again:
             return None
 
     def close(self):
@@ -103,6 +103,26 @@ class Task(object):
         """Task target kwargs."""
         return self._kwargs
 
+    def get_shards(self):
+        """
+        Split the task into one task per shard when its target is given a
+        ``num_shards`` keyword argument greater than one. Each shard task
+        passes its position to the target as ``shard_index``.
+
+        :return: Shard tasks, or the task itself if it is not sharded.
+        :rtype: ``list`` of :py:class:`~testplan.runners.pools.tasks.base.Task`
+        """
+        num_shards = self._kwargs.get('num_shards', 1)
+        if num_shards == 1 or self._kwargs.get('shard_index') is not None:
+            return [self]
+        return [
+            self.__class__(target=self._target, module=self._module,
+                           path=self._path, args=self._args,
+                           kwargs=dict(self._kwargs, shard_index=idx),
+                           uid='{} - shard {}'.format(self._uid, idx))
+            for idx in range(num_shards)
+        ]
+
     def materialize(self, target=None):
         """
         Create the actual task target executable/runnable/callable object.
@@ -130,6 +150,9 @@ class Task(object):
             return self.materialize(target(*self._args, **self._kwargs))
 
     def _string_to_target(self):
+        from testplan.testing.multitest.suite import (
+            reset_testcase_registrations)
+
         path_inserted = False
         if isinstance(self._path, six.string_types):
             sys.path.insert(0, self._path)
@@ -137,19 +160,24 @@ class Task(object):
 
         elements = self._target.split('.')
         target_src = elements.pop(-1)
-        if len(elements):
-            mod = importlib.import_module('.'.join(elements))
-            target = getattr(mod, target_src)
-        else:
-            if self._module is None:
-                msg = 'Task parameters are not sufficient '\
-                      'for target {} materialization'.format(self._target)
-                raise TaskMaterializationError(msg)
-            mod = importlib.import_module(self._module)
-            target = getattr(mod, self._target)
-
-        if path_inserted is True:
-            sys.path.pop(0)
+        # Testcases left registered by a suite that failed to be defined
+        # must not be added to the suites of the target module.
+        reset_testcase_registrations()
+        try:
+            if len(elements):
+                mod = importlib.import_module('.'.join(elements))
+                target = getattr(mod, target_src)
+            else:
+                if self._module is None:
+                    msg = 'Task parameters are not sufficient '\
+                          'for target {} materialization'.format(self._target)
+                    raise TaskMaterializationError(msg)
+                mod = importlib.import_module(self._module)
+                target = getattr(mod, self._target)
+        finally:
+            reset_testcase_registrations()
+            if path_inserted is True:
+                sys.path.pop(0)
         return target
 
     def dumps(self, check_loadable=False):
@@ -1,6 +1,10 @@
 """Base classes for all Tests"""
 import os
+import json
+import hashlib
+import tempfile
 import subprocess
+from multiprocessing.pool import ThreadPool
 
 from lxml import objectify
 from schema import Or, Use
@@ -12,6 +16,7 @@ from testplan.common.config import ConfigOption
 from testplan.testing import filtering, ordering
 
 from testplan.common.entity import Runnable, RunnableResult, RunnableConfig
+from testplan.common.utils.path import makedirs, replace_file
 from testplan.common.utils.process import subprocess_popen
 from testplan.common.utils.timing import parse_duration, format_duration
 from testplan.common.utils.process import enforce_timeout, kill_process
@@ -209,7 +214,8 @@ class ProcessRunnerTestConfig(TestConfig):
             ConfigOption('timeout', default=None): Or(
                 float, int, Use(parse_duration)
             ),
-            ConfigOption('ignore_exit_codes', default=[]): [int]
+            ConfigOption('ignore_exit_codes', default=[]): [int],
+            ConfigOption('listing_cache_dir', default=None): Or(str, None),
         }
         return self.inherit_schema(
             overrides, super(ProcessRunnerTestConfig, self))
@@ -241,6 +247,13 @@ class ProcessRunnerTest(Test):
                     This can be disabled by providing a list of
                     numbers to ignore.
     :type ignore_exit_codes: ``list`` of ``int``
+    :param listing_cache_dir: Directory for caching the test context parsed
+                    from the output of ``list_command``. Cached contexts are
+                    keyed on the driver path, size and modification time and
+                    on the listing command, environment and directory.
+                    Listings of many tests can also be run concurrently
+                    with :py:func:`fetch_test_contexts`.
+    :type listing_cache_dir: ``str``
 
     Also inherits all
     :py:class:`~testplan.testing.base.Test` options.
@@ -300,6 +313,15 @@ class ProcessRunnerTest(Test):
         """
         raise NotImplementedError
 
+    def get_proc_env(self):
+        """
+        Override this to customize the environment of the test process.
+
+        :return: Environment for ``subprocess.Popen``.
+        :rtype: ``dict``
+        """
+        return self.cfg.proc_env
+
     def get_test_context(self):
         """
         Run the shell command generated by `list_command` in a subprocess,
@@ -308,14 +330,60 @@ class ProcessRunnerTest(Test):
         :return: Result returned by `parse_test_context`.
         :rtype: ``list`` of ``list``
         """
+        cache_path = self._listing_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path) as cache_file:
+                    return json.load(cache_file)
+            except (IOError, ValueError):
+                pass  # Unreadable cache entry, list the tests again
+
         proc = subprocess_popen(
             self.list_command(),
             cwd=self.cfg.proc_cwd,
             env=self.cfg.proc_env,
             stdout=subprocess.PIPE)
 
-        return self.parse_test_context(
+        test_context = self.parse_test_context(
             test_list_output=proc.communicate()[0])
+        if cache_path:
+            self._write_listing_cache(cache_path, test_context)
+        return test_context
+
+    def _listing_cache_path(self):
+        """
+        Path of the cached test context in `listing_cache_dir`, ``None`` if
+        caching is disabled or the driver does not exist.
+        """
+        if not self.cfg.listing_cache_dir:
+            return None
+        try:
+            stat = os.stat(self.cfg.driver)
+        except OSError:
+            return None
+        key = repr((
+            os.path.abspath(self.cfg.driver), stat.st_size, stat.st_mtime,
+            [str(arg) for arg in self.list_command()],
+            sorted(self.cfg.proc_env.items()), self.cfg.proc_cwd
+        ))
+        return os.path.join(
+            self.cfg.listing_cache_dir,
+            '{}.json'.format(hashlib.sha1(key.encode('utf-8')).hexdigest()))
+
+    def _write_listing_cache(self, cache_path, test_context):
+        """
+        Write a test context to the cache, via a temporary file so that
+        concurrent readers never see a partially written entry.
+        """
+        try:
+            makedirs(self.cfg.listing_cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cfg.listing_cache_dir)
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(test_context, tmp_file)
+            replace_file(tmp_path, cache_path)
+        except (IOError, OSError, TypeError, ValueError) as exc:
+            self.logger.debug(
+                'Cannot cache test context of {}: {}'.format(self, exc))
 
     def parse_test_context(self, test_list_output):
         """
@@ -383,7 +451,7 @@ class ProcessRunnerTest(Test):
                 stderr=stderr,
                 stdout=stdout,
                 cwd=self.cfg.proc_cwd,
-                env=self.cfg.proc_env,
+                env=self.get_proc_env(),
             )
 
             if self.cfg.timeout:
@@ -470,3 +538,27 @@ class ProcessRunnerTest(Test):
     def aborting(self):
         kill_process(self._test_process)
         self._test_process_killed = True
+
+
+def fetch_test_contexts(tests, size=8):
+    """
+    Retrieve the test contexts of tests concurrently in a thread pool, so
+    that the listing processes of many
+    :py:class:`~testplan.testing.base.ProcessRunnerTest` instances run in
+    parallel. Call this before adding the tests to a plan that uses
+    filtering or listing, which otherwise lists them one by one.
+
+    :param tests: Test instances.
+    :type tests: ``list`` of :py:class:`~testplan.testing.base.Test`
+    :param size: Maximum number of concurrent listings.
+    :type size: ``int``
+    """
+    tests = list(tests)
+    if not tests:
+        return
+    pool = ThreadPool(min(size, len(tests)))
+    try:
+        pool.map(lambda test: test.test_context, tests)
+    finally:
+        pool.close()
+        pool.join()
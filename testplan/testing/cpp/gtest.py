@@ -1,4 +1,11 @@
-from schema import Or
+import os
+import socket
+import threading
+from collections import OrderedDict
+
+from lxml import etree
+from schema import And, Or
+from six.moves.urllib.parse import unquote
 
 from testplan.common.config import ConfigOption
 
@@ -8,6 +15,9 @@ from testplan.testing.multitest.entries.schemas.base import registry
 
 from ..base import ProcessRunnerTest, ProcessRunnerTestConfig
 
+# Seconds to wait for streamed results before checking if the process exited
+STREAM_POLL_TIMEOUT = 0.1
+
 
 class GTestConfig(ProcessRunnerTestConfig):
     """
@@ -45,10 +55,130 @@ class GTestConfig(ProcessRunnerTestConfig):
             ConfigOption('gtest_death_test_style', default='fast'): Or(
                 'fast', 'threadsafe'
             ),
+            ConfigOption('stream_results', default=False): bool,
+            ConfigOption('num_shards', default=1): And(int, lambda n: n >= 1),
+            ConfigOption('shard_index', default=None): Or(None, int),
         }
         return self.inherit_schema(overrides, super(GTestConfig, self))
 
 
+def testcase_report(name, entries):
+    """
+    Create a testcase report with a raw assertion per GTest result entry.
+
+    :param name: Testcase name.
+    :type name: ``str``
+    :param entries: (tag, text) pairs, where ``failure`` tags are failing.
+    :type entries: ``iterable`` of ``tuple``
+    :return: Testcase report.
+    :rtype: :py:class:`~testplan.report.testing.base.TestCaseReport`
+    """
+    report = TestCaseReport(name=name)
+    for tag, text in entries:
+        assertion_obj = RawAssertion(
+            description=tag,
+            content=text,
+            passed=tag != 'failure'
+        )
+        report.append(registry.serialize(assertion_obj))
+    return report
+
+
+class StreamedResults(object):
+    """
+    Builds suite and testcase reports incrementally from the events that
+    Google Test sends with ``--gtest_stream_result_to``, one line per event
+    with url encoded ``key=value`` fields separated by ``&``:
+
+    .. code-block:: text
+
+        event=TestCaseStart&name=SquareRootTest
+        event=TestStart&name=PositiveNos
+        event=TestPartResult&file=tests.cpp&line=12&message=...
+        event=TestEnd&passed=0&elapsed_time=0ms
+        event=TestCaseEnd&passed=0&elapsed_time=0ms
+
+    Only the results of the last iteration are kept when tests are
+    repeated, like in the XML output.
+    """
+
+    def __init__(self):
+        self.suites = OrderedDict()
+        self.testcase = None  # started and not ended yet
+        self._suite_name = None
+
+    @staticmethod
+    def parse(line):
+        """
+        Parse an event line into a dictionary of its fields.
+
+        :param line: Event line without the line separator.
+        :type line: ``str``
+        :return: Event fields.
+        :rtype: ``dict``
+        """
+        fields = {}
+        for field in line.split('&'):
+            key, _, value = field.partition('=')
+            fields[key] = unquote(value)
+        return fields
+
+    def feed(self, line):
+        """
+        Update the reports with an event line.
+
+        :param line: Event line without the line separator.
+        :type line: ``str``
+        :return: Report of the testcase that ended with this event, if any.
+        :rtype: :py:class:`~testplan.report.testing.base.TestCaseReport`
+        """
+        fields = self.parse(line)
+        event = fields.get('event')
+
+        if event == 'TestIterationStart':
+            self.suites.clear()
+        elif event in ('TestCaseStart', 'TestSuiteStart'):
+            self._suite_name = fields['name']
+        elif event == 'TestStart':
+            self.testcase = testcase_report(fields['name'], [])
+            if self._suite_name not in self.suites:
+                self.suites[self._suite_name] = TestGroupReport(
+                    name=self._suite_name,
+                    category='suite',
+                    uid=self._suite_name,
+                )
+            self.suites[self._suite_name].append(self.testcase)
+        elif event == 'TestPartResult' and self.testcase is not None:
+            self.testcase.append(registry.serialize(RawAssertion(
+                description='failure',
+                content='{}:{}{}{}'.format(
+                    fields.get('file'), fields.get('line'),
+                    os.linesep, fields.get('message')),
+                passed=False
+            )))
+        elif event == 'TestEnd' and self.testcase is not None:
+            ended, self.testcase = self.testcase, None
+            if fields.get('passed') == '0' and ended.passed:
+                ended.status_override = Status.FAILED
+            return ended
+        return None
+
+    @property
+    def reports(self):
+        """
+        Suite reports built so far. A testcase that was started but not
+        ended (e.g. the process was killed) is marked as incomplete.
+
+        :return: Suite reports.
+        :rtype: ``list`` of
+          :py:class:`~testplan.report.testing.base.TestGroupReport`
+        """
+        if self.testcase is not None:
+            self.testcase.status_override = Status.INCOMPLETE
+            self.testcase.logger.error('Testcase did not complete.')
+        return list(self.suites.values())
+
+
 class GTest(ProcessRunnerTest):
     """
     Subprocess test runner for Google Test: https://github.com/google/googletest
@@ -83,6 +213,23 @@ class GTest(ProcessRunnerTest):
     :param gtest_death_test_style: Test style flag, can either be
                         ``threadsafe`` or ``fast``. (Default value is ``fast``)
     :type gtest_death_test_style: ``str``
+    :param stream_results: Consume the results streamed by Google Test on a
+                           local socket owned by the test instance while the
+                           process runs. The streamed results are used when
+                           the process is killed or does not produce its XML
+                           report. Ignored if ``gtest_stream_result_to`` is
+                           set.
+    :type stream_results: ``bool``
+    :param num_shards: Splits the test into this many instances, each running
+                       a disjoint subset of the binary's tests via the native
+                       ``GTEST_TOTAL_SHARDS`` and ``GTEST_SHARD_INDEX``
+                       environment variables. The shards can be executed in
+                       parallel by pool workers and their reports are merged
+                       back into a single report.
+    :type num_shards: ``int``
+    :param shard_index: Index of the shard run by this instance, set on the
+                        instances generated by ``get_shards``.
+    :type shard_index: ``int``
 
     Also inherits all
     :py:class:`~testplan.testing.base.ProcessTest` options.
@@ -90,6 +237,43 @@ class GTest(ProcessRunnerTest):
 
     CONFIG = GTestConfig
 
+    def __init__(self, **options):
+        super(GTest, self).__init__(**options)
+        self._stream_address = None  # set while results are streamed
+        self._streamed_results = None
+
+    def uid(self):
+        """Instance name uid, suffixed with the index of the shard."""
+        if self.cfg.shard_index is None:
+            return self.cfg.name
+        return '{} - shard {}'.format(self.cfg.name, self.cfg.shard_index)
+
+    def get_shards(self):
+        """
+        Split the test into ``num_shards`` instances that share the same
+        options, one per shard index.
+
+        :return: Shard instances, or the test itself if it is not sharded.
+        :rtype: ``list`` of :py:class:`~testplan.testing.cpp.gtest.GTest`
+        """
+        if self.cfg.num_shards == 1 or self.cfg.shard_index is not None:
+            return [self]
+        return [
+            self.__class__(**dict(self.cfg._cfg_input, shard_index=idx))
+            for idx in range(self.cfg.num_shards)
+        ]
+
+    def get_proc_env(self):
+        """Add the native sharding variables to the process environment."""
+        env = super(GTest, self).get_proc_env()
+        if self.cfg.shard_index is not None:
+            env = dict(
+                env,
+                GTEST_TOTAL_SHARDS=str(self.cfg.num_shards),
+                GTEST_SHARD_INDEX=str(self.cfg.shard_index),
+            )
+        return env
+
     def base_command(self):
         cmd = [self.cfg.driver]
         if self.cfg.gtest_filter:
@@ -121,44 +305,152 @@ class GTest(ProcessRunnerTest):
             cmd.append(
                 '--gtest_stream_result_to={}'.format(
                     self.cfg.gtest_stream_result_to))
+        elif self._stream_address:
+            cmd.append(
+                '--gtest_stream_result_to={}:{}'.format(*self._stream_address))
 
         return cmd
 
     def list_command(self):
         return self.base_command() + ['--gtest_list_tests']
 
-    def process_test_data(self, test_data):
+    def run_tests(self):
         """
-        XML output contains entries for skipped testcases
-        as well, which are not included in the report.
+        Run the tests, consuming the results streamed by the test process
+        on a local socket in a separate thread if `stream_results` is set.
         """
-        result = []
-        for suite in test_data.getchildren():
-            suite_report = TestGroupReport(
-                name=suite.attrib['name'],
-                category='suite',
-            )
-            suite_has_run = False
+        if not self.cfg.stream_results or self.cfg.gtest_stream_result_to:
+            return super(GTest, self).run_tests()
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('localhost', 0))
+        server.listen(1)
+        self._stream_address = server.getsockname()
+        self._streamed_results = StreamedResults()
+        finished = threading.Event()
+        reader = threading.Thread(
+            target=self._read_stream, args=(server, finished))
+        reader.daemon = True
+        reader.start()
+        try:
+            super(GTest, self).run_tests()
+        finally:
+            finished.set()
+            reader.join()
+            server.close()
+            self._stream_address = None
+
+    def _read_stream(self, server, finished):
+        """
+        Accept the connection of the test process and feed the event lines
+        it sends until it disconnects, or stops sending once it has exited.
+        """
+        server.settimeout(STREAM_POLL_TIMEOUT)
+        conn = None
+        while conn is None:
+            exited = finished.is_set()
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if exited:
+                    return
+
+        conn.settimeout(STREAM_POLL_TIMEOUT)
+        buffer = b''
+        try:
+            while True:
+                exited = finished.is_set()
+                try:
+                    data = conn.recv(4096)
+                except socket.timeout:
+                    if exited:
+                        break
+                    continue
+                if not data:
+                    break
+                lines = (buffer + data).split(b'\n')
+                buffer = lines.pop()
+                for line in lines:
+                    ended = self._streamed_results.feed(
+                        line.decode('utf-8', 'replace'))
+                    if ended is not None:
+                        self.logger.debug('{} - {}: {}'.format(
+                            self, ended.name, ended.status))
+        finally:
+            conn.close()
+
+    def read_test_data(self):
+        """
+        Parse `report.xml` incrementally via ``iterparse``, so that each
+        testcase element is released once processed. A truncated file
+        yields the testcases parsed before the truncation.
 
-            for testcase in suite.getchildren():
+        :return: (suite name, testcase element) pairs.
+        :rtype: generator of ``tuple``
+        """
+        with self.result.report.logged_exceptions():
+            for event, element in etree.iterparse(
+                    self.report_path, events=('start', 'end'),
+                    tag=('testsuite', 'testcase')):
+                if element.tag == 'testsuite':
+                    if event == 'start':
+                        suite_name = element.attrib['name']
+                    else:
+                        element.clear()
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
+                elif event == 'end':
+                    yield suite_name, element
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
 
-                testcase_report = TestCaseReport(name=testcase.attrib['name'])
+    def process_test_data(self, test_data):
+        """
+        XML output contains entries for skipped testcases
+        as well, which are not included in the report.
 
-                for entry in testcase.getchildren():
-                    assertion_obj = RawAssertion(
-                        description=entry.tag,
-                        content=entry.text,
-                        passed=entry.tag != 'failure'
-                    )
-                    testcase_report.append(registry.serialize(assertion_obj))
+        Suite reports use the suite name as uid, so that the reports of
+        different shards can be merged suite by suite.
 
-                if testcase.attrib['status'] != 'notrun':
-                    suite_report.append(testcase_report)
-                    suite_has_run = True
+        :param test_data: (suite name, testcase element) pairs generated by
+                          ``read_test_data``, or the root node of the XML.
+        :type test_data: ``iterable`` or ``xml.etree.Element``
+        """
+        if etree.iselement(test_data):
+            test_data = (
+                (suite.attrib['name'], testcase)
+                for suite in test_data.getchildren()
+                for testcase in suite.getchildren()
+            )
 
-            if suite_has_run:
-                result.append(suite_report)
-        return result
+        suites = OrderedDict()
+        for suite_name, testcase in test_data:
+            if testcase.attrib['status'] == 'notrun':
+                continue
+            if suite_name not in suites:
+                suites[suite_name] = TestGroupReport(
+                    name=suite_name,
+                    category='suite',
+                    uid=suite_name,
+                )
+            suites[suite_name].append(testcase_report(
+                testcase.attrib['name'],
+                [(entry.tag, entry.text) for entry in testcase.getchildren()]
+            ))
+        return list(suites.values())
+
+    def update_test_report(self):
+        """
+        Use the streamed results if the process was killed or did not
+        produce `report.xml`, so that the finished testcases are reported.
+        """
+        if self._streamed_results and self._test_has_run and (
+                self._test_process_killed
+                or not os.path.exists(self.report_path)):
+            self.result.report.entries = self._streamed_results.reports
+            return
+        super(GTest, self).update_test_report()
 
     def parse_test_context(self, test_list_output):
         """Parse GTest test output from report.xml"""
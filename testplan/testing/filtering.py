@@ -1,12 +1,15 @@
 """Filtering logic for Multitest, Suites and testcase methods (of Suites)"""
+import os
+import re
+import bisect
 import argparse
 import collections
 import fnmatch
 
+import six
 from enum import Enum, unique
 
 from testplan.testing import tagging
-from testplan.testing.multitest.suite import get_testsuite_name
 
 
 class FilterLevel(Enum):
@@ -21,6 +24,134 @@ class FilterLevel(Enum):
     CASE = 'case'
 
 
+GLOB_CHARS = '*?['
+
+
+def compile_glob(pattern):
+    """
+    Compile a glob style pattern into a match function,
+    equivalent to ``fnmatch.fnmatch`` against the pattern.
+    """
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    return lambda name: regex.match(os.path.normcase(name)) is not None
+
+
+def glob_prefix(pattern):
+    """Return the literal prefix of a glob style pattern."""
+    for idx, char in enumerate(pattern):
+        if char in GLOB_CHARS:
+            return pattern[:idx]
+    return pattern
+
+
+def _overrides(obj, base, name):
+    """Check if the class of ``obj`` overrides method ``name`` of ``base``."""
+    return six.get_unbound_function(getattr(type(obj), name)) is not \
+        six.get_unbound_function(getattr(base, name))
+
+
+class FilterIndex(object):
+    """
+    Index of the names and tags of the testcases of a test, filters evaluate
+    against it with set operations instead of checking each testcase.
+
+    Testcases are identified by their position in ``entries``.
+
+    :param test: Test the testcases belong to.
+    :type test: :py:class:`~testplan.testing.base.Test`
+    :param suites: Suites of the test and their testcases.
+    :type suites: ``list`` of (``suite``, ``list`` of ``testcase``)
+    """
+
+    def __init__(self, test, suites):
+        self.test = test
+        self.levels = test.get_filter_levels()
+        self.entries = []
+        self.suites = []
+        self._suite_positions = []
+        self._case_names = collections.defaultdict(set)
+        self._case_tags = None
+
+        for position, (suite, testcases) in enumerate(suites):
+            start = len(self.entries)
+            for case in testcases:
+                idx = len(self.entries)
+                self.entries.append((suite, case))
+                self._suite_positions.append(position)
+                self._case_names[os.path.normcase(case.__name__)].add(idx)
+            self.suites.append(
+                (suite, frozenset(range(start, len(self.entries)))))
+
+        self.all = frozenset(range(len(self.entries)))
+        self._sorted_names = sorted(self._case_names)
+
+    def suite_position(self, idx):
+        """Return the position of the suite of a testcase."""
+        return self._suite_positions[idx]
+
+    def select_entries(self, predicate):
+        """Select testcases by checking ``predicate(suite, case)`` on each."""
+        return frozenset(
+            idx for idx, (suite, case) in enumerate(self.entries)
+            if predicate(suite, case))
+
+    def select_suites(self, predicate):
+        """Select the testcases of suites matching ``predicate(suite)``."""
+        selected = set()
+        for suite, ids in self.suites:
+            if predicate(suite):
+                selected.update(ids)
+        return frozenset(selected)
+
+    def match_case_names(self, pattern):
+        """Select testcases with names matching a glob style pattern."""
+        pattern = os.path.normcase(pattern)
+        prefix = glob_prefix(pattern)
+        if prefix == pattern:
+            return frozenset(self._case_names.get(pattern, ()))
+
+        match = compile_glob(pattern)
+        selected = set()
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        for name in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            if match(name):
+                selected.update(self._case_names[name])
+        return frozenset(selected)
+
+    @property
+    def case_tags(self):
+        """
+        Testcase positions by (tag name, tag value), built on first
+        access as only tag filters need it.
+        """
+        if self._case_tags is None:
+            self._case_tags = collections.defaultdict(set)
+            for idx, (_, case) in enumerate(self.entries):
+                case_tags = tagging.get_testcase_tags(case)
+                for tag_name, tag_values in case_tags.items():
+                    for tag_value in tag_values:
+                        self._case_tags[(tag_name, tag_value)].add(idx)
+        return self._case_tags
+
+    def match_case_tags(self, tag_dict, match_all=False):
+        """
+        Select testcases with any (or all, if ``match_all``)
+        of the tags in ``tag_dict``.
+        """
+        case_tags = self.case_tags
+        result = self.all if match_all else frozenset()
+        for tag_name, tag_values in tag_dict.items():
+            for tag_value in tag_values:
+                ids = case_tags.get((tag_name, tag_value), ())
+                if match_all:
+                    result = result.intersection(ids)
+                else:
+                    result = result.union(ids)
+        return result
+
+
 class BaseFilter(object):
     """
     Base class for filters, supports bitwise
@@ -32,6 +163,14 @@ class BaseFilter(object):
     def filter(self, test, suite, case):
         raise NotImplementedError
 
+    def select(self, index):
+        """
+        Return the positions of the testcases in a
+        :py:class:`FilterIndex` that pass the filter.
+        """
+        return index.select_entries(
+            lambda suite, case: self.filter(index.test, suite, case))
+
     def __or__(self, other):
         return Or(self, other)
 
@@ -76,6 +215,25 @@ class Filter(BaseFilter):
 
         return all(results)
 
+    def select_cases(self, index):
+        """Return the testcases of an index that pass ``filter_case``."""
+        return index.select_entries(
+            lambda suite, case: self.filter_case(case))
+
+    def select(self, index):
+        if _overrides(self, Filter, 'filter'):
+            return super(Filter, self).select(index)
+
+        if FilterLevel.TEST in index.levels and \
+                not self.filter_test(index.test):
+            return frozenset()
+        selected = index.all
+        if FilterLevel.SUITE in index.levels:
+            selected = index.select_suites(self.filter_suite)
+        if selected and FilterLevel.CASE in index.levels:
+            selected = selected & self.select_cases(index)
+        return selected
+
 
 def flatten_filters(metafilter_kls, filters):
     """
@@ -152,6 +310,14 @@ class Or(MetaFilter):
             return False
         return composed_filter
 
+    def select(self, index):
+        selected = frozenset()
+        for filter_obj in self.filters:
+            selected = selected | filter_obj.select(index)
+            if len(selected) == len(index.all):
+                break
+        return selected
+
 
 class And(MetaFilter):
     """Meta filter that returns True if ALL of the child filters return True"""
@@ -166,6 +332,14 @@ class And(MetaFilter):
             return True
         return composed_filter
 
+    def select(self, index):
+        selected = index.all
+        for filter_obj in self.filters:
+            if not selected:
+                break
+            selected = selected & filter_obj.select(index)
+        return selected
+
 
 class Not(BaseFilter):
     """Meta filter that returns the inverse of the original filter result."""
@@ -186,6 +360,9 @@ class Not(BaseFilter):
     def filter(self, test, suite, case):
         return not self.filter_obj.filter(test, suite, case)
 
+    def select(self, index):
+        return index.all - self.filter_obj.select(index)
+
 
 class BaseTagFilter(Filter):
     """Base filter class for tag based filtering."""
@@ -227,6 +404,11 @@ class Tags(BaseTagFilter):
     def get_match_func(self):
         return tagging.check_any_matching_tags
 
+    def select_cases(self, index):
+        if _overrides(self, BaseTagFilter, 'filter_case'):
+            return super(Tags, self).select_cases(index)
+        return index.match_case_tags(self.tags)
+
 
 class TagsAll(BaseTagFilter):
     """Tag filter that returns True if ALL of the given tags match."""
@@ -234,6 +416,11 @@ class TagsAll(BaseTagFilter):
     def get_match_func(self):
         return tagging.check_all_matching_tags
 
+    def select_cases(self, index):
+        if _overrides(self, BaseTagFilter, 'filter_case'):
+            return super(TagsAll, self).select_cases(index)
+        return index.match_case_tags(self.tags, match_all=True)
+
 
 class Pattern(Filter):
     """
@@ -258,6 +445,8 @@ class Pattern(Filter):
         self.pattern = pattern
         patterns = self.parse_pattern(pattern)
         self.test_pattern, self.suite_pattern, self.case_pattern = patterns
+        self._test_match, self._suite_match, self._case_match = [
+            compile_glob(pattern) for pattern in patterns]
 
     def __repr__(self):
         return '{}(pattern="{}")'.format(self.__class__.__name__, self.pattern)
@@ -273,15 +462,20 @@ class Pattern(Filter):
         return patterns + ([self.ALL_MATCH] * (self.MAX_LEVEL - len(patterns)))
 
     def filter_test(self, test):
-        return fnmatch.fnmatch(test.name, self.test_pattern)
+        return self._test_match(test.name)
 
     def filter_suite(self, suite):
-        return fnmatch.fnmatch(
-            get_testsuite_name(suite), self.suite_pattern)
+        # Imported here as the multitest package imports this module
+        from testplan.testing.multitest.suite import get_testsuite_name
+        return self._suite_match(get_testsuite_name(suite))
 
     def filter_case(self, case):
-        return fnmatch.fnmatch(
-            case.__name__, self.case_pattern)
+        return self._case_match(case.__name__)
+
+    def select_cases(self, index):
+        if _overrides(self, Pattern, 'filter_case'):
+            return super(Pattern, self).select_cases(index)
+        return index.match_case_names(self.case_pattern)
 
     @classmethod
     def any(cls, *patterns):
@@ -0,0 +1,314 @@
+"""
+Persisted manifest of the test context of scheduled tasks.
+
+Filtering and listing tasks requires their test context (suites, testcases
+and tags), which is normally only available after materializing the task:
+importing its module and constructing the test with all of its drivers.
+The manifest records the test context of materialized
+:py:class:`~testplan.testing.multitest.base.MultiTest` tasks along with the
+modification stamps of the source files they were built from, so later runs
+can filter and list unchanged tasks from the manifest alone.
+
+The manifest file has one JSON record per line, records are appended as
+tasks are materialized and the latest record of a task wins.
+"""
+
+import os
+import sys
+import json
+import inspect
+import collections
+
+import six
+
+from testplan.common.config import Config
+from testplan.common.utils.path import replace_file
+from testplan.testing.base import Test
+from testplan.testing.multitest import MultiTest
+
+MANIFEST_VERSION = 1
+
+
+def _tags_to_json(tags):
+    return {name: sorted(values) for name, values in tags.items()}
+
+
+def _tags_from_json(tags):
+    return {str(name): frozenset(values) for name, values in tags.items()}
+
+
+def _source_file(path):
+    """Return the source file of a module file path."""
+    if path and path.endswith(('.pyc', '.pyo')):
+        return path[:-1]
+    return path
+
+
+def _find_module_file(name, path=None):
+    """
+    Return the source file of a module without importing it,
+    ``None`` if it cannot be found.
+    """
+    parts = name.split('.')
+    for directory in ([path] if path else []) + sys.path:
+        base = os.path.join(os.path.abspath(directory or os.curdir), *parts)
+        for candidate in (base + '.py', os.path.join(base, '__init__.py')):
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+class ManifestTestcase(object):
+    """
+    Stand-in for a bound testcase method recorded in a manifest.
+
+    :param suite: Suite the testcase belongs to.
+    :type suite: :py:class:`ManifestSuite`
+    :param name: Testcase name.
+    :type name: ``str``
+    :param tags: Native tags of the testcase.
+    :type tags: ``dict``
+    """
+
+    def __init__(self, suite, name, tags):
+        self.__name__ = name
+        self.__self__ = suite
+        if tags:
+            self.tags = tags
+
+    @property
+    def im_class(self):
+        return type(self.__self__)
+
+    def __repr__(self):
+        return '{}[{}]'.format(self.__class__.__name__, self.__name__)
+
+
+class ManifestSuite(object):
+    """
+    Stand-in for a testsuite instance recorded in a manifest.
+
+    Filters, sorters and listers identify suites by their class name and
+    read suite tags from the class, so each record is materialized as a
+    subclass named after the recorded suite class, see
+    :py:meth:`from_record`.
+
+    :param method_tags: Native tags of the testcase methods of the suite.
+    :type method_tags: ``list`` of ``dict``
+    :param testcases: Names and native tags of the testcases of the suite.
+    :type testcases: ``list`` of (``str``, ``dict``)
+    """
+
+    def __init__(self, method_tags, testcases):
+        self._methods = collections.OrderedDict(
+            (str(idx), ManifestTestcase(self, str(idx), tags))
+            for idx, tags in enumerate(method_tags))
+        self._testcases = collections.OrderedDict(
+            (name, ManifestTestcase(self, name, tags))
+            for name, tags in testcases)
+
+    @classmethod
+    def from_record(cls, record):
+        """Create the stand-in of a suite from its manifest record."""
+        attrs = {'__TAGS__': _tags_from_json(record['tags'])}
+        suite_name = record['suite_name']
+        if suite_name is not None:
+            attrs['suite_name'] = lambda self: suite_name
+        klass = type(str(record['class']), (cls,), attrs)
+        return klass(
+            method_tags=[
+                _tags_from_json(tags) for tags in record['method_tags']],
+            testcases=[(str(name), _tags_from_json(tags))
+                       for name, tags in record['testcases']])
+
+    def get_testcase_methods(self):
+        return self._methods
+
+    def get_testcases(self):
+        return self._testcases
+
+    def iter_testcases(self):
+        return iter(self._testcases.values())
+
+
+class ManifestMultiTestConfig(Config):
+    """
+    Configuration object for
+    :py:class:`ManifestMultiTest <testplan.testing.manifest.ManifestMultiTest>`
+    entity, all other options are retrieved from the parent configuration.
+    """
+
+    def configuration_schema(self):
+        return {'name': str, 'suites': list}
+
+
+class ManifestMultiTest(MultiTest):
+    """
+    Stand-in for a :py:class:`~testplan.testing.multitest.base.MultiTest`
+    recorded in a manifest, it supports test context filtering, sorting and
+    listing but cannot be run.
+
+    :param name: Test name.
+    :type name: ``str``
+    :param suites: Suite stand-ins.
+    :type suites: ``list`` of :py:class:`ManifestSuite`
+    """
+    CONFIG = ManifestMultiTestConfig
+
+    def __init__(self, name, suites):
+        # MultiTest construction sets up the environment and report of a run
+        Test.__init__(self, name=name, suites=suites)
+        self.tags = {}
+
+    def run(self):
+        raise RuntimeError('{} cannot be run.'.format(self))
+
+
+class TestManifest(object):
+    """
+    Test context cache of tasks, backed by a file.
+
+    :param path: Path of the manifest file.
+    :type path: ``str``
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._records = {}
+        self._stamps = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        lines = 0
+        with open(self.path, 'r') as fobj:
+            for line in fobj:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Partially written record
+                if record.get('version') == MANIFEST_VERSION:
+                    self._records[record['key']] = record
+        if lines > 2 * len(self._records) + 100:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the manifest file without superseded records."""
+        tmp_path = '{}.tmp'.format(self.path)
+        with open(tmp_path, 'w') as fobj:
+            for record in self._records.values():
+                fobj.write(json.dumps(record) + '\n')
+        replace_file(tmp_path, self.path)
+
+    def _stamp(self, path):
+        """Modification stamp of a file, stat-ed once per manifest."""
+        if path not in self._stamps:
+            try:
+                stat = os.stat(path)
+                self._stamps[path] = [stat.st_mtime, stat.st_size]
+            except OSError:
+                self._stamps[path] = None
+        return self._stamps[path]
+
+    @staticmethod
+    def task_key(task):
+        """
+        Return the key of a task in the manifest, ``None`` if the test
+        context of the task cannot be cached.
+        """
+        if not isinstance(task._target, six.string_types):
+            return None
+        key = repr((task._target, task._module, task._path,
+                    task._args, sorted(task._kwargs.items())))
+        # Default object representations differ between runs
+        return None if ' at 0x' in key else key
+
+    def _task_module_file(self, task):
+        if task._module:
+            module = task._module
+        else:
+            module = task._target.rsplit('.', 1)[0]
+        return _find_module_file(module, task._path)
+
+    def get(self, task):
+        """
+        Return a stand-in of the test of a task if it is in the manifest and
+        its source files did not change since it was recorded.
+
+        :param task: Task to look up.
+        :type task: :py:class:`~testplan.runners.pools.tasks.base.Task`
+        :return: Test stand-in or ``None``.
+        :rtype: :py:class:`ManifestMultiTest`
+        """
+        key = self.task_key(task)
+        record = self._records.get(key) if key else None
+        if record is None:
+            return None
+        for path, stamp in record['files'].items():
+            if self._stamp(path) != stamp:
+                return None
+        return ManifestMultiTest(
+            name=str(record['name']),
+            suites=[ManifestSuite.from_record(suite)
+                    for suite in record['suites']])
+
+    def record(self, task, target):
+        """
+        Record the test context of a materialized task, if it can be
+        reproduced from the manifest.
+
+        :param task: Materialized task.
+        :type task: :py:class:`~testplan.runners.pools.tasks.base.Task`
+        :param target: Test the task materialized into.
+        :type target: :py:class:`~testplan.testing.base.Test`
+        """
+        key = self.task_key(task)
+        # Subclasses and own filters / sorters may use more than the
+        # recorded names and tags.
+        if key is None or type(target) is not MultiTest or any(
+                option in target.cfg._cfg_input
+                for option in ('test_filter', 'test_sorter')):
+            return
+
+        module_file = self._task_module_file(task)
+        if module_file is None:
+            return
+        files = set([module_file])
+        suites = []
+        for suite in target.suites:
+            # Testcases and tags may be inherited from base suites
+            for klass in inspect.getmro(type(suite)):
+                if klass.__module__ in ('builtins', '__builtin__'):
+                    continue
+                module = sys.modules.get(klass.__module__)
+                files.add(_source_file(getattr(module, '__file__', None)))
+            suite_name = None
+            if callable(getattr(suite, 'suite_name', None)):
+                suite_name = suite.suite_name()
+            suites.append({
+                'class': type(suite).__name__,
+                'suite_name': suite_name,
+                'tags': _tags_to_json(getattr(suite, '__TAGS__', {})),
+                'method_tags': [
+                    _tags_to_json(method.tags)
+                    for method in suite.get_testcase_methods().values()
+                    if hasattr(method, 'tags')],
+                'testcases': [
+                    (name, _tags_to_json(getattr(case, 'tags', {})))
+                    for name, case in suite.get_testcases().items()],
+            })
+
+        if None in files:
+            return
+        record = {
+            'version': MANIFEST_VERSION,
+            'key': key,
+            'name': target.name,
+            'files': {path: self._stamp(path) for path in files},
+            'suites': suites,
+        }
+        self._records[key] = record
+        with open(self.path, 'a') as fobj:
+            fobj.write(json.dumps(record) + '\n')
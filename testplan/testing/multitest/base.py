@@ -19,6 +19,7 @@ from testplan.testing import tagging, filtering
 from .entries.base import Summary
 from .result import Result
 from .suite import set_testsuite_testcases
+from . import parametrization
 
 from ..base import Test, TestConfig
 
@@ -155,22 +156,24 @@ class MultiTest(Test):
         Return filtered & sorted list of suites & testcases
         via `cfg.test_filter` & `cfg.test_sorter`.
         """
-        ctx = []
-        test_filter = self.cfg.test_filter
         test_sorter = self.cfg.test_sorter
-        sorted_suites = test_sorter.sorted_testsuites(self.cfg.suites)
-
-        for suite in sorted_suites:
-            sorted_testcases = test_sorter.sorted_testcases(
-                suite.get_testcases().values())
-
-            testcases_to_run = [
-                case for case in sorted_testcases
-                if test_filter.filter(
-                    test=self, suite=suite, case=case)]
-
-            if testcases_to_run:
-                ctx.append((suite, testcases_to_run))
+        index = filtering.FilterIndex(
+            test=self,
+            suites=[
+                (suite, test_sorter.sorted_testcases(suite.iter_testcases()))
+                for suite in test_sorter.sorted_testsuites(self.cfg.suites)])
+
+        # Filters select from the index, so only the matching
+        # testcases are visited here
+        ctx = []
+        last_position = None
+        for idx in sorted(self.cfg.test_filter.select(index)):
+            suite, case = index.entries[idx]
+            position = index.suite_position(idx)
+            if position != last_position:
+                ctx.append((suite, []))
+                last_position = position
+            ctx[-1][1].append(case)
         return ctx
 
     def run_tests(self):
@@ -250,7 +253,8 @@ class MultiTest(Test):
                                 tags=tagging.get_native_testcase_tags(
                                     param_method),
                                 tags_index=tagging.merge_tag_dicts(
-                                    param_method.generated_tags,
+                                    parametrization.get_generated_tags(
+                                        param_method),
                                     tagging.get_native_suite_tags(testsuite)
                                 )
                             )
@@ -1,9 +1,11 @@
 """Generic application driver."""
 
 import os
+import time
 import uuid
 import shutil
 import warnings
+import threading
 import subprocess
 
 from schema import Or
@@ -11,7 +13,9 @@ from schema import Or
 from testplan.common.config import ConfigOption
 from testplan.common.utils.path import StdFiles, makedirs
 from testplan.common.utils.context import is_context, expand
-from testplan.common.utils.process import kill_process
+from testplan.common.utils.process import (
+    kill_process, terminate_process, wait_process, reap_process,
+    NEW_SESSION_KWARGS)
 
 from testplan.logger import TESTPLAN_LOGGER
 
@@ -35,6 +39,8 @@ class AppConfig(DriverConfig):
                      ConfigOption('env', default=None): Or(None, dict),
                      ConfigOption('binary_copy', default=False): bool,
                      ConfigOption('app_dir_name', default=None): Or(None, str),
+                     ConfigOption('stop_timeout', default=5):
+                         Or(int, float),
                      }
         return self.inherit_schema(overrides, super(AppConfig, self))
 
@@ -61,6 +67,9 @@ class App(Driver):
     :type binary_copy: ``bool``
     :param app_dir_name: Application directory name.
     :type app_dir_name: ``str``
+    :param stop_timeout: Seconds the application is given to exit after
+        ``SIGTERM`` before it is killed.
+    :type stop_timeout: ``int`` or ``float``
 
     Also inherits all
     :py:class:`~testplan.testing.multitest.driver.base.DriverConfig`` options.
@@ -76,6 +85,9 @@ class App(Driver):
         self._binpath = None
         self._etcpath = None
         self._retcode = None
+        self._terminated = None
+        self._stop_deadline = None
+        self._reaper = None
 
     @property
     def pid(self):
@@ -97,8 +109,9 @@ class App(Driver):
         :rtype: ``int`` or ``NoneType``
         """
         if self._retcode is None:
-            if self.proc:
-                self._retcode = self.proc.poll()
+            proc = self.proc  # May be reaped concurrently
+            if proc:
+                self._retcode = proc.poll()
         return self._retcode
 
     @property
@@ -184,7 +197,7 @@ class App(Driver):
                 out=self.std.out_path, err=self.std.err_path))
             self.proc = subprocess.Popen(cmd, shell=self.cfg.shell,
                 stdout=self.std.out, stderr=self.std.err,
-                cwd=self.runpath, env=self.cfg.env)
+                cwd=self.runpath, env=self.cfg.env, **NEW_SESSION_KWARGS)
         except Exception:
             TESTPLAN_LOGGER.error(
                 'Error while App[%s] driver executed command: %s',
@@ -192,17 +205,56 @@ class App(Driver):
             raise
 
     def stopping(self):
-        """Stops the application binary process."""
+        """
+        Signals the application process group to terminate. It is waited for
+        and reaped in a background thread, which is joined when the stopped
+        status is awaited, so that all drivers of an environment are
+        signalled before any of them is waited for.
+        """
         super(App, self).stopping()
+        self._stop_deadline = time.time() + self.cfg.stop_timeout
         try:
-            self._retcode = kill_process(self.proc)
+            if self.proc.poll() is None:
+                self._terminated = terminate_process(self.proc)
+            elif NEW_SESSION_KWARGS:
+                # Exited already, only its group may need reaping
+                self._terminated = (self.proc.pid, [])
         except Exception as exc:
-            warnings.warn('On killing driver {} process - {}'.format(
+            warnings.warn('On terminating driver {} process - {}'.format(
                 self.cfg.name, exc))
-            self._retcode = self.proc.poll()
-        self.proc = None
-        if self.std:
-            self.std.close()
+        self._reaper = threading.Thread(target=self._reap)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap(self):
+        """
+        Waits until the application process exits, for up to ``stop_timeout``
+        since it was signalled, kills anything left in its group and closes
+        its std files.
+        """
+        if self.proc is not None:
+            try:
+                if self._terminated is not None:
+                    wait_process(
+                        self.proc, max(self._stop_deadline - time.time(), 0))
+                    self._retcode = reap_process(self.proc, self._terminated)
+                else:
+                    self._retcode = self.proc.poll()
+            except Exception as exc:
+                warnings.warn('On killing driver {} process - {}'.format(
+                    self.cfg.name, exc))
+                self._retcode = self.proc.poll()
+            self.proc = None
+            self._terminated = None
+            if self.std:
+                self.std.close()
+
+    def _wait_stopped(self, timeout=None):
+        """Waits for the process to be reaped before the stopped check."""
+        if self._reaper is not None:
+            self._reaper.join()
+            self._reaper = None
+        super(App, self)._wait_stopped(timeout=timeout)
 
     def _make_dirs(self):
         bin_dir = os.path.join(self.runpath, 'bin')
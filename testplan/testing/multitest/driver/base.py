@@ -7,7 +7,7 @@ from schema import Or
 
 from testplan.common.config import ConfigOption
 from testplan.common.entity import Resource, ResourceConfig, FailedAction
-from testplan.common.utils.match import match_regexps_in_file
+from testplan.common.utils.match import FileRegexMatcher, LogMatcher
 from testplan.common.utils.path import instantiate
 from testplan.common.utils.timing import wait
 
@@ -106,6 +106,8 @@ class Driver(Resource):
         super(Driver, self).__init__(**options)
         self.extracts = {}
         self.file_logger = None
+        self._regex_matchers = {}
+        self._log_matcher = None
 
     @property
     def name(self):
@@ -124,8 +126,9 @@ class Driver(Resource):
 
     def started_check(self, timeout=None):
         """Driver started status condition check."""
+        # Checks only stat the files until they grow, so poll often
         wait(lambda: self.extract_values(), self.cfg.timeout,
-             raise_on_timeout=True)
+             interval=0.01, raise_on_timeout=True)
 
     def pre_stop(self):
         """Callable to be executed right before driver stops."""
@@ -139,6 +142,7 @@ class Driver(Resource):
     def starting(self):
         """Trigger driver start."""
         self.make_runpath_dirs()
+        self._regex_matchers = {}
         self.pre_start()
 
     def stopping(self):
@@ -174,8 +178,36 @@ class Driver(Resource):
         """Path for stderr file regex matching."""
         return None
 
+    @property
+    def log_matcher(self):
+        """
+        :py:class:`~testplan.common.utils.match.LogMatcher` of the driver
+        log file, which keeps its position between calls so testcases can
+        wait for consecutive log lines.
+        """
+        if self._log_matcher is None or \
+                self._log_matcher.log_path != self.logpath:
+            self._log_matcher = LogMatcher(self.logpath)
+        return self._log_matcher
+
+    def _regex_matcher(self, path, regexps):
+        """
+        Return the matcher of the given regexps in the file at path, which
+        keeps its position in the file between calls.
+        """
+        matcher = self._regex_matchers.get(path)
+        if matcher is None or matcher.regexps != list(regexps):
+            matcher = FileRegexMatcher(path, regexps)
+            self._regex_matchers[path] = matcher
+        return matcher
+
     def extract_values(self):
-        """Extract matching values from input regex configuration options."""
+        """
+        Extract matching values from input regex configuration options.
+
+        Files are matched incrementally, only the lines written since the
+        previous call are read and regexps that matched are not tried again.
+        """
         log_unmatched = []
         stdout_unmatched = []
         stderr_unmatched = []
@@ -193,13 +225,10 @@ class Driver(Resource):
                 (self.errpath, self.cfg.stderr_regexps, stderr_unmatched))
 
         for outfile, regexps, unmatched in regex_sources:
-            file_result, file_extracts, file_unmatched = match_regexps_in_file(
-                logpath=outfile,
-                log_extracts=regexps,
-                return_unmatched=True
-            )
-            unmatched.extend(file_unmatched)
-            self.extracts.update(file_extracts)
+            matcher = self._regex_matcher(outfile, regexps)
+            file_result = matcher.update()
+            unmatched.extend(matcher.unmatched)
+            self.extracts.update(matcher.extracts)
             result = result and file_result
 
         if log_unmatched or stdout_unmatched or stderr_unmatched:
@@ -1,6 +1,7 @@
 """FixClient driver classes."""
 
 import os
+import time
 import errno
 import socket
 
@@ -8,6 +9,7 @@ from schema import Use, Or
 
 from testplan.common.config import ConfigOption
 from testplan.common.utils.context import is_context, expand
+from testplan.common.utils.latency import LatencyRecorder
 from testplan.common.utils.strings import slugify
 from testplan.common.utils.sockets.fix.client import Client
 from testplan.common.utils.timing import (TimeoutException,
@@ -43,10 +45,25 @@ class FixClientConfig(DriverConfig):
                      ConfigOption('logon_timeout', default=10):
                          Or(int, float),
                      ConfigOption('logoff_timeout', default=3):
-                         Or(int, float)}
+                         Or(int, float),
+                     ConfigOption('latency_key', default=None):
+                         Or(None, int, lambda x: callable(x))}
         return self.inherit_schema(overrides, super(FixClientConfig, self))
 
 
+def _tag_value(tag):
+    """
+    Return a function that gets the value of a tag from a FIX message, as
+    ``bytes`` so that values of sent and received messages compare equal.
+    """
+    def get_value(msg):
+        value = msg.get(tag)
+        if value is None or isinstance(value, bytes):
+            return value
+        return str(value).encode('utf-8')
+    return get_value
+
+
 class FixClient(Driver):
     """
     Fix client driver.
@@ -89,6 +106,11 @@ class FixClient(Driver):
     :type logon_timeout: ``int`` or ``float``
     :param logoff_timeout: Timeout in seconds to wait for logoff response.
     :type logoff_timeout: ``int`` or ``float``
+    :param latency_key: Tag that correlates sent and received messages, e.g.
+      11 (ClOrdID), or a function that returns the correlation key of a
+      message. If provided, round-trip latencies are recorded in
+      :py:attr:`~testplan.testing.multitest.driver.fix.client.FixClient.latency`.
+    :type latency_key: ``int`` or ``callable``
 
     Also inherits all
     :py:class:`~testplan.testing.multitest.driver.base.Driver`` options.
@@ -102,6 +124,18 @@ class FixClient(Driver):
         self._port = None
         self._client = None
         self._logname = '{0}.log'.format(slugify(self.cfg.name))
+        latency_key = self.cfg.latency_key
+        if isinstance(latency_key, int):
+            latency_key = _tag_value(latency_key)
+        self._latency = LatencyRecorder(key=latency_key)
+
+    @property
+    def latency(self):
+        """
+        :py:class:`~testplan.common.utils.latency.LatencyRecorder` of
+        round-trip latencies.
+        """
+        return self._latency
 
     @property
     def logpath(self):
@@ -208,7 +242,7 @@ class FixClient(Driver):
         :return: msg
         :rtype: ``FixMessage``
         """
-        return self._client.send(msg)[1]
+        return self.send_tsp(msg)[1]
 
     def send_tsp(self, msg):
         """
@@ -220,7 +254,28 @@ class FixClient(Driver):
         :return: Timestamp when msg sent (in microseconds from epoch) and msg.
         :rtype: ``tuple`` of ``long`` and ``FixMessage``
         """
-        return self._client.send(msg)
+        tsp, msg = self._client.send(msg)
+        if self.cfg.latency_key:
+            self._latency.sent(msg, tsp)
+        return tsp, msg
+
+    def send_many(self, msgs):
+        """
+        Send a batch of messages, much faster than sending them one by one.
+
+        :param msgs: Messages to be sent.
+        :type msgs: ``list`` of ``FixMessage``
+
+        :return: Timestamps when each msg was sent
+          (in microseconds from epoch), taken per batch of messages
+          written together rather than per message.
+        :rtype: ``array.array`` of ``float``
+        """
+        tsps, msgs = self._client.send_many(msgs)
+        if self.cfg.latency_key:
+            for msg, tsp in zip(msgs, tsps):
+                self._latency.sent(msg, tsp)
+        return tsps
 
     def receive(self, timeout=None):
         """
@@ -244,6 +299,39 @@ class FixClient(Driver):
                 'Timed out waiting for message on {0}. {1}'.format(
                     self.cfg.name, timeout_info.msg()))
         self.file_logger.debug('Received msg {}.'.format(received))
+        if self.cfg.latency_key:
+            self._latency.received(received, time.time() * 1000000)
+        return received
+
+    def receive_many(self, count, timeout=None):
+        """
+        Receive a batch of messages.
+
+        :param count: Number of messages to receive.
+        :type count: ``int``
+        :param timeout: Timeout in seconds for receiving all messages.
+        :type timeout: ``int``
+
+        :return: received ``FixMessage`` objects and timestamps when each was
+          received (in microseconds from epoch)
+        :rtype: ``tuple`` of ``list`` of ``FixMessage`` and
+          ``array.array`` of ``float``
+        """
+        timeout = timeout if timeout is not None else self.cfg.receive_timeout
+        timeout_info = TimeoutExceptionInfo()
+        try:
+            received = self._client.receive_many(count, timeout=timeout)
+        except socket.timeout:
+            self.logger.error(
+                'Timed out waiting for {} messages for {} seconds.'.format(
+                    count, timeout))
+            raise TimeoutException(
+                'Timed out waiting for {0} messages on {1}. {2}'.format(
+                    count, self.cfg.name, timeout_info.msg()))
+        self.file_logger.debug('Received {} msgs.'.format(count))
+        if self.cfg.latency_key:
+            for msg, tsp in zip(*received):
+                self._latency.received(msg, tsp)
         return received
 
     def flush(self, timeout=0):
@@ -3,6 +3,9 @@
 import os
 import sqlite3
 import functools
+import itertools
+
+import six
 
 from contextlib import contextmanager
 
@@ -22,16 +25,17 @@ class Sqlite3Config(DriverConfig):
         Schema for options validation and assignment of default values.
         """
         overrides = {'db_name': str,
-                     ConfigOption('connect_at_start', default=True): bool}
+                     ConfigOption('connect_at_start', default=True): bool,
+                     ConfigOption('in_memory', default=False): bool}
         return self.inherit_schema(overrides, super(Sqlite3Config, self))
 
 
 def _rollback_on_error(func):
     """Rollback the databse if db operation raises."""
     @functools.wraps(func)
-    def wrap(self, *args):
+    def wrap(self, *args, **kwargs):
         try:
-            return func(self, *args)
+            return func(self, *args, **kwargs)
         except Exception as exc:
             self.logger.error('Exception while executing: {}{}{}'.format(
                 args, os.sep, exc))
@@ -50,6 +54,11 @@ class Sqlite3(Driver):
     :param connect_at_start: Connect to the database when driver starts.
       Default: True
     :type connect_at_start: ``bool``
+    :param in_memory: Keep the database in memory instead of a file under
+      the runpath. Connections of the same process to a database with the
+      same name share it, it is discarded when the driver stops.
+      Default: False
+    :type in_memory: ``bool``
     """
 
     CONFIG = Sqlite3Config
@@ -61,12 +70,20 @@ class Sqlite3(Driver):
 
     @property
     def db_path(self):
-        """Database file path."""
+        """Database file path, or URI of the shared in memory database."""
+        if self.cfg.in_memory:
+            if six.PY2:
+                return ':memory:'  # URIs are not supported
+            return 'file:{}?mode=memory&cache=shared'.format(
+                self.cfg.db_name)
         return os.path.join(self.runpath, self.cfg.db_name)
 
     def connect(self):
         """Connect to the database and set the internal db cursor."""
-        self.db = sqlite3.connect(self.db_path)
+        if self.cfg.in_memory and not six.PY2:
+            self.db = sqlite3.connect(self.db_path, uri=True)
+        else:
+            self.db = sqlite3.connect(self.db_path)
         self.cursor = self.db.cursor()
 
     def starting(self):
@@ -122,7 +139,108 @@ class Sqlite3(Driver):
         """Invoke cursor fetchall."""
         return self.cursor.fetchall()
 
-    def fetch_table(self, table, columns=None):
+    def _columns(self, table):
+        """Names of the columns of a table."""
+        cursor = self.db.execute('PRAGMA table_info({})'.format(table))
+        return [str(col[1]) for col in cursor.fetchall()]
+
+    def bulk_load(self, table, rows, columns=None, batch_size=10000):
+        """
+        Insert rows into a table in a single transaction.
+
+        Rows are consumed lazily from the iterable in batches passed to
+        ``executemany``, and journaling and syncing to disk are relaxed for
+        the duration of the load, so the database may be corrupted if the
+        process crashes meanwhile.
+
+        The load is committed on its own, so it cannot be part of a
+        transaction of the caller: ``RuntimeError`` is raised if one is
+        in progress, commit or rollback it first.
+
+        .. code-block:: python
+
+            env.db.bulk_load(
+                'trades', ((idx, 'AAPL', idx % 100) for idx in range(10 ** 6)))
+
+        :param table: Table name in the db.
+        :type table: ``str``
+        :param rows: Rows to insert.
+        :type rows: ``iterable`` of ``tuple``
+        :param columns: Names of the columns of the row values, defaults to
+          all columns of the table in order.
+        :type columns: ``list`` of ``str``
+        :param batch_size: Number of rows passed to each ``executemany``.
+        :type batch_size: ``int``
+        :return: Number of rows inserted.
+        :rtype: ``int``
+        """
+        if columns is None:
+            columns = self._columns(table)
+        query = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            table, ', '.join(columns), ', '.join('?' * len(columns)))
+
+        if getattr(self.db, 'in_transaction', False):
+            raise RuntimeError(
+                'Cannot bulk load {} while a transaction is in progress,'
+                ' commit or rollback it first.'.format(table))
+
+        synchronous = self.db.execute('PRAGMA synchronous').fetchone()[0]
+        journal_mode = self.db.execute('PRAGMA journal_mode').fetchone()[0]
+        self.db.execute('PRAGMA synchronous = OFF')
+        self.db.execute('PRAGMA journal_mode = MEMORY')
+
+        count = 0
+        rows = iter(rows)
+        try:
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                self.db.executemany(query, batch)
+                count += len(batch)
+            self.db.commit()
+        except Exception as exc:
+            self.logger.error('Exception while loading {}: {}'.format(
+                table, exc))
+            self.db.rollback()
+            raise
+        finally:
+            self.db.execute('PRAGMA journal_mode = {}'.format(journal_mode))
+            self.db.execute('PRAGMA synchronous = {}'.format(synchronous))
+        return count
+
+    def iter_table(self, table, columns=None, batch_size=1000):
+        """
+        Iterate over a table of the db, like :py:meth:`fetch_table` but
+        fetching rows in batches as they are consumed. The internal db
+        cursor is not used so other queries can run meanwhile.
+
+        :param table: Table name in the db.
+        :type table: ``str``
+        :param columns: Names of columns to be fetched.
+        :type columns: ``list`` of ``str``
+        :param batch_size: Number of rows fetched at once.
+        :type batch_size: ``int``
+        :return: Column names followed by the table rows.
+        :rtype: ``generator`` of ``list`` of values.
+        """
+        if columns is None:
+            columns = self._columns(table)
+        cursor = self.db.execute('SELECT {} FROM {}'.format(
+            ', '.join(columns), table))
+
+        yield columns
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield list(row)
+        finally:
+            cursor.close()
+
+    def fetch_table(self, table, columns=None, stream=False):
         """
         Fetch a table from the db. The first row will be the column names
         and the following rows will be the table rows. Returns a table like:
@@ -142,9 +260,15 @@ class Sqlite3(Driver):
         :type table: ``str``
         :param columns: Names of columns to be fetched.
         :type columns: ``list`` of ``str``
+        :param stream: Return a generator of the rows instead of a list,
+          see :py:meth:`iter_table`.
+        :type stream: ``bool``
         :return: The table contents.
         :rtype: ``list`` of ``list`` of values.
         """
+        if stream:
+            return self.iter_table(table, columns=columns)
+
         if columns is None:
             self.execute('PRAGMA table_info({})'.format(table))
             columns = [str(col[1]) for col in self.cursor.fetchall()]
@@ -153,6 +277,5 @@ class Sqlite3(Driver):
             ', '.join(columns), table))
 
         table = [columns]
-        for row in self.cursor.fetchall():
-            table.append([item for item in row])
+        table.extend(list(row) for row in self.cursor)
         return table
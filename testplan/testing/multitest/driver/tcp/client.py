@@ -1,5 +1,6 @@
 """TCPClient driver classes."""
 
+import time
 import socket
 
 from schema import Use, Or
@@ -7,6 +8,7 @@ from schema import Use, Or
 from testplan.common.utils.timing import TimeoutException, TimeoutExceptionInfo
 from testplan.common.config import ConfigOption
 from testplan.common.utils.context import is_context, expand
+from testplan.common.utils.latency import LatencyRecorder
 from testplan.common.utils.sockets import Client
 
 from ..base import Driver, DriverConfig
@@ -26,7 +28,9 @@ class TCPClientConfig(DriverConfig):
                                 lambda x: is_context(x)),
                      'port': Or(Use(int), lambda x: is_context(x)),
                      ConfigOption('interface', default=None): tuple,
-                     ConfigOption('connect_at_start', default=True): bool}
+                     ConfigOption('connect_at_start', default=True): bool,
+                     ConfigOption('latency_key', default=None):
+                         Or(None, lambda x: callable(x))}
         return self.inherit_schema(overrides, super(TCPClientConfig, self))
 
 
@@ -50,6 +54,11 @@ class TCPClient(Driver):
     :type interface: ``tuple``(``str, ``int``)
     :param connect_at_start: Connect to server on start. Default: True
     :type connect_at_start: ``bool``
+    :param latency_key: Function that returns the correlation key of a sent
+        or received message, or ``None`` to skip it. If provided, round-trip
+        latencies are recorded in
+        :py:attr:`~testplan.testing.multitest.driver.tcp.client.TCPClient.latency`.
+    :type latency_key: ``callable``
 
     Also inherits all
     :py:class:`~testplan.testing.multitest.driver.base.Driver`` options.
@@ -62,6 +71,15 @@ class TCPClient(Driver):
         self._host = None
         self._port = None
         self._client = None
+        self._latency = LatencyRecorder(key=self.cfg.latency_key)
+
+    @property
+    def latency(self):
+        """
+        :py:class:`~testplan.common.utils.latency.LatencyRecorder` of
+        round-trip latencies.
+        """
+        return self._latency
 
     @property
     def host(self):
@@ -97,7 +115,7 @@ class TCPClient(Driver):
         :return: Number of bytes sent
         :rtype: ``int``
         """
-        return self._client.send(msg)[1]
+        return self.send_tsp(msg)[1]
 
     def send_tsp(self, msg):
         """
@@ -110,7 +128,30 @@ class TCPClient(Driver):
                  and number of bytes sent
         :rtype: ``tuple`` of ``long`` and ``int``
         """
-        return self._client.send(msg)
+        tsp, size = self._client.send(msg)
+        if self.cfg.latency_key:
+            self._latency.sent(msg, tsp)
+        return tsp, size
+
+    def send_many(self, msgs):
+        """
+        Sends a batch of messages back to back, much faster than
+        sending them one by one.
+
+        :param msgs: Messages to be sent
+        :type msgs: ``list`` of ``bytes``
+
+        :return: Timestamps when each msg was sent
+                 (in microseconds from epoch), taken per batch of messages
+                 written together rather than per message
+        :rtype: ``array.array`` of ``float``
+        """
+        msgs = list(msgs)
+        tsps = self._client.send_many(msgs)[0]
+        if self.cfg.latency_key:
+            for msg, tsp in zip(msgs, tsps):
+                self._latency.sent(msg, tsp)
+        return tsps
 
     def receive_text(self, standard='utf-8', **kwargs):
         """
@@ -131,8 +172,40 @@ class TCPClient(Driver):
                 raise TimeoutException(
                     'Timed out waiting for message on {0}. {1}'.format(
                         self.cfg.name, timeout_info.msg()))
+        if received and self.cfg.latency_key:
+            self._latency.received(received, time.time() * 1000000)
         return received
 
+    def receive_many(self, size, count, timeout=30):
+        """
+        Receive a batch of fixed size messages from the given connection.
+
+        :param size: Size of each message in bytes
+        :type size: ``int``
+        :param count: Number of messages to receive
+        :type count: ``int``
+        :param timeout: Timeout in seconds for receiving all messages
+        :type timeout: ``int``
+
+        :return: Messages received and timestamps when each was received
+                 (in microseconds from epoch), taken per read rather than
+                 per message
+        :rtype: ``tuple`` of ``list`` of ``bytes`` and
+                ``array.array`` of ``float``
+        """
+        timeout_info = TimeoutExceptionInfo()
+        try:
+            received, tsps = self._client.receive_many(
+                size, count, timeout=timeout)
+        except socket.timeout:
+            raise TimeoutException(
+                'Timed out waiting for {0} messages on {1}. {2}'.format(
+                    count, self.cfg.name, timeout_info.msg()))
+        if self.cfg.latency_key:
+            for msg, tsp in zip(received, tsps):
+                self._latency.received(msg, tsp)
+        return received, tsps
+
     def reconnect(self):
         """Client reconnect."""
         self._client.close()
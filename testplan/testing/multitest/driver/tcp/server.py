@@ -86,6 +86,12 @@ class TCPServer(Driver):
         return self._server.send(msg=msg, conn_idx=conn_idx, timeout=timeout)
     send.__doc__ = Server.send.__doc__
 
+    def send_frame(self, msg, conn_idx=None, timeout=30):
+        """Doc from Server."""
+        return self._server.send_frame(
+            msg=msg, conn_idx=conn_idx, timeout=timeout)
+    send_frame.__doc__ = Server.send_frame.__doc__
+
     def receive_text(self, standard='utf-8', **kwargs):
         """
         Calls
@@ -116,6 +122,28 @@ class TCPServer(Driver):
                         self.cfg.name, timeout_info.msg()))
         return received
 
+    def receive_until(self, delimiter, conn_idx=None, timeout=30):
+        """Receive bytes up to and including the delimiter."""
+        timeout_info = TimeoutExceptionInfo()
+        try:
+            return self._server.receive_until(
+                delimiter, conn_idx=conn_idx, timeout=timeout)
+        except socket.timeout:
+            raise TimeoutException(
+                'Timed out waiting for message on {0}. {1}'.format(
+                    self.cfg.name, timeout_info.msg()))
+
+    def receive_frame(self, conn_idx=None, timeout=30):
+        """Receive a length-prefixed message from the given connection."""
+        timeout_info = TimeoutExceptionInfo()
+        try:
+            return self._server.receive_frame(
+                conn_idx=conn_idx, timeout=timeout)
+        except socket.timeout:
+            raise TimeoutException(
+                'Timed out waiting for message on {0}. {1}'.format(
+                    self.cfg.name, timeout_info.msg()))
+
     def starting(self):
         """Starts the TCP server."""
         super(TCPServer, self).starting()
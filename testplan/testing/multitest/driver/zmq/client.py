@@ -6,9 +6,9 @@ import zmq
 from testplan.common.config import ConfigOption as Optional
 from testplan.common.utils.context import ContextValue, expand
 from testplan.common.utils.convert import make_iterables
-from testplan.common.utils.timing import retry_until_timeout
 
 from ..base import Driver, DriverConfig
+from . import polling
 
 
 class ZMQClientConfig(DriverConfig):
@@ -118,10 +118,23 @@ class ZMQClient(Driver):
         :return: ``None``
         :rtype: ``NoneType``
         """
-        return retry_until_timeout(exception=zmq.ZMQError,
-                                   item=self._socket.send,
-                                   kwargs={'data': data, 'flags': zmq.NOBLOCK},
-                                   timeout=timeout, raise_on_timeout=True)
+        return polling.send(self._socket, data, timeout=timeout)
+
+    def send_many(self, data, timeout=30):
+        """
+        Send a batch of messages back to back, much faster than sending
+        them one by one.
+
+        :param data: The messages to send.
+        :type data: ``list`` of ``bytes`` or ``zmq.sugar.frame.Frame``
+        :param timeout: Timeout to send all messages.
+        :type timeout: ``int``
+
+        :return: Timestamps when each message was sent
+          (in microseconds from epoch).
+        :rtype: ``array.array`` of ``float``
+        """
+        return polling.send_many(self._socket, data, timeout=timeout)
 
     def receive(self, timeout=30):
         """
@@ -134,10 +147,36 @@ class ZMQClient(Driver):
         :return: The received message.
         :rtype: ``bytes`` or ``zmq.sugar.frame.Frame`` or ``memoryview``
         """
-        return retry_until_timeout(exception=zmq.ZMQError,
-                                   item=self._socket.recv,
-                                   kwargs={'flags': zmq.NOBLOCK},
-                                   timeout=timeout, raise_on_timeout=True)
+        return polling.receive(self._socket, timeout=timeout)
+
+    def receive_all(self, timeout=0):
+        """
+        Receive every queued message at once, waiting for the first
+        one up to the given timeout.
+
+        :param timeout: Timeout to wait for the first message.
+        :type timeout: ``int``
+
+        :return: The received messages, empty if none arrived in time.
+        :rtype: ``list`` of ``bytes``
+        """
+        return polling.receive_all(self._socket, timeout=timeout)
+
+    def receive_many(self, count, timeout=30):
+        """
+        Receive a batch of messages as fast as they are available.
+
+        :param count: Number of messages to receive.
+        :type count: ``int``
+        :param timeout: Timeout to receive all messages.
+        :type timeout: ``int``
+
+        :return: The received messages and timestamps when each was received
+          (in microseconds from epoch).
+        :rtype: ``tuple`` of ``list`` of ``bytes`` and
+          ``array.array`` of ``float``
+        """
+        return polling.receive_many(self._socket, count, timeout=timeout)
 
     def subscribe(self, topic_filter):
         """
@@ -0,0 +1,140 @@
+"""
+Send and receive helpers for the ZMQ drivers.
+
+Sockets are used with ``zmq.NOBLOCK`` and polled only while they are not
+ready, so messages are transferred as soon as possible and timeouts are exact.
+"""
+
+import time
+import array
+
+import zmq
+
+from testplan.common.utils.timing import TimeoutException, TimeoutExceptionInfo
+
+
+def _wait(socket, event, deadline, timeout_info, action):
+    """
+    Wait until the socket is ready for the given event.
+
+    :raises TimeoutException: If the deadline passes first.
+    """
+    remaining = deadline - time.time()
+    if remaining <= 0 or not socket.poll(remaining * 1000, event):
+        raise TimeoutException(
+            'Timeout waiting to {0}. {1}'.format(action, timeout_info.msg()))
+
+
+def send(socket, data, timeout=30):
+    """
+    Send a message, waiting until the socket is ready to send it.
+
+    :param socket: Socket to send on.
+    :type socket: ``zmq.Socket``
+    :param data: The content of the message.
+    :type data: ``bytes`` or ``zmq.sugar.frame.Frame`` or ``memoryview``
+    :param timeout: Timeout to send the message.
+    :type timeout: ``int``
+    """
+    send_many(socket, [data], timeout=timeout)
+
+
+def receive(socket, timeout=30):
+    """
+    Receive a message, waiting until one is available.
+
+    :param socket: Socket to receive from.
+    :type socket: ``zmq.Socket``
+    :param timeout: Timeout to receive the message.
+    :type timeout: ``int``
+
+    :return: The received message.
+    :rtype: ``bytes``
+    """
+    return receive_many(socket, 1, timeout=timeout)[0][0]
+
+
+def receive_all(socket, timeout=0):
+    """
+    Receive every message that is queued on the socket, waiting for the
+    first one up to the given timeout.
+
+    :param socket: Socket to receive from.
+    :type socket: ``zmq.Socket``
+    :param timeout: Timeout to wait for the first message.
+    :type timeout: ``int``
+
+    :return: The received messages, empty if none arrived in time.
+    :rtype: ``list`` of ``bytes``
+    """
+    msgs = []
+    if not socket.poll(timeout * 1000, zmq.POLLIN):
+        return msgs
+    while True:
+        try:
+            msgs.append(socket.recv(zmq.NOBLOCK))
+        except zmq.Again:
+            return msgs
+
+
+def send_many(socket, data, timeout=30):
+    """
+    Send messages back to back without blocking, waiting on the socket
+    only when its queue is full.
+
+    :param socket: Socket to send on.
+    :type socket: ``zmq.Socket``
+    :param data: The messages to send.
+    :type data: ``list`` of ``bytes`` or ``zmq.sugar.frame.Frame``
+    :param timeout: Timeout to send all messages.
+    :type timeout: ``int``
+
+    :return: Timestamps when each message was sent
+      (in microseconds from epoch).
+    :rtype: ``array.array`` of ``float``
+    """
+    timeout_info = TimeoutExceptionInfo()
+    deadline = timeout_info.started + timeout
+    tsps = array.array('d')
+    for msg in data:
+        while True:
+            try:
+                socket.send(msg, zmq.NOBLOCK)
+            except zmq.Again:
+                _wait(socket, zmq.POLLOUT, deadline, timeout_info,
+                      'send message {}'.format(len(tsps)))
+            else:
+                break
+        tsps.append(time.time() * 1000000)
+    return tsps
+
+
+def receive_many(socket, count, timeout=30):
+    """
+    Receive messages as fast as they are available, waiting on the socket
+    only when no message is queued.
+
+    :param socket: Socket to receive from.
+    :type socket: ``zmq.Socket``
+    :param count: Number of messages to receive.
+    :type count: ``int``
+    :param timeout: Timeout to receive all messages.
+    :type timeout: ``int``
+
+    :return: The received messages and timestamps when each was received
+      (in microseconds from epoch).
+    :rtype: ``tuple`` of ``list`` of ``bytes`` and ``array.array`` of ``float``
+    """
+    timeout_info = TimeoutExceptionInfo()
+    deadline = timeout_info.started + timeout
+    msgs = []
+    tsps = array.array('d')
+    while len(msgs) < count:
+        try:
+            msgs.append(socket.recv(zmq.NOBLOCK))
+        except zmq.Again:
+            _wait(socket, zmq.POLLIN, deadline, timeout_info,
+                  'receive message {}'.format(len(msgs)))
+        else:
+            tsps.append(time.time() * 1000000)
+    return msgs, tsps
@@ -15,6 +15,7 @@ import lxml
 
 from testplan.common.utils.convert import make_tuple, flatten_dict_comparison
 from testplan.common.utils import comparison
+from testplan.common.utils.reporting import Absent, NATIVE_TYPES
 
 from .base import BaseEntry, get_table
 
@@ -32,6 +33,7 @@ __all__ = [
     'LessEqual',
     'Greater',
     'GreaterEqual',
+    'LatencyPercentileLess',
     'Contain',
     'NotContain',
     'RegexAssertion',
@@ -41,6 +43,8 @@ __all__ = [
     'RegexSearchNotExists',
     'RegexFindIter',
     'RegexMatchLine',
+    'LogfileMatch',
+    'LogfileNotMatch',
     'ExceptionRaised',
     'EqualSlices',
     'EqualExcludeSlices',
@@ -160,6 +164,28 @@ class GreaterEqual(FuncAssertion):
     func = operator.ge
 
 
+class LatencyPercentileLess(FuncAssertion):
+    """
+    Checks that a latency percentile is less than a threshold,
+    fails if no latencies were recorded.
+    """
+    label = '<'
+    func = operator.lt
+
+    def __init__(self, histogram, percentile, threshold,
+                 description=None, category=None):
+        self.percentile = percentile
+        self.count = histogram.count
+        super(LatencyPercentileLess, self).__init__(
+            first=histogram.percentile(percentile), second=threshold,
+            description=description or 'Latency percentile {}'.format(
+                percentile),
+            category=category)
+
+    def evaluate(self):
+        return self.count > 0 and self.func(self.first, self.second)
+
+
 class Contain(Assertion):
 
     def __init__(self, member, container, description=None, category=None):
@@ -276,6 +302,35 @@ class RegexMatchLine(RegexAssertion):
         return self.match_indexes
 
 
+class LogfileMatch(RegexAssertion):
+    """
+    Waits until text matching the regexp is written to a log file after the
+    position of a :py:class:`~testplan.common.utils.match.LogMatcher`,
+    ``string`` is the lines of the matched text.
+    """
+
+    def __init__(
+        self, log_matcher, regexp, timeout=5,
+        description=None, category=None
+    ):
+        self.path = log_matcher.log_path
+        self.timeout = timeout
+        self._match = log_matcher.match(
+            regexp, timeout=timeout, raise_on_timeout=False)
+        super(LogfileMatch, self).__init__(
+            regexp, string=self._match.string if self._match else '',
+            description=description, category=category)
+
+    def get_regex_result(self):
+        return self._match
+
+
+class LogfileNotMatch(LogfileMatch):
+
+    def evaluate(self):
+        return not super(LogfileNotMatch, self).evaluate()
+
+
 class ExceptionRaised(Assertion):
 
     """TODO"""
@@ -513,23 +568,42 @@ class ColumnContain(Assertion):
         super(ColumnContain, self).__init__(
             description=description, category=category)
 
+    def get_lookup(self):
+        """
+        Return a membership check for ``values``, backed
+        by a ``frozenset`` if all values are hashable.
+        """
+        try:
+            lookup = frozenset(self.values)
+        except TypeError:
+            return lambda value: value in self.values
+
+        def contains(value):
+            try:
+                return value in lookup
+            except TypeError:  # unhashable cell value
+                return value in self.values
+        return contains
+
     def evaluate(self):
         passed = True
+        contains = self.get_lookup()
+        column = six.moves.map(operator.itemgetter(self.column), self.table)
 
-        for idx, row in enumerate(self.table):
+        for idx, value in enumerate(column):
 
-            comp_obj = ColumnContainComparison(
-                idx=idx,
-                value=row[self.column],
-                passed=row[self.column] in self.values
-            )
+            value_passed = contains(value)
 
-            if not comp_obj.passed:
+            if not value_passed:
                 passed = False
 
             if not self.report_fails_only or (
-                        self.report_fails_only and not comp_obj.passed):
-                self.data.append(comp_obj)
+                        self.report_fails_only and not value_passed):
+                self.data.append(ColumnContainComparison(
+                    idx=idx,
+                    value=value,
+                    passed=value_passed
+                ))
 
             if self.limit and len(self.data) >= self.limit:
                 break
@@ -583,6 +657,9 @@ class RowComparison(_RowComparison):
         return self.data[column_idx], True
 
 
+UnmatchedRow = collections.namedtuple('UnmatchedRow', 'idx data')
+
+
 def get_comparison_columns(table_1, table_2, include_columns, exclude_columns):
     """
       Given two tables and inclusion / exclusion rules, return a
@@ -654,6 +731,46 @@ def get_comparison_columns(table_1, table_2, include_columns, exclude_columns):
     return comparison_columns
 
 
+def compare_columns(table, expected_table, comparison_columns):
+    """
+      Columnar fast path for ``compare_rows``, compares all values of a
+      column in one pass instead of calling ``comparison.basic_compare``
+      for each cell.
+
+      Columns that contain custom comparators (callables or regex patterns)
+      on the second table, or values that cannot be compared with ``==``
+      are left out, these will be compared cell by cell.
+
+      :param table: Original table.
+      :type table: ``list`` of ``dict``
+      :param expected_table: Comparison table.
+      :type expected_table: ``list`` of ``dict``
+      :param comparison_columns: Columns to be used for comparison.
+      :type comparison_columns: ``list`` of ``str``
+      :return: Comparison results of each row, keyed by column name.
+      :rtype: ``dict`` of ``str`` to ``list``
+    """
+    results = {}
+
+    for column_name in comparison_columns:
+        getter = operator.itemgetter(column_name)
+        expected = list(six.moves.map(getter, expected_table))
+
+        # Values of native types can never be comparators,
+        # so only the remaining ones need to be checked.
+        if any(comparison.is_comparator(value) for value in expected
+               if type(value) not in NATIVE_TYPES):
+            continue
+
+        try:
+            results[column_name] = list(six.moves.map(
+                operator.eq, six.moves.map(getter, table), expected))
+        except Exception:
+            continue
+
+    return results
+
+
 def compare_rows(
     table, expected_table, comparison_columns,
     display_columns, strict=True, fail_limit=0
@@ -700,14 +817,37 @@ def compare_rows(
     display_only = [
         col for col in display_columns if col not in comparison_columns]
 
-    for idx, (row_1, row_2) in enumerate(zip(table, expected_table)):
+    column_results = compare_columns(
+        table=table,
+        expected_table=expected_table,
+        comparison_columns=comparison_columns)
+
+    if fail_limit > 0 and len(column_results) == len(comparison_columns):
+        # Only failing rows will be reported, so we can skip
+        # the rows that have passed the columnar comparison.
+        row_results = six.moves.zip(
+            *[column_results[col] for col in comparison_columns])
+        indices = [
+            idx for idx, results in enumerate(row_results)
+            if not all(results)
+        ]
+        rows = ((idx, table[idx], expected_table[idx]) for idx in indices)
+    else:
+        rows = (
+            (idx, row_1, row_2) for idx, (row_1, row_2)
+            in enumerate(six.moves.zip(table, expected_table)))
+
+    for idx, row_1, row_2 in rows:
         diff, errors, extra = {}, {}, {}
 
         for column_name in comparison_columns:
             first, second = row_1[column_name], row_2[column_name]
 
-            passed, error = comparison.basic_compare(
-                first=first, second=second, strict=strict)
+            if column_name in column_results:
+                passed, error = column_results[column_name][idx], None
+            else:
+                passed, error = comparison.basic_compare(
+                    first=first, second=second, strict=strict)
 
             if error:
                 errors[column_name] = error
@@ -750,6 +890,52 @@ def compare_rows(
     return num_failures == 0, data
 
 
+def match_rows_by_key(table, expected_table, key_columns):
+    """
+      Pair the rows of two tables that have the same values on
+      ``key_columns`` by building a hash index on the expected table.
+
+      Rows with duplicate keys are paired in order of appearance.
+
+      :param table: Original table.
+      :type table: ``list`` of ``dict``
+      :param expected_table: Comparison table, key column values
+                             must be hashable and cannot be custom
+                             comparators.
+      :type expected_table: ``list`` of ``dict``
+      :param key_columns: Columns to be used for pairing the rows.
+      :type key_columns: ``list`` of ``str``
+      :return: Paired row indices as ``(index, expected index)`` tuples in
+               the order of the original table, indices of the rows of the
+               original table that have no pair (extra) and indices of the
+               rows of the comparison table that have no pair (missing).
+      :rtype: ``tuple`` of ``list``
+    """
+    get_key = operator.itemgetter(*key_columns)
+    index = collections.OrderedDict()
+
+    for idx, row in enumerate(expected_table):
+        key = get_key(row)
+        key_values = make_tuple(key, convert_none=True)
+        if any(six.moves.map(comparison.is_comparator, key_values)):
+            raise ValueError(
+                'Custom comparators cannot be used on key columns'
+                ' ({}), row: {}'.format(', '.join(key_columns), idx))
+        index.setdefault(key, collections.deque()).append(idx)
+
+    pairs, extra = [], []
+    for idx, row in enumerate(table):
+        indices = index.get(get_key(row))
+        if indices:
+            pairs.append((idx, indices.popleft()))
+        else:
+            extra.append(idx)
+
+    missing = sorted(
+        idx for indices in index.values() for idx in indices)
+    return pairs, extra, missing
+
+
 class TableMatch(Assertion):
     """
       Match two tables using ``compare_rows``, may generate
@@ -760,7 +946,7 @@ class TableMatch(Assertion):
         self, table, expected_table,
         include_columns=None, exclude_columns=None,
         report_all=True, fail_limit=0, strict=False,
-        description=None, category=None
+        key_columns=None, description=None, category=None
     ):
         self.table = get_table(table)
         self.expected_table = get_table(expected_table)
@@ -768,6 +954,7 @@ class TableMatch(Assertion):
         self.exclude_columns = exclude_columns
         self.strict = strict
         self.report_all = report_all
+        self.key_columns = key_columns
 
         self.fail_limit = fail_limit
 
@@ -775,6 +962,8 @@ class TableMatch(Assertion):
         self.display_columns = None
         self.message = None
         self.data = []
+        self.missing_rows = []
+        self.extra_rows = []
 
         super(TableMatch, self).__init__(
             description=description, category=category)
@@ -782,7 +971,7 @@ class TableMatch(Assertion):
     def evaluate(self):
         len_table, len_expected = len(self.table), len(self.expected_table)
 
-        if len_table != len_expected:
+        if len_table != len_expected and not self.key_columns:
             self.message = (
                 'Cannot run comparison on tables with different number '
                 'of rows ({} vs {}), make sure tables have the same size.'
@@ -793,10 +982,15 @@ class TableMatch(Assertion):
             self.message = 'Both tables are empty.'
             return True
 
+        # One of the tables can be empty if rows are paired by key,
+        # then the columns of the other one will be used.
+        table = self.table or self.expected_table
+        expected_table = self.expected_table or self.table
+
         try:
             comparison_columns = get_comparison_columns(
-                table_1=self.table,
-                table_2=self.expected_table,
+                table_1=table,
+                table_2=expected_table,
                 include_columns=self.include_columns,
                 exclude_columns=self.exclude_columns
             )
@@ -804,9 +998,12 @@ class TableMatch(Assertion):
             self.message = str(exc)
             return False  # Fail on invalid tables
 
-        self.display_columns = self.table[0].keys()\
+        self.display_columns = table[0].keys()\
             if self.report_all else comparison_columns
 
+        if self.key_columns:
+            return self.evaluate_by_key(comparison_columns)
+
         passed, self.data = compare_rows(
             table=self.table,
             expected_table=self.expected_table,
@@ -817,6 +1014,65 @@ class TableMatch(Assertion):
         )
         return passed
 
+    def evaluate_by_key(self, comparison_columns):
+        """
+        Pair the rows of the tables using ``key_columns`` and compare
+        each pair, rows that could not be paired are stored
+        in ``missing_rows`` and ``extra_rows``.
+        """
+        missing_columns = [
+            col for col in self.key_columns if col not in comparison_columns]
+        if missing_columns:
+            self.message = (
+                'Key columns ({}) must be used for comparison.'
+            ).format(', '.join(missing_columns))
+            return False
+
+        try:
+            pairs, extra, missing = match_rows_by_key(
+                table=self.table,
+                expected_table=self.expected_table,
+                key_columns=self.key_columns
+            )
+        except (ValueError, TypeError) as exc:
+            self.message = str(exc)
+            return False
+
+        passed, data = compare_rows(
+            table=[self.table[idx] for idx, _ in pairs],
+            expected_table=[
+                self.expected_table[idx] for _, idx in pairs],
+            comparison_columns=comparison_columns,
+            display_columns=self.display_columns,
+            strict=self.strict,
+            fail_limit=self.fail_limit,
+        )
+
+        # Row comparisons are indexed by the position of
+        # the row in the original table, not in the pairs.
+        self.data = [
+            row_comparison._replace(idx=pairs[row_comparison.idx][0])
+            for row_comparison in data
+        ]
+
+        if self.fail_limit > 0:
+            extra = extra[:self.fail_limit]
+            missing = missing[:self.fail_limit]
+
+        self.extra_rows = [
+            UnmatchedRow(
+                idx, [self.table[idx][col] for col in self.display_columns])
+            for idx in extra
+        ]
+        self.missing_rows = [
+            UnmatchedRow(idx, [
+                self.expected_table[idx].get(col, Absent)
+                for col in self.display_columns])
+            for idx in missing
+        ]
+
+        return passed and not (self.extra_rows or self.missing_rows)
+
 
 _XMLTagComparison = collections.namedtuple(
     '_XMLTagComparison', 'tag diff error extra')
@@ -990,6 +1246,13 @@ class DictMatch(Assertion):
         description=None, category=None,
         actual_description=None, expected_description=None
     ):
+        if isinstance(expected, comparison.MatchPlan):
+            if include_keys is not None or exclude_keys is not None:
+                raise ValueError(
+                    'Inclusion / exclusion rules must be'
+                    ' set on the match plan: {}'.format(expected))
+            include_keys, exclude_keys = expected.only, expected.ignore
+
         self.value = value
         self.expected = expected
         self.include_keys = include_keys
@@ -1003,13 +1266,19 @@ class DictMatch(Assertion):
             description=description, category=category)
 
     def evaluate(self):
-        passed, cmp_result = comparison.compare(
-            lhs=self.value,
-            rhs=self.expected,
-            ignore=self.exclude_keys,
-            only=self.include_keys,
-            report_all=self.report_all
-        )
+        if isinstance(self.expected, comparison.MatchPlan):
+            passed, cmp_result = self.expected.compare(
+                lhs=self.value,
+                report_all=self.report_all
+            )
+        else:
+            passed, cmp_result = comparison.compare(
+                lhs=self.value,
+                rhs=self.expected,
+                ignore=self.exclude_keys,
+                only=self.include_keys,
+                report_all=self.report_all
+            )
         self.comparison = flatten_dict_comparison(cmp_result)
         return passed
 
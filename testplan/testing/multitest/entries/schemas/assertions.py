@@ -40,6 +40,13 @@ class FuncAssertionSchema(AssertionSchema):
     label = fields.String()
 
 
+@registry.bind(asr.LatencyPercentileLess)
+class LatencyPercentileSchema(FuncAssertionSchema):
+
+    percentile = fields.Float()
+    count = fields.Integer()
+
+
 @registry.bind(
     asr.IsTrue,
     asr.IsFalse
@@ -79,6 +86,13 @@ class RegexMatchLineSchema(RegexSchema):
     match_context = fields.List(fields.Dict())
 
 
+@registry.bind(asr.LogfileMatch, asr.LogfileNotMatch)
+class LogfileMatchSchema(RegexSchema):
+
+    path = fields.String()
+    timeout = fields.Float()
+
+
 @registry.bind(asr.RegexFindIter)
 class RegexFindIterSchema(RegexSchema):
 
@@ -137,8 +151,13 @@ class TableMatchSchema(AssertionSchema):
     # Row data with diffs, errors, extra ctx for comparators
     data = fields.List(custom_fields.RowComparisonField())
 
+    # Rows that could not be paired when matching by key columns
+    missing_rows = fields.List(custom_fields.UnmatchedRowField())
+    extra_rows = fields.List(custom_fields.UnmatchedRowField())
+
     include_columns = fields.List(fields.String(), allow_none=True)
     exclude_columns = fields.List(fields.String(), allow_none=True)
+    key_columns = fields.List(fields.String(), allow_none=True)
     message = fields.String(allow_none=True)
     fail_limit = fields.Integer()
 
@@ -52,6 +52,7 @@ class AssertionRenderer(BaseRenderer):
     assertions.LessEqual,
     assertions.Greater,
     assertions.GreaterEqual,
+    assertions.LatencyPercentileLess,
 )
 class FunctionAssertionRenderer(AssertionRenderer):
 
@@ -71,6 +72,7 @@ class FunctionAssertionRenderer(AssertionRenderer):
 @registry.bind(
     assertions.RegexMatch,
     assertions.RegexSearch,
+    assertions.LogfileMatch,
 )
 class RegexMatchRenderer(AssertionRenderer):
     highlight_color = 'green'
@@ -150,7 +152,8 @@ class RegexMatchLineRenderer(AssertionRenderer):
 
 @registry.bind(
     assertions.RegexMatchNotExists,
-    assertions.RegexSearchNotExists
+    assertions.RegexSearchNotExists,
+    assertions.LogfileNotMatch,
 )
 class RegexNotMatchRenderer(RegexMatchRenderer):
     highlight_color = 'red'
@@ -229,7 +232,7 @@ class TableMatchRenderer(AssertionRenderer):
         else:
             result = ''
 
-        display_index = entry.fail_limit > 0
+        display_index = entry.fail_limit > 0 or bool(entry.key_columns)
 
         row_data = [
             self.get_row_data(
@@ -242,7 +245,24 @@ class TableMatchRenderer(AssertionRenderer):
 
         columns = ['row'] + list(entry.display_columns) \
             if display_index else entry.display_columns
-        return '{}{}'.format(result, AsciiTable([columns] + row_data).table)
+        result = '{}{}'.format(result, AsciiTable([columns] + row_data).table)
+
+        for label, unmatched_rows in (
+            ('Missing rows', entry.missing_rows),
+            ('Extra rows', entry.extra_rows),
+        ):
+            if unmatched_rows:
+                row_data = [
+                    [row.idx] + format_cell_data(
+                        data=list(row.data),
+                        limit=constants.CELL_STRING_LENGTH)
+                    for row in unmatched_rows
+                ]
+                result = '{}{}{}{}{}'.format(
+                    result, os.linesep, Color.red(label), os.linesep,
+                    AsciiTable([columns] + row_data).table)
+
+        return result
 
 
 @registry.bind(assertions.ColumnContain)
@@ -4,6 +4,7 @@ Parametrization support for test cases.
 import collections
 import inspect
 import itertools
+import random
 import re
 import warnings
 
@@ -54,6 +55,27 @@ def _check_dict_keys(dictionary, args, required_args):
     return dictionary
 
 
+def _check_param_dict_values(param_dict):
+    for val in param_dict.values():
+        if not isinstance(val, collections.Iterable) or isinstance(val, dict):
+            msg = (
+                'Dictionary values must be tuple or list of items, {value} '
+                'is of type: {type}').format(value=val, type=type(val))
+            raise ParametrizationError(msg)
+
+
+def _iter_product_of_param_dict(param_dict, args):
+    """
+    Return an iterator of ``OrderedDict`` for the cartesian product of the
+    values in ``param_dict``, see :py:func:`_product_of_param_dict`.
+    """
+    _check_param_dict_values(param_dict)
+
+    keys, values = args, [param_dict[arg] for arg in args]
+    return (collections.OrderedDict(zip(keys, vals))
+            for vals in itertools.product(*values))
+
+
 def _product_of_param_dict(param_dict, args):
     """
     Generate a ``list`` of ``OrderedDict`` using
@@ -78,16 +100,99 @@ def _product_of_param_dict(param_dict, args):
       OrderedDict([('foo', 'beta'), ('bar', 2), ('baz', False)])
     ]
     """
-    for val in param_dict.values():
-        if not isinstance(val, collections.Iterable) or isinstance(val, dict):
-            msg = (
-                'Dictionary values must be tuple or list of items, {value} '
-                'is of type: {type}').format(value=val, type=type(val))
-            raise ParametrizationError(msg)
+    return list(_iter_product_of_param_dict(param_dict, args))
 
-    keys, values = args, [param_dict[arg] for arg in args]
-    product = list(itertools.product(*values))
-    return [collections.OrderedDict(zip(keys, vals)) for vals in product]
+
+def _get_combinatorial_strength(combinatorial):
+    """
+    Return the number of parameters whose value combinations
+    are covered by a ``combinatorial`` parametrization.
+    """
+    if combinatorial == 'pairwise':
+        return 2
+    if isinstance(combinatorial, six.integer_types) and \
+            not isinstance(combinatorial, bool) and combinatorial >= 2:
+        return combinatorial
+    raise ParametrizationError(
+        '"combinatorial" should either be "pairwise" or an integer greater '
+        'than 1, it is: {}'.format(combinatorial))
+
+
+def _covering_array(sizes, strength, seed):
+    """
+    Generate rows of value indexes for parameters with ``sizes`` values,
+    so that all combinations of values of any ``strength`` parameters
+    appear in at least one row.
+
+    Rows are built greedily, starting from a combination that is not
+    covered yet and picking the values that cover the most combinations
+    for the other parameters. Ties are broken by a random generator seeded
+    with ``seed``, so the same rows are generated for the same ``seed``.
+
+    >>> _covering_array(sizes=(2, 2, 2), strength=2, seed=0)
+    [(0, 0, 1), (0, 1, 0), (1, 0, 0), (1, 1, 1)]
+    """
+    if strength >= len(sizes):
+        return list(itertools.product(*[range(size) for size in sizes]))
+
+    randomizer = random.Random(seed)
+    combinations = list(itertools.combinations(range(len(sizes)), strength))
+    combinations_of_param = [
+        [combination for combination in combinations if param in combination]
+        for param in range(len(sizes))]
+    uncovered = set(
+        (combination, values)
+        for combination in combinations
+        for values in itertools.product(
+            *[range(sizes[param]) for param in combination]))
+
+    rows = []
+    while uncovered:
+        row = [None] * len(sizes)
+        combination, values = min(uncovered)
+        for param, value in zip(combination, values):
+            row[param] = value
+
+        params = [param for param, value in enumerate(row) if value is None]
+        randomizer.shuffle(params)
+        for param in params:
+            best_count, best_values = -1, []
+            for value in range(sizes[param]):
+                row[param] = value
+                count = sum(
+                    1 for combination in combinations_of_param[param]
+                    if None not in [row[idx] for idx in combination] and
+                    (combination, tuple(row[idx] for idx in combination))
+                    in uncovered)
+                if count > best_count:
+                    best_count, best_values = count, [value]
+                elif count == best_count:
+                    best_values.append(value)
+            row[param] = randomizer.choice(best_values)
+
+        for combination in combinations:
+            uncovered.discard(
+                (combination, tuple(row[idx] for idx in combination)))
+        rows.append(tuple(row))
+    return rows
+
+
+def _covering_array_of_param_dict(param_dict, args, strength, seed):
+    """
+    Generate a ``list`` of ``OrderedDict`` that covers all combinations of
+    values of any ``strength`` arguments, see :py:func:`_covering_array`.
+    """
+    _check_param_dict_values(param_dict)
+
+    values = [tuple(param_dict[arg]) for arg in args]
+    return [
+        collections.OrderedDict(
+            (arg, arg_values[idx])
+            for arg, arg_values, idx in zip(args, values, row))
+        for row in _covering_array(
+            sizes=[len(arg_values) for arg_values in values],
+            strength=strength,
+            seed=seed)]
 
 
 def _dict_from_arg_tuple(tup, args, required_args, default_args):
@@ -120,44 +225,59 @@ def _dict_from_arg_tuple(tup, args, required_args, default_args):
     return ordered_dict
 
 
-def _generate_kwarg_list(parameters, args, required_args, default_args):
+def _kwargs_from_item(obj, args, required_args, default_args):
     """
-    Given the 'raw' parameter context, generate the ``list`` of ``kwargs``
+    Generate the ``OrderedDict`` of ``kwargs`` for a
+    single item of a normal parametrization.
+    """
+    if not isinstance(obj, (tuple, list, dict)):
+        if len(required_args) > 1:
+            raise ParametrizationError(
+                'You can use shortcut notation if and only if the '
+                'testcase has 1 required argument, '
+                'however it has {}.'.format(len(required_args)))
+
+        obj = make_tuple(obj, convert_none=True)
+
+    if isinstance(obj, (list, tuple)):
+        return _dict_from_arg_tuple(obj, args, required_args, default_args)
+
+    ordered_dict = collections.OrderedDict.fromkeys(args)
+    ordered_dict.update(dict(default_args, **obj))
+    return _check_dict_keys(ordered_dict, args, required_args)
+
+
+def _iter_kwargs(parameters, args, required_args, default_args,
+                 combinatorial=None, combinatorial_seed=0):
+    """
+    Given the 'raw' parameter context, return an iterator of the ``kwargs``
     that will be used for method generation.
 
-    Always returns a list of ``OrderedDict``s regardless of the input type(s).
+    The parameter context is validated upfront, ``OrderedDict``s of the
+    cartesian product and normal parametrization are generated as the
+    iterator is consumed.
     """
     # Combinatorial parametrization
     if isinstance(parameters, dict):
         _check_dict_keys(parameters, args, required_args)
         default_args = {k: [v] for k, v in default_args.items()}
         parameters = dict(default_args, **parameters)
-        return _product_of_param_dict(parameters, args)
+        if combinatorial is not None:
+            return iter(_covering_array_of_param_dict(
+                parameters, args,
+                strength=_get_combinatorial_strength(combinatorial),
+                seed=combinatorial_seed))
+        return _iter_product_of_param_dict(parameters, args)
+
+    elif combinatorial is not None:
+        raise ParametrizationError(
+            '"combinatorial" can only be used with a dictionary'
+            ' of iterables as "parameters".')
 
     # Normal parametrization
     elif isinstance(parameters, collections.Iterable):
-        dicts = []
-        for obj in parameters:
-
-            if not isinstance(obj, (tuple, list, dict)):
-                if len(required_args) > 1:
-                    raise ParametrizationError(
-                        'You can use shortcut notation if and only if the '
-                        'testcase has 1 required argument, '
-                        'however it has {}.'.format(len(required_args)))
-
-                obj = make_tuple(obj, convert_none=True)
-
-            if isinstance(obj, (list, tuple)):
-                dicts.append(_dict_from_arg_tuple(obj, args, required_args,
-                                                  default_args))
-
-            elif isinstance(obj, dict):
-                ordered_dict = collections.OrderedDict.fromkeys(args)
-                ordered_dict.update(dict(default_args, **obj))
-                dicts.append(_check_dict_keys(ordered_dict, args,
-                                              required_args))
-        return dicts
+        return (_kwargs_from_item(obj, args, required_args, default_args)
+                for obj in parameters)
 
     msg = (
         '"parameters" should either be a dictionary of iterables with keys '
@@ -168,6 +288,18 @@ def _generate_kwarg_list(parameters, args, required_args, default_args):
     raise ParametrizationError(msg.format(type(parameters), parameters))
 
 
+def _generate_kwarg_list(parameters, args, required_args, default_args,
+                         combinatorial=None, combinatorial_seed=0):
+    """
+    Given the 'raw' parameter context, generate the ``list`` of ``kwargs``
+    that will be used for method generation.
+
+    Always returns a list of ``OrderedDict``s regardless of the input type(s).
+    """
+    return list(_iter_kwargs(parameters, args, required_args, default_args,
+                             combinatorial, combinatorial_seed))
+
+
 def _ensure_unique_names(functions):
     """
     If function generation ends up with functions with duplicate names, this
@@ -322,6 +454,20 @@ def default_name_func(func_name, kwargs):
     return template.format(func_name=func_name, **kwargs)
 
 
+def _get_parametrized_args(function):
+    """
+    Return the parametrized, required and default
+    arguments of a testcase method.
+    """
+    argspec = inspect.getargspec(function)
+    args = argspec.args[3:]  # get rid of self, env, result
+    defaults = (argspec.defaults or [])
+
+    required_args = args[:-len(defaults)] if defaults else args
+    default_args = dict(zip(args[len(required_args):], defaults))
+    return args, required_args, default_args
+
+
 def generate_functions(
     function,
     parameters,
@@ -332,6 +478,8 @@ def generate_functions(
     summarize,
     num_passing,
     num_failing,
+    combinatorial=None,
+    combinatorial_seed=0,
 ):
     """
     Generate test cases using the given parameter context, use the name_func
@@ -342,7 +490,9 @@ def generate_functions(
 
     If parameters is of type ``dict`` (of ``tuple``/``list``), then a new
     method will be created for each item in the Cartesian product of all
-    combinations of values.
+    combinations of values. With ``combinatorial``, methods are only created
+    for a subset of the combinations that still covers all combinations of
+    values of any 2 (``'pairwise'``) or ``n`` arguments.
 
     :param function: A testcase method, with extra
                      arguments for parametrization.
@@ -371,6 +521,12 @@ def generate_functions(
     :param num_failing: Max number of failing assertions
                        for testcase level assertion summary.
     :type num_failing: ``int``
+    :param combinatorial: ``'pairwise'`` or the number of arguments whose
+                          value combinations should all be covered.
+    :type combinatorial: ``str`` or ``int``
+    :param combinatorial_seed: Seed for generating the same combinations
+                               for the same parameters.
+    :type combinatorial_seed: ``int``
     :return: List of functions that is testcase compliant
              (accepts ``self``, ``env``, ``result`` as arguments) and have
              unique names.
@@ -381,18 +537,14 @@ def generate_functions(
 
     _check_name_func(name_func)
 
-    argspec = inspect.getargspec(function)
-    args = argspec.args[3:]  # get rid of self, env, result
-    defaults = (argspec.defaults or [])
-
-    required_args = args[:-len(defaults)] if defaults else args
-    default_args = dict(zip(args[len(required_args):], defaults))
+    args, required_args, default_args = _get_parametrized_args(function)
 
     # Need to validate beforehand so we can merge with parametrized_tags
     tags = tagging.validate_tag_value(tags) if tags else {}
 
     kwarg_list = _generate_kwarg_list(parameters, args, required_args,
-                                      default_args)
+                                      default_args, combinatorial,
+                                      combinatorial_seed)
 
     functions = [_generate_func(
         function=function,
@@ -411,3 +563,256 @@ def generate_functions(
     _ensure_unique_names(functions)
 
     return functions
+
+
+class LazyParametrization(object):
+    """
+    Parametrization context of a testcase method that generates testcases
+    on demand, instead of creating a method for each of them upfront.
+
+    Testcases are identified by their position in the parametrization,
+    their ``kwargs`` are computed from it when needed. Iterating over the
+    parametrization generates :py:class:`ParametrizedTestcase` objects for
+    filtering and listing, testcase methods are created only when they run.
+
+    Unlike :py:func:`generate_functions`, generated names are not checked
+    for uniqueness upfront as that requires generating all of them: names
+    generated by ``name_func`` must be unique, invalid names are replaced
+    with index suffixes (e.g. ``"{func_name}__0"``, ``"{func_name}__1"``)
+    in order of generation.
+
+    Arguments are the same as :py:func:`generate_functions`.
+    """
+
+    def __init__(
+        self,
+        function,
+        parameters,
+        name_func,
+        tags,
+        tag_func,
+        docstring_func,
+        summarize,
+        num_passing,
+        num_failing,
+        combinatorial=None,
+        combinatorial_seed=0,
+    ):
+        if not parameters:
+            raise ParametrizationError('"parameters" cannot be a empty.')
+
+        _check_name_func(name_func)
+
+        self.function = function
+        self.name = function.__name__
+        self.name_func = name_func
+        self.tag_func = tag_func
+        self.docstring_func = docstring_func
+        self.tags = tagging.validate_tag_value(tags) if tags else {}
+        self.summarize = summarize
+        self.summarize_num_passing = num_passing
+        self.summarize_num_failing = num_failing
+        self.wrappers = []
+
+        self._args, required_args, default_args = \
+            _get_parametrized_args(function)
+
+        # Validates the parameters without generating any kwargs
+        _iter_kwargs(parameters, self._args, required_args, default_args,
+                     combinatorial)
+
+        self._rows = None
+        if isinstance(parameters, dict):
+            # Combinatorial parametrization, positions are mixed radix
+            # numbers of value indexes with the last argument varying fastest
+            # or rows of value indexes of a covering array.
+            parameters = dict(
+                {k: [v] for k, v in default_args.items()}, **parameters)
+            self._values = [tuple(parameters[arg]) for arg in self._args]
+            self._items = None
+            if combinatorial is not None:
+                self._rows = _covering_array(
+                    sizes=[len(values) for values in self._values],
+                    strength=_get_combinatorial_strength(combinatorial),
+                    seed=combinatorial_seed)
+        else:
+            self._values = None
+            self._items = tuple(parameters)
+        self._required_args = required_args
+        self._default_args = default_args
+        self._generated_tags = None
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.name)
+
+    def __len__(self):
+        if self._items is not None:
+            return len(self._items)
+        if self._rows is not None:
+            return len(self._rows)
+        size = 1
+        for values in self._values:
+            size *= len(values)
+        return size
+
+    def _iter_kwargs(self):
+        if self._items is not None:
+            for obj in self._items:
+                yield _kwargs_from_item(
+                    obj, self._args, self._required_args, self._default_args)
+        elif self._rows is not None:
+            for position in range(len(self._rows)):
+                yield self.get_kwargs(position)
+        else:
+            for vals in itertools.product(*self._values):
+                yield collections.OrderedDict(zip(self._args, vals))
+
+    def get_kwargs(self, position):
+        """Return the ``kwargs`` of the testcase at ``position``."""
+        if self._items is not None:
+            return _kwargs_from_item(
+                self._items[position], self._args,
+                self._required_args, self._default_args)
+
+        if self._rows is not None:
+            return collections.OrderedDict(
+                (arg, values[idx]) for arg, values, idx in
+                zip(self._args, self._values, self._rows[position]))
+
+        vals = []
+        for values in reversed(self._values):
+            position, idx = divmod(position, len(values))
+            vals.append(values[idx])
+        return collections.OrderedDict(zip(self._args, reversed(vals)))
+
+    def __iter__(self):
+        """Generate the testcases of the parametrization, unbound."""
+        return self.iter_testcases()
+
+    def iter_testcases(self, suite=None):
+        """
+        Generate the :py:class:`ParametrizedTestcase` objects of the
+        testcases, bound to ``suite`` if it is given.
+        """
+        fallback_count = 0
+        for position, kwargs in enumerate(self._iter_kwargs()):
+            name = _name_func_wrapper(
+                name_func=self.name_func,
+                func_name=self.name,
+                kwargs=kwargs)
+            if name == self.name:
+                name = '{}__{}'.format(name, fallback_count)
+                fallback_count += 1
+            yield ParametrizedTestcase(self, name, position, suite)
+
+    def get_tags(self, kwargs):
+        """Return the tags of a testcase generated with ``kwargs``."""
+        if self.tag_func is None:
+            return self.tags
+        return tagging.merge_tag_dicts(
+            self.tags, tagging.validate_tag_value(self.tag_func(kwargs)))
+
+    @property
+    def generated_tags(self):
+        """Merged tags of all generated testcases."""
+        if self._generated_tags is None:
+            if self.tag_func is None:
+                self._generated_tags = self.tags
+            else:
+                generated_tags = self.tags
+                for kwargs in self._iter_kwargs():
+                    generated_tags = tagging.merge_tag_dicts(
+                        generated_tags, self.get_tags(kwargs))
+                self._generated_tags = generated_tags
+        return self._generated_tags
+
+    def get_docstring(self, kwargs):
+        """Return the docstring of a testcase generated with ``kwargs``."""
+        if self.docstring_func is None:
+            return None
+        return self.docstring_func(self.function.__doc__, kwargs)
+
+    def make_function(self, name, kwargs):
+        """Create the testcase method of a generated testcase."""
+        func = _generate_func(
+            function=self.function,
+            name_func=self.name_func,
+            tag_func=None,
+            docstring_func=self.docstring_func,
+            tags=self.get_tags(kwargs),
+            kwargs=kwargs)
+        func.__name__ = name
+        func.__testcase__ = True
+        func.summarize = self.summarize
+        func.summarize_num_passing = self.summarize_num_passing
+        func.summarize_num_failing = self.summarize_num_failing
+
+        for wrapper_func in self.wrappers:
+            func = wrapper_func(func)
+        func.wrapper_of = self.function
+        return func
+
+
+class ParametrizedTestcase(object):
+    """
+    Testcase generated by a :py:class:`LazyParametrization`, it stands in
+    for a bound testcase method and creates the method when it is called.
+    """
+
+    __slots__ = ('__name__', '__self__', 'parametrization', 'position')
+    __testcase__ = True
+
+    def __init__(self, parametrization, name, position, suite=None):
+        self.__name__ = name
+        self.__self__ = suite
+        self.parametrization = parametrization
+        self.position = position
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.__name__)
+
+    @property
+    def kwargs(self):
+        return self.parametrization.get_kwargs(self.position)
+
+    @property
+    def im_class(self):
+        return type(self.__self__)
+
+    @property
+    def _parametrization_template(self):
+        return self.parametrization.name
+
+    @property
+    def tags(self):
+        return self.parametrization.get_tags(self.kwargs)
+
+    @property
+    def summarize(self):
+        return self.parametrization.summarize
+
+    @property
+    def summarize_num_passing(self):
+        return self.parametrization.summarize_num_passing
+
+    @property
+    def summarize_num_failing(self):
+        return self.parametrization.summarize_num_failing
+
+    def __call__(self, env, result):
+        func = self.parametrization.make_function(self.__name__, self.kwargs)
+        return func(self.__self__, env, result)
+
+
+# Docstrings are generated on demand, the class docstring
+# is not available as ``ParametrizedTestcase.__doc__``.
+ParametrizedTestcase.__doc__ = property(
+    lambda self: self.parametrization.get_docstring(self.kwargs))
+
+
+def get_generated_tags(function):
+    """Return the merged tags of the testcases generated from ``function``."""
+    lazy_parametrization = getattr(function, 'lazy_parametrization', None)
+    if lazy_parametrization is not None:
+        return lazy_parametrization.generated_tags
+    return function.generated_tags
@@ -456,7 +456,7 @@ class TableNamespace(AssertionNamespace):
         self, actual, expected,
         description=None, category=None,
         include_columns=None, exclude_columns=None,
-        report_all=True, fail_limit=0,
+        report_all=True, fail_limit=0, key_columns=None,
     ):
         """
         Compares two tables, uses equality for each table cell for plain
@@ -466,6 +466,11 @@ class TableNamespace(AssertionNamespace):
         either ``include_columns`` or ``exclude_columns`` arguments
         must be used to have column uniformity.
 
+        Rows are compared by position unless ``key_columns`` are given,
+        in which case rows with the same key values are compared with each
+        other regardless of their order, and the rows that do not have a
+        pair on the other table are reported as missing or extra.
+
         .. code-block:: python
 
             result.table.match(
@@ -494,6 +499,20 @@ class TableNamespace(AssertionNamespace):
                 ]
             )
 
+            result.table.match(
+                actual=[
+                    ['name', 'age'],
+                    ['Susan', 24],
+                    ['Bob', 32],
+                ],
+                expected=[
+                    ['name', 'age'],
+                    ['Bob', 32],
+                    ['David', 24],
+                ],
+                key_columns=['name'],
+            )
+
         :param actual: Tabular data
         :type actual: ``list`` of ``list`` or ``list`` of ``dict``.
         :param expected: Tabular data, which can contain custom comparators.
@@ -517,6 +536,10 @@ class TableNamespace(AssertionNamespace):
                            only failing comparisons if this argument
                            is a positive integer.
         :type fail_limit: ``int``
+        :param key_columns: Columns to pair the rows of the two tables by,
+                            values on these columns must be hashable and
+                            cannot be custom comparators.
+        :type key_columns: ``list`` of ``str``
         :param description: Text description for the assertion.
         :type description: ``str``
         :param category: Custom category that will be used for summarization.
@@ -528,6 +551,7 @@ class TableNamespace(AssertionNamespace):
             table=actual, expected_table=expected,
             include_columns=include_columns, exclude_columns=exclude_columns,
             report_all=report_all, fail_limit=fail_limit,
+            key_columns=key_columns,
             description=description, category=category,
         )
 
@@ -697,11 +721,23 @@ class DictNamespace(AssertionNamespace):
                 }
             )
 
+            # Reuse the same expected dict for many values
+            plan = comparison.MatchPlan(
+                {'foo': 1, 'bar': comparison.Greater(1)},
+                ignore=['baz'],
+                fail_fast=True,
+            )
+            for value in values:
+                result.dict.match(actual=value, expected=plan)
+
         :param actual: Original dictionary.
         :type actual: ``dict``.
         :param expected: Comparison dictionary, can contain custom comparators
-                         (e.g. regex, lambda functions)
-        :type expected: ``dict``
+                         (e.g. regex, lambda functions), or a match plan
+                         compiled from one. Inclusion / exclusion rules of
+                         a match plan cannot be overridden.
+        :type expected: ``dict`` or
+                        ``testplan.common.utils.comparison.MatchPlan``
         :param include_keys: Keys to exclusively consider in the comparison.
         :type include_keys: ``list`` of ``object`` (items must be hashable)
         :param exclude_keys: Keys to ignore in the comparison.
@@ -870,8 +906,10 @@ class FixNamespace(AssertionNamespace):
         :type actual: ``dict``
         :param expected: Expected FIX message, can include compiled
                          regex patterns or callables for
-                         advanced comparison.
-        :type expected: ``dict``
+                         advanced comparison, or a match plan
+                         compiled from one, see ``result.dict.match``.
+        :type expected: ``dict`` or
+                        ``testplan.common.utils.comparison.MatchPlan``
         :param include_tags: Tags to exclusively consider in the comparison.
         :type include_tags: ``list`` of ``object`` (items must be hashable)
         :param exclude_tags: Keys to ignore in the comparison.
@@ -966,6 +1004,150 @@ class FixNamespace(AssertionNamespace):
         )
 
 
+class LatencyNamespace(AssertionNamespace):
+    """
+    Contains logic for assertions on latencies collected by a
+    :py:class:`~testplan.common.utils.latency.LatencyRecorder`.
+    """
+
+    @bind_entry
+    def percentile_less(
+        self, latency, percentile, threshold,
+        description=None, category=None,
+    ):
+        """
+        Checks if the given percentile of the recorded latencies is less than
+        the threshold. Fails if no latencies have been recorded.
+
+        .. code-block:: python
+
+            # 99% of the orders are acknowledged within 500 microseconds
+            result.latency.percentile_less(
+                env.fix_client.latency, percentile=99, threshold=500)
+
+        :param latency: Recorded latencies.
+        :type latency: :py:class:`~testplan.common.utils.latency.LatencyRecorder`
+                       or :py:class:`~testplan.common.utils.latency.LatencyHistogram`
+        :param percentile: Percentile between 0 and 100.
+        :type percentile: ``int`` or ``float``
+        :param threshold: Exclusive upper bound for the percentile, in
+                          the unit of the recorded values (microseconds).
+        :type threshold: ``int`` or ``float``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.LatencyPercentileLess(
+            histogram=getattr(latency, 'histogram', latency),
+            percentile=percentile, threshold=threshold,
+            description=description, category=category,
+        )
+
+    @bind_entry
+    def log(
+        self, latency, percentiles=(50, 90, 99, 99.9, 100), description=None,
+    ):
+        """
+        Logs a table of latency percentiles to the report.
+
+        :param latency: Recorded latencies.
+        :type latency: :py:class:`~testplan.common.utils.latency.LatencyRecorder`
+                       or :py:class:`~testplan.common.utils.latency.LatencyHistogram`
+        :param percentiles: Percentiles to log.
+        :type percentiles: ``iterable`` of ``int`` or ``float``
+        :param description: Text description for the entry.
+        :type description: ``str``
+        :return: Always returns True, this is not an assertion so it cannot
+                 fail.
+        :rtype: ``bool``
+        """
+        histogram = getattr(latency, 'histogram', latency)
+        table = [['Percentile', 'Latency']]
+        table.extend(
+            [str(percentile), value]
+            for percentile, value in histogram.percentiles(percentiles))
+        table.append(['Mean', histogram.mean])
+        table.append(['Count', histogram.count])
+        return base.TableLog(
+            table=table, description=description or 'Latency')
+
+
+class LogfileNamespace(AssertionNamespace):
+    """
+    Contains logic for assertions on text written to log files, waiting
+    with a :py:class:`~testplan.common.utils.match.LogMatcher`.
+    """
+
+    @bind_entry
+    def match(
+        self, log_matcher, regexp, timeout=5,
+        description=None, category=None,
+    ):
+        """
+        Waits until text matching the ``regexp`` is written to the log file
+        after the position of the ``log_matcher``, which is then moved to the
+        end of the match. Fails if there is no match within ``timeout``.
+
+        .. code-block:: python
+
+            env.server.log_matcher.seek_eof()
+            env.client.send(b'order')
+            result.logfile.match(
+                env.server.log_matcher, r'.*Order accepted', timeout=2)
+
+        :param log_matcher: Log matcher of the file.
+        :type log_matcher: :py:class:`~testplan.common.utils.match.LogMatcher`
+        :param regexp: String pattern or compiled regexp object.
+        :type regexp: ``str`` or compiled regex
+        :param timeout: Seconds to wait for a match.
+        :type timeout: ``int`` or ``float``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.LogfileMatch(
+            log_matcher=log_matcher, regexp=regexp, timeout=timeout,
+            description=description, category=category)
+
+    @bind_entry
+    def not_match(
+        self, log_matcher, regexp, timeout=5,
+        description=None, category=None,
+    ):
+        """
+        Waits for ``timeout`` and checks that no text matching the
+        ``regexp`` is written to the log file after the position of the
+        ``log_matcher``.
+
+        .. code-block:: python
+
+            result.logfile.not_match(
+                env.server.log_matcher, r'.*ERROR', timeout=1)
+
+        :param log_matcher: Log matcher of the file.
+        :type log_matcher: :py:class:`~testplan.common.utils.match.LogMatcher`
+        :param regexp: String pattern or compiled regexp object.
+        :type regexp: ``str`` or compiled regex
+        :param timeout: Seconds to wait for a match.
+        :type timeout: ``int`` or ``float``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.LogfileNotMatch(
+            log_matcher=log_matcher, regexp=regexp, timeout=timeout,
+            description=description, category=category)
+
+
 class Result(object):
     """
     Contains assertion methods and namespaces for generating test data.
@@ -979,6 +1161,8 @@ class Result(object):
         'xml': XMLNamespace,
         'dict': DictNamespace,
         'fix': FixNamespace,
+        'latency': LatencyNamespace,
+        'logfile': LogfileNamespace,
     }
 
     def __init__(
@@ -61,6 +61,12 @@ def set_testsuite_testcases(suite):
     """
     testcases = []
     for testcase_name in suite.__class__.__testcases__:
+        if isinstance(testcase_name, parametrization.LazyParametrization):
+            skip_funcs = suite.__skip__[testcase_name.name]
+            if not any(skip_func(suite) for skip_func in skip_funcs):
+                testcases.append(testcase_name)
+            continue
+
         testcase_method = getattr(suite, testcase_name)
 
         if not testcase_method:
@@ -112,9 +118,28 @@ def get_testsuite_testcase_methods(testsuite_kls):
     if not hasattr(testsuite_kls, '__testcases__'):
         raise AttributeError('Testsuite does not have any testcases set yet.')
 
-    return OrderedDict([(testcase_name, getattr(testsuite_kls, testcase_name))
-                        for testcase_name in testsuite_kls.__testcases__
-                        if callable(getattr(testsuite_kls, testcase_name))])
+    testcase_methods = OrderedDict()
+    for testcase_name in testsuite_kls.__testcases__:
+        if isinstance(testcase_name, parametrization.LazyParametrization):
+            for testcase_method in testcase_name.iter_testcases():
+                testcase_methods[testcase_method.__name__] = testcase_method
+        elif callable(getattr(testsuite_kls, testcase_name)):
+            testcase_methods[testcase_name] = getattr(
+                testsuite_kls, testcase_name)
+    return testcase_methods
+
+
+def iter_testsuite_testcases(suite):
+    """
+    Generate bound method objects from a test suite instance, testcases of
+    lazy parametrization are generated as they are iterated over.
+    """
+    for testcase_name in suite.__testcases__:
+        if isinstance(testcase_name, parametrization.LazyParametrization):
+            for testcase in testcase_name.iter_testcases(suite):
+                yield testcase
+        else:
+            yield getattr(suite, testcase_name)
 
 
 def get_testsuite_testcases(suite):
@@ -126,8 +151,17 @@ def get_testsuite_testcases(suite):
     as ``__testcases__`` per instance can change after filtering / shuffling
     logic is applied.
     """
-    return OrderedDict((testcase_name, getattr(suite, testcase_name))
-                       for testcase_name in suite.__testcases__)
+    testcases = OrderedDict()
+    for testcase_name in suite.__testcases__:
+        if isinstance(testcase_name, parametrization.LazyParametrization):
+            for testcase in testcase_name.iter_testcases(suite):
+                if testcase.__name__ in testcases:
+                    raise ValueError('Duplicate definition of {}.{}'.format(
+                        suite.__class__.__name__, testcase.__name__))
+                testcases[testcase.__name__] = testcase
+        else:
+            testcases[testcase_name] = getattr(suite, testcase_name)
+    return testcases
 
 
 def _selective_call(decorator_func, meta_func, wrapper_func):
@@ -189,24 +223,35 @@ def _testsuite(klass):
     # to preserve the order of definition of the testcases and make sure
     # they get executed in the same order
 
-    # pylint: disable=global-statement
-    global __GENERATED_TESTCASES__
-    global __TESTCASES__
-    global __SKIP__
     klass.__testcases__ = __TESTCASES__
     klass.__skip__ = __SKIP__
 
     # Dynamically add a method for getting unbound & bound testcase methods
     klass.get_testcase_methods = get_testsuite_testcase_methods
     klass.get_testcases = get_testsuite_testcases
+    klass.iter_testcases = iter_testsuite_testcases
 
     for func in __GENERATED_TESTCASES__:
         setattr(klass, func.__name__, func)
 
+    reset_testcase_registrations()
+    return klass
+
+
+def reset_testcase_registrations():
+    """
+    Discard the testcases registered since the last suite was defined.
+    They are left over when a suite class body raises before
+    :py:func:`@testsuite <testsuite>` is applied, and would otherwise be
+    added to the next suite defined.
+    """
+    # pylint: disable=global-statement
+    global __GENERATED_TESTCASES__
+    global __TESTCASES__
+    global __SKIP__
     __GENERATED_TESTCASES__ = []
     __TESTCASES__ = []
     __SKIP__ = defaultdict(tuple)
-    return klass
 
 
 def _testsuite_meta(tags=None):
@@ -288,6 +333,9 @@ def _testcase_meta(
     summarize=False,
     num_passing=defaults.SUMMARY_NUM_PASSING,
     num_failing=defaults.SUMMARY_NUM_FAILING,
+    combinatorial=None,
+    combinatorial_seed=0,
+    lazy=False,
 ):
     """
     Wrapper function that allows us to call :py:func:`@testcase <testcase>`
@@ -300,7 +348,31 @@ def _testcase_meta(
         if tags:
             tagging.attach_testcase_tags(function, tags)
 
-        if parameters is not None:  # Empty tuple / dict checks happen later
+        if parameters is not None and lazy:
+            lazy_parametrization = parametrization.LazyParametrization(
+                function=function,
+                parameters=parameters,
+                name_func=name_func,
+                docstring_func=docstring_func,
+                tag_func=tag_func,
+                tags=tags,
+                summarize=summarize,
+                num_passing=num_passing,
+                num_failing=num_failing,
+                combinatorial=combinatorial,
+                combinatorial_seed=combinatorial_seed
+            )
+            wrappers = custom_wrappers or []
+            if not isinstance(wrappers, (list, tuple)):
+                wrappers = [wrappers]
+            lazy_parametrization.wrappers.extend(wrappers)
+
+            # Testcases are generated when the suite is filtered or run
+            function.lazy_parametrization = lazy_parametrization
+            __TESTCASES__.append(lazy_parametrization)
+            return function
+
+        elif parameters is not None:  # Empty tuple / dict checks happen later
 
             functions = parametrization.generate_functions(
                 function=function,
@@ -311,7 +383,9 @@ def _testcase_meta(
                 tags=tags,
                 summarize=summarize,
                 num_passing=defaults.SUMMARY_NUM_PASSING,
-                num_failing=defaults.SUMMARY_NUM_FAILING
+                num_failing=defaults.SUMMARY_NUM_FAILING,
+                combinatorial=combinatorial,
+                combinatorial_seed=combinatorial_seed
             )
 
             # Register generated functions as test_cases
@@ -381,6 +455,11 @@ def testcase(*args, **kwargs):
         def test_method_1(self):
           ...
 
+    Parametrized testcases are generated when the testcase is decorated,
+    with `@testcase(parameters=..., lazy=True)` their names and tags are
+    generated when the suite is filtered instead, and testcase methods only
+    for the testcases that are run. Generated testcases of lazy
+    parametrization are not set as attributes of the suite class.
     """
     return _selective_call(
         decorator_func=_testcase,
@@ -510,12 +589,30 @@ def skip_if_testcase(*predicates):
     """
     def _skip_if_testcase_inner(klass):
         _validate_skip_if_predicates(predicates)
-        for testcase_method in klass.get_testcase_methods().values():
-            klass.__skip__[testcase_method.__name__] += predicates
+        for testcase_name in klass.__testcases__:
+            if isinstance(testcase_name, parametrization.LazyParametrization):
+                klass.__skip__[testcase_name.name] += predicates
+            elif callable(getattr(klass, testcase_name)):
+                klass.__skip__[testcase_name] += predicates
         return klass
     return _skip_if_testcase_inner
 
 
+def _wrap_testcases(klass, wrapper_func):
+    """
+    Replace the testcase methods of a testsuite class with
+    ``wrapper_func(testcase_method)``.
+    """
+    for testcase_name in klass.__testcases__:
+        if isinstance(testcase_name, parametrization.LazyParametrization):
+            testcase_name.wrappers.append(wrapper_func)
+        else:
+            testcase_method = getattr(klass, testcase_name)
+            if callable(testcase_method):
+                setattr(klass, testcase_method.__name__,
+                        wrapper_func(testcase_method))
+
+
 def pre_testcase(*functions):
     """
     Prepend callable(s) to trigger before every testcase in a testsuite
@@ -529,9 +626,9 @@ def pre_testcase(*functions):
         """
         Inner part of class decorator
         """
-        for testcase_method in klass.get_testcase_methods().values():
-            twp = _gen_testcase_with_pre(testcase_method, functions)
-            setattr(klass, testcase_method.__name__, twp)
+        _wrap_testcases(
+            klass, functools.partial(_gen_testcase_with_pre,
+                                     preludes=functions))
         return klass
 
     return pre_testcase_inner
@@ -550,9 +647,9 @@ def post_testcase(*functions):
         """
         Inner part of class decorator
         """
-        for testcase_method in klass.get_testcase_methods().values():
-            twp = _gen_testcase_with_post(testcase_method, functions)
-            setattr(klass, testcase_method.__name__, twp)
+        _wrap_testcases(
+            klass, functools.partial(_gen_testcase_with_post,
+                                     epilogues=functions))
         return klass
 
     return post_testcase_inner
@@ -9,7 +9,6 @@ import random
 from enum import Enum
 
 from testplan.common.utils.convert import make_tuple
-from testplan.testing.multitest.suite import get_testsuite_name
 
 
 class SortType(Enum):
@@ -157,6 +156,8 @@ class AlphanumericSorter(TypedSorter):
         return sorted(instances, key=operator.attrgetter('name'))
 
     def sort_testsuites(self, testsuites):
+        # Imported here as the multitest package imports this module
+        from testplan.testing.multitest.suite import get_testsuite_name
         return sorted(testsuites, key=get_testsuite_name)
 
     def sort_testcases(self, testcases):